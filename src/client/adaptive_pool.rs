@@ -411,9 +411,7 @@ impl AdaptiveConnectionPool {
                 }
 
                 let conns = connections.read().await.clone();
-                for conn in conns {
-                    Self::check_connection_health(&conn).await;
-                }
+                futures::future::join_all(conns.iter().map(Self::check_connection_health)).await;
             }
         });
     }
@@ -0,0 +1,616 @@
+//! Precomputed device indexes derived from the structure file
+//!
+//! Tools used to walk every control in the structure on each call to pick out
+//! climate, weather, security, energy or audio devices. Those selections only
+//! change when the structure is reloaded, so they are materialized once in
+//! [`ClientContext::update_structure`](super::ClientContext::update_structure)
+//! and read back as plain UUID lists.
+//!
+//! Keyword checks that used to run several `contains` scans over a freshly
+//! lowercased name are compiled into single case-insensitive regexes, and the
+//! category classification is a keyword table scanned in priority order.
+//!
+//! Control names are also split into lowercased words and kept as an inverted
+//! index, so name lookups can start from the few controls sharing a word with
+//! the query instead of lowercasing every name in the structure. Room names
+//! are stored pre-folded (lowercase, umlauts spelled out) for the same reason,
+//! and controls are bucketed by room UUID so room-scoped tools only look at
+//! the controls of that room, and by control type so type filters only look
+//! at controls of the requested types.
+
+use regex::Regex;
+use std::collections::HashMap;
+use std::sync::OnceLock;
+
+/// Door/window sensor names (English and German)
+static DOOR_WINDOW_NAME_REGEX: OnceLock<Regex> = OnceLock::new();
+/// Weather sensor names recorded by the weather storage
+static WEATHER_NAME_REGEX: OnceLock<Regex> = OnceLock::new();
+/// Device types reported as climate sensors by the statistics collector
+static CLIMATE_SENSOR_TYPE_REGEX: OnceLock<Regex> = OnceLock::new();
+/// Device types the statistics collector tracks on/off cycles for
+static CONTROLLABLE_TYPE_REGEX: OnceLock<Regex> = OnceLock::new();
+
+/// Room controller types targeted by the climate tools
+pub const CLIMATE_TYPES: &[&str] = &["IRoomController", "Intelligent Room Controller"];
+
+/// Scene controller types whose moods the scene tools list and activate
+pub const SCENE_TYPES: &[&str] = &["LightController", "MoodSwitch"];
+
+/// Type keywords mapped to device categories, in priority order
+///
+/// The first keyword contained in the lowercased device type decides the
+/// category, so e.g. `LightSensor` is classified as `lights`.
+const CATEGORY_KEYWORDS: &[(&str, &str)] = &[
+    ("light", "lights"),
+    ("dimmer", "lights"),
+    ("jalousie", "blinds"),
+    ("blind", "blinds"),
+    ("climate", "climate"),
+    ("heating", "climate"),
+    ("temperature", "climate"),
+    ("sensor", "sensors"),
+    ("analog", "sensors"),
+    ("weather", "weather"),
+    ("security", "security"),
+    ("alarm", "security"),
+    ("energy", "energy"),
+    ("meter", "energy"),
+    ("audio", "audio"),
+    ("music", "audio"),
+];
+
+/// Device UUIDs grouped by the role the MCP tools select them for
+#[derive(Debug, Clone, Default)]
+pub struct DeviceIndex {
+    /// Room controllers (`IRoomController`, `Intelligent Room Controller`)
+    pub climate: Vec<String>,
+    /// Weather stations and weather services
+    pub weather: Vec<String>,
+    /// Alarm, access and lock controls
+    pub security: Vec<String>,
+    /// Meters and energy managers
+    pub energy: Vec<String>,
+    /// Audio zones and media controllers
+    pub audio: Vec<String>,
+    /// Switches, dimmers, light controllers and color pickers
+    pub lights: Vec<String>,
+    /// Jalousies, blinds and rolladen
+    pub blinds: Vec<String>,
+    /// Analog, digital, presence, smoke and meter sensors
+    pub sensors: Vec<String>,
+    /// Digital inputs named as door or window contacts
+    pub door_window: Vec<String>,
+    /// Presence and motion detectors
+    pub motion: Vec<String>,
+    /// Lowercased name words mapped to the controls whose name contains them
+    pub name_tokens: HashMap<String, Vec<String>>,
+    /// Lowercased name of every control, by UUID
+    pub lower_names: HashMap<String, String>,
+    /// Room UUIDs with their names folded by [`fold_name`], shortest first
+    pub rooms: Vec<(String, String)>,
+    /// Folded room names mapped to the UUID of the first room with that name
+    pub room_names: HashMap<String, String>,
+    /// Room UUIDs mapped to the controls assigned to them
+    pub by_room: HashMap<String, Vec<String>>,
+    /// Room UUIDs mapped to the lights assigned to them
+    pub lights_by_room: HashMap<String, Vec<String>>,
+    /// Control types mapped to the controls of that type
+    pub by_type: HashMap<String, Vec<String>>,
+}
+
+impl DeviceIndex {
+    /// Create an empty index
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Record a control in every role list its type (and name) belongs to
+    pub fn insert(&mut self, uuid: &str, control_type: &str, name: &str) {
+        self.by_type
+            .entry(control_type.to_string())
+            .or_default()
+            .push(uuid.to_string());
+        if is_climate_type(control_type) {
+            self.climate.push(uuid.to_string());
+        }
+        if is_weather_type(control_type) {
+            self.weather.push(uuid.to_string());
+        }
+        if is_security_type(control_type) {
+            self.security.push(uuid.to_string());
+        }
+        if is_energy_type(control_type) {
+            self.energy.push(uuid.to_string());
+        }
+        if is_audio_type(control_type) {
+            self.audio.push(uuid.to_string());
+        }
+        if is_light_type(control_type) {
+            self.lights.push(uuid.to_string());
+        }
+        if is_blind_type(control_type) {
+            self.blinds.push(uuid.to_string());
+        }
+        if is_sensor_type(control_type) {
+            self.sensors.push(uuid.to_string());
+        }
+        if control_type == "InfoOnlyDigital" && is_door_window_name(name) {
+            self.door_window.push(uuid.to_string());
+        }
+        if is_motion_type(control_type) {
+            self.motion.push(uuid.to_string());
+        }
+    }
+
+    /// Record a control's lowercased name and its words in the name index
+    pub fn insert_name(&mut self, uuid: &str, name: &str) {
+        let lower = name.to_lowercase();
+        for token in lower.split_whitespace() {
+            let uuids = self.name_tokens.entry(token.to_string()).or_default();
+            if uuids.last().map(String::as_str) != Some(uuid) {
+                uuids.push(uuid.to_string());
+            }
+        }
+        self.lower_names.insert(uuid.to_string(), lower);
+    }
+
+    /// Lowercased name of a control
+    pub fn lower_name(&self, uuid: &str) -> Option<&str> {
+        self.lower_names.get(uuid).map(String::as_str)
+    }
+
+    /// Record a room under its folded name
+    ///
+    /// Rooms are kept ordered by folded name length, so a lookup stops at
+    /// the closest match: "Büro" is found before "OG Büro".
+    pub fn insert_room(&mut self, uuid: &str, name: &str) {
+        let folded = fold_name(name);
+        self.room_names
+            .entry(folded.clone())
+            .or_insert_with(|| uuid.to_string());
+        let position = self
+            .rooms
+            .partition_point(|(_, existing)| existing.len() <= folded.len());
+        self.rooms.insert(position, (uuid.to_string(), folded));
+    }
+
+    /// Record a control as belonging to a room
+    pub fn insert_in_room(&mut self, room_uuid: &str, uuid: &str, control_type: &str) {
+        self.by_room
+            .entry(room_uuid.to_string())
+            .or_default()
+            .push(uuid.to_string());
+        if is_light_type(control_type) {
+            self.lights_by_room
+                .entry(room_uuid.to_string())
+                .or_default()
+                .push(uuid.to_string());
+        }
+    }
+
+    /// Controls assigned to a room, empty for unknown rooms
+    pub fn room_controls(&self, room_uuid: &str) -> &[String] {
+        self.by_room.get(room_uuid).map_or(&[], Vec::as_slice)
+    }
+
+    /// Lights assigned to a room, empty for unknown rooms
+    pub fn room_lights(&self, room_uuid: &str) -> &[String] {
+        self.lights_by_room
+            .get(room_uuid)
+            .map_or(&[], Vec::as_slice)
+    }
+
+    /// Controls of exactly the given type, empty for unknown types
+    pub fn of_type(&self, control_type: &str) -> &[String] {
+        self.by_type.get(control_type).map_or(&[], Vec::as_slice)
+    }
+
+    /// Controls of any of the given types, grouped by type in argument order
+    pub fn of_types<'a>(&'a self, types: &'a [&str]) -> impl Iterator<Item = &'a String> {
+        types
+            .iter()
+            .flat_map(|control_type| self.of_type(control_type))
+    }
+
+    /// Controls whose type satisfies a predicate
+    ///
+    /// The predicate runs once per distinct type rather than once per control.
+    pub fn matching_types<'a>(
+        &'a self,
+        predicate: impl Fn(&str) -> bool + 'a,
+    ) -> impl Iterator<Item = &'a String> {
+        self.by_type
+            .iter()
+            .filter(move |(control_type, _)| predicate(control_type))
+            .flat_map(|(_, uuids)| uuids)
+    }
+
+    /// UUID of the shortest room name containing the folded query
+    ///
+    /// A query naming a room exactly is answered from [`Self::room_names`];
+    /// no other room name can be both as short and contain it.
+    pub fn find_room(&self, query: &str) -> Option<&str> {
+        let query = fold_name(query);
+        if let Some(uuid) = self.room_names.get(&query) {
+            return Some(uuid);
+        }
+        self.rooms
+            .iter()
+            .find(|(_, name)| name.contains(&query))
+            .map(|(uuid, _)| uuid.as_str())
+    }
+
+    /// Release the spare capacity left over from building the index
+    ///
+    /// The index lives until the next structure reload, so the slack of
+    /// every grown list would otherwise be held for the whole session.
+    pub fn shrink_to_fit(&mut self) {
+        for uuids in [
+            &mut self.climate,
+            &mut self.weather,
+            &mut self.security,
+            &mut self.energy,
+            &mut self.audio,
+            &mut self.lights,
+            &mut self.blinds,
+            &mut self.sensors,
+            &mut self.door_window,
+            &mut self.motion,
+        ] {
+            uuids.shrink_to_fit();
+        }
+        for uuids in self
+            .name_tokens
+            .values_mut()
+            .chain(self.by_room.values_mut())
+            .chain(self.lights_by_room.values_mut())
+            .chain(self.by_type.values_mut())
+        {
+            uuids.shrink_to_fit();
+        }
+        self.name_tokens.shrink_to_fit();
+        self.lower_names.shrink_to_fit();
+        self.by_room.shrink_to_fit();
+        self.lights_by_room.shrink_to_fit();
+        self.by_type.shrink_to_fit();
+        self.rooms.shrink_to_fit();
+        self.room_names.shrink_to_fit();
+    }
+
+    /// Controls whose name contains every word of a lowercased query
+    ///
+    /// Returns the shortest posting list among the query words, or `None`
+    /// if some word is not indexed. The index only knows whole words, so
+    /// callers still confirm the phrase and fall back to a substring scan
+    /// for partial words.
+    pub fn name_candidates(&self, query: &str) -> Option<&[String]> {
+        query
+            .split_whitespace()
+            .map(|token| self.name_tokens.get(token))
+            .collect::<Option<Vec<_>>>()?
+            .into_iter()
+            .min_by_key(|uuids| uuids.len())
+            .map(Vec::as_slice)
+    }
+
+    /// UUID of a control whose lowercased name equals `lower`
+    ///
+    /// Such a control carries every word of the name, so only the shortest
+    /// posting list of [`Self::name_candidates`] is compared.
+    pub fn find_by_name(&self, lower: &str) -> Option<&str> {
+        self.name_candidates(lower)?
+            .iter()
+            .find(|uuid| self.lower_name(uuid) == Some(lower))
+            .map(String::as_str)
+    }
+}
+
+/// Category (`lights`, `blinds`, `climate`, ...) of a device type, or `other`
+pub fn category_for_type(device_type: &str) -> &'static str {
+    let device_type = device_type.to_lowercase();
+    CATEGORY_KEYWORDS
+        .iter()
+        .find(|(keyword, _)| device_type.contains(keyword))
+        .map_or("other", |(_, category)| category)
+}
+
+/// Lowercase a name and spell out German umlauts, so "Küche" and "Kueche"
+/// compare equal
+pub fn fold_name(name: &str) -> String {
+    // Plain ASCII names have no umlauts to spell out
+    if name.is_ascii() {
+        return name.to_ascii_lowercase();
+    }
+    let mut folded = String::with_capacity(name.len());
+    for c in name.chars().flat_map(char::to_lowercase) {
+        match c {
+            'ä' => folded.push_str("ae"),
+            'ö' => folded.push_str("oe"),
+            'ü' => folded.push_str("ue"),
+            'ß' => folded.push_str("ss"),
+            _ => folded.push(c),
+        }
+    }
+    folded
+}
+
+/// Room controller types handled by the climate tools
+pub fn is_climate_type(control_type: &str) -> bool {
+    CLIMATE_TYPES.contains(&control_type)
+}
+
+/// Weather station and weather service types
+pub fn is_weather_type(control_type: &str) -> bool {
+    control_type.contains("Weather")
+}
+
+/// Alarm, access control and lock types
+pub fn is_security_type(control_type: &str) -> bool {
+    matches!(
+        control_type,
+        "Alarm" | "SmokeAlarm" | "Gate" | "DoorLock" | "AccessControl"
+    ) || control_type.contains("Security")
+}
+
+/// Meter and energy management types
+pub fn is_energy_type(control_type: &str) -> bool {
+    matches!(control_type, "Meter" | "EnergyManager" | "EnergyMonitor")
+        || control_type.contains("Energy")
+}
+
+/// Audio zone and media controller types
+pub fn is_audio_type(control_type: &str) -> bool {
+    control_type.contains("Audio") || control_type == "MediaController"
+}
+
+/// Light types switched by the lighting tools
+pub fn is_light_type(control_type: &str) -> bool {
+    matches!(
+        control_type,
+        "Switch" | "Dimmer" | "LightController" | "ColorPicker"
+    )
+}
+
+/// Blind and shutter types
+pub fn is_blind_type(control_type: &str) -> bool {
+    matches!(control_type, "Jalousie" | "Blinds" | "Rolladen")
+}
+
+/// Sensor types read by the sensor tools
+pub fn is_sensor_type(control_type: &str) -> bool {
+    matches!(
+        control_type,
+        "InfoOnlyAnalog"
+            | "InfoOnlyDigital"
+            | "PresenceDetector"
+            | "MotionSensor"
+            | "SmokeAlarm"
+            | "Meter"
+            | "Sensor"
+    )
+}
+
+/// Presence and motion detector types
+pub fn is_motion_type(control_type: &str) -> bool {
+    matches!(control_type, "PresenceDetector" | "MotionSensor")
+}
+
+/// Whether a device name refers to a door or window contact
+pub fn is_door_window_name(name: &str) -> bool {
+    DOOR_WINDOW_NAME_REGEX
+        .get_or_init(|| Regex::new(r"(?i)door|window|tür|fenster").expect("Invalid door regex"))
+        .is_match(name)
+}
+
+/// Whether a device name refers to a weather reading
+pub fn is_weather_name(name: &str) -> bool {
+    WEATHER_NAME_REGEX
+        .get_or_init(|| {
+            Regex::new(r"(?i)weather|temp|humidity|wind|rain|pressure")
+                .expect("Invalid weather regex")
+        })
+        .is_match(name)
+}
+
+/// Whether a device type carries temperature, humidity or climate readings
+pub fn is_climate_sensor_type(device_type: &str) -> bool {
+    CLIMATE_SENSOR_TYPE_REGEX
+        .get_or_init(|| {
+            Regex::new(r"(?i)temperature|humidity|climate").expect("Invalid climate regex")
+        })
+        .is_match(device_type)
+}
+
+/// Whether a device type is a switchable light or blind
+pub fn is_controllable_type(device_type: &str) -> bool {
+    CONTROLLABLE_TYPE_REGEX
+        .get_or_init(|| {
+            Regex::new(r"(?i)light|switch|dimmer|jalousie|blind")
+                .expect("Invalid controllable regex")
+        })
+        .is_match(device_type)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_insert_groups_by_role() {
+        let mut index = DeviceIndex::new();
+        index.insert("climate-1", "IRoomController", "Living Room");
+        index.insert("weather-1", "WeatherStation", "Weather");
+        index.insert("alarm-1", "Alarm", "Alarm");
+        index.insert("meter-1", "Meter", "Grid Meter");
+        index.insert("audio-1", "AudioZoneV2", "Kitchen Audio");
+        index.insert("light-1", "LightController", "Kitchen Light");
+        index.insert("blind-1", "Jalousie", "Kitchen Blind");
+
+        assert_eq!(index.climate, vec!["climate-1"]);
+        assert_eq!(index.weather, vec!["weather-1"]);
+        assert_eq!(index.security, vec!["alarm-1"]);
+        assert_eq!(index.energy, vec!["meter-1"]);
+        assert_eq!(index.audio, vec!["audio-1"]);
+        assert_eq!(index.sensors, vec!["meter-1"]);
+        assert_eq!(index.lights, vec!["light-1"]);
+        assert_eq!(index.blinds, vec!["blind-1"]);
+    }
+
+    #[test]
+    fn test_sensor_roles() {
+        let mut index = DeviceIndex::new();
+        index.insert("door-1", "InfoOnlyDigital", "Haustür");
+        index.insert("window-1", "InfoOnlyDigital", "Fenster Bad");
+        index.insert("switch-1", "InfoOnlyDigital", "Garden Switch");
+        index.insert("motion-1", "PresenceDetector", "Hall Presence");
+
+        assert_eq!(
+            index.sensors,
+            vec!["door-1", "window-1", "switch-1", "motion-1"]
+        );
+        assert_eq!(index.door_window, vec!["door-1", "window-1"]);
+        assert_eq!(index.motion, vec!["motion-1"]);
+    }
+
+    #[test]
+    fn test_control_in_multiple_roles() {
+        let mut index = DeviceIndex::new();
+        index.insert("sec-energy", "SecurityEnergyBridge", "Bridge");
+
+        assert_eq!(index.security, vec!["sec-energy"]);
+        assert_eq!(index.energy, vec!["sec-energy"]);
+        assert!(index.climate.is_empty());
+    }
+
+    #[test]
+    fn test_name_candidates() {
+        let mut index = DeviceIndex::new();
+        index.insert_name("kitchen-light", "Kitchen Light");
+        index.insert_name("kitchen-blind", "Kitchen Blind");
+        index.insert_name("hall-light", "Hall Light Light");
+
+        assert_eq!(
+            index.name_candidates("blind"),
+            Some(&["kitchen-blind".to_string()][..])
+        );
+        let candidates = index.name_candidates("kitchen light").unwrap();
+        assert!(candidates.contains(&"kitchen-light".to_string()));
+        assert_eq!(index.name_candidates("light").map(<[_]>::len), Some(2));
+        assert_eq!(index.name_candidates("kitch"), None);
+        assert_eq!(index.name_candidates(""), None);
+        assert_eq!(index.lower_name("kitchen-blind"), Some("kitchen blind"));
+        assert_eq!(index.lower_name("missing"), None);
+
+        assert_eq!(index.find_by_name("kitchen light"), Some("kitchen-light"));
+        assert_eq!(index.find_by_name("kitchen"), None);
+        assert_eq!(index.find_by_name("kitch"), None);
+    }
+
+    #[test]
+    fn test_find_room_folds_umlauts() {
+        let mut index = DeviceIndex::new();
+        index.insert_room("room-kitchen", "Küche");
+        index.insert_room("room-bath", "Badezimmer Groß");
+
+        assert_eq!(fold_name("Straße Öl"), "strasse oel");
+        assert_eq!(fold_name("Living Room"), "living room");
+        assert_eq!(index.find_room("kueche"), Some("room-kitchen"));
+        assert_eq!(index.find_room("KÜCHE"), Some("room-kitchen"));
+        assert_eq!(index.find_room("gross"), Some("room-bath"));
+        assert_eq!(index.find_room("Garage"), None);
+    }
+
+    #[test]
+    fn test_find_room_prefers_closest_name() {
+        let mut index = DeviceIndex::new();
+        index.insert_room("room-og-office", "OG Büro");
+        index.insert_room("room-office", "Büro");
+        index.insert_room("room-eg-office", "EG Büro Nord");
+        index.insert_room("room-office-2", "Buero");
+
+        assert_eq!(index.find_room("büro"), Some("room-office"));
+        assert_eq!(index.find_room("BUERO"), Some("room-office"));
+        assert_eq!(index.find_room("og buero"), Some("room-og-office"));
+        assert_eq!(index.find_room("nord"), Some("room-eg-office"));
+    }
+
+    #[test]
+    fn test_shrink_to_fit_keeps_entries() {
+        let mut index = DeviceIndex::new();
+        for i in 0..5 {
+            index.insert(&format!("sensor-{i}"), "InfoOnlyAnalog", "Sensor");
+            index.insert_name(&format!("sensor-{i}"), "Outdoor Sensor");
+        }
+        index.shrink_to_fit();
+
+        assert_eq!(index.sensors.len(), 5);
+        assert_eq!(index.sensors.capacity(), 5);
+        assert_eq!(index.name_tokens["outdoor"].capacity(), 5);
+    }
+
+    #[test]
+    fn test_room_controls() {
+        let mut index = DeviceIndex::new();
+        index.insert_in_room("room-kitchen", "light-1", "Dimmer");
+        index.insert_in_room("room-kitchen", "blind-1", "Jalousie");
+        index.insert_in_room("room-bath", "light-2", "Switch");
+
+        assert_eq!(index.room_controls("room-kitchen"), ["light-1", "blind-1"]);
+        assert_eq!(index.room_controls("room-bath"), ["light-2"]);
+        assert!(index.room_controls("room-garage").is_empty());
+        assert_eq!(index.room_lights("room-kitchen"), ["light-1"]);
+        assert!(index.room_lights("room-garage").is_empty());
+    }
+
+    #[test]
+    fn test_controls_by_type() {
+        let mut index = DeviceIndex::new();
+        index.insert("alarm-1", "Alarm", "Alarm");
+        index.insert("scene-1", "LightController", "Kitchen");
+        index.insert("scene-2", "MoodSwitch", "Living");
+        index.insert("scene-3", "LightController", "Bath");
+
+        assert_eq!(index.of_type("LightController"), ["scene-1", "scene-3"]);
+        assert!(index.of_type("Camera").is_empty());
+        let scenes: Vec<_> = index.of_types(&["MoodSwitch", "LightController"]).collect();
+        assert_eq!(scenes, ["scene-2", "scene-1", "scene-3"]);
+        let alarms: Vec<_> = index.matching_types(|t| t.contains("Alarm")).collect();
+        assert_eq!(alarms, ["alarm-1"]);
+    }
+
+    #[test]
+    fn test_keyword_matchers_ignore_case() {
+        assert!(is_door_window_name("Fenster Küche"));
+        assert!(is_door_window_name("Haustür"));
+        assert!(is_door_window_name("HAUSTÜR"));
+        assert!(is_door_window_name("Front Door"));
+        assert!(!is_door_window_name("Kitchen Light"));
+
+        assert!(is_weather_name("Outdoor Temperature"));
+        assert!(is_weather_name("WIND SPEED"));
+        assert!(!is_weather_name("Kitchen Light"));
+
+        assert!(is_climate_sensor_type("TemperatureSensor"));
+        assert!(is_climate_sensor_type("HUMIDITY"));
+        assert!(!is_climate_sensor_type("Jalousie"));
+
+        assert!(is_controllable_type("LightControllerV2"));
+        assert!(is_controllable_type("Jalousie"));
+        assert!(!is_controllable_type("InfoOnlyAnalog"));
+    }
+
+    #[test]
+    fn test_category_for_type() {
+        assert_eq!(category_for_type("LightControllerV2"), "lights");
+        assert_eq!(category_for_type("LightSensor"), "lights");
+        assert_eq!(category_for_type("Jalousie"), "blinds");
+        assert_eq!(category_for_type("TemperatureSensor"), "climate");
+        assert_eq!(category_for_type("InfoOnlyAnalog"), "sensors");
+        assert_eq!(category_for_type("WeatherServer"), "weather");
+        assert_eq!(category_for_type("Alarm"), "security");
+        assert_eq!(category_for_type("Meter"), "energy");
+        assert_eq!(category_for_type("AudioZoneV2"), "audio");
+        assert_eq!(category_for_type("Pushbutton"), "other");
+    }
+}
@@ -6,6 +6,7 @@ pub mod auth;
 pub mod client_factory;
 pub mod command_queue;
 pub mod connection_pool;
+pub mod device_index;
 pub mod http_client;
 pub mod load_balancer;
 pub mod pool_health_monitor;
@@ -23,6 +24,7 @@ pub use adaptive_pool::{
 pub use client_factory::{
     AdaptiveClientFactory, ClientFactory, EncryptionLevel, ServerCapabilities, StaticClientFactory,
 };
+pub use device_index::DeviceIndex;
 pub use http_client::LoxoneHttpClient;
 pub use load_balancer::{
     LoadBalancer, LoadBalancingStatistics, LoadBalancingStrategy, WeightMethod,
@@ -47,6 +49,7 @@ use async_trait::async_trait;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, Ordering};
 use tokio::sync::RwLock;
 
 /// Loxone device information
@@ -190,12 +193,19 @@ pub struct ClientContext {
     /// System capabilities
     pub capabilities: Arc<RwLock<SystemCapabilities>>,
 
+    /// Device UUIDs grouped by tool role, rebuilt with the structure
+    pub device_index: Arc<RwLock<DeviceIndex>>,
+
     /// Connection state
     pub connected: Arc<RwLock<bool>>,
 
     /// Last structure update
     pub last_update: Arc<RwLock<Option<chrono::DateTime<chrono::Utc>>>>,
 
+    /// Structure revision, bumped on every structure update so derived
+    /// summaries can tell whether they are still current
+    pub revision: Arc<AtomicU64>,
+
     /// Sensor state logger (optional)
     pub sensor_logger: Arc<RwLock<Option<Arc<crate::services::SensorStateLogger>>>>,
 }
@@ -207,8 +217,10 @@ impl Default for ClientContext {
             devices: Arc::new(RwLock::new(HashMap::new())),
             rooms: Arc::new(RwLock::new(HashMap::new())),
             capabilities: Arc::new(RwLock::new(SystemCapabilities::default())),
+            device_index: Arc::new(RwLock::new(DeviceIndex::new())),
             connected: Arc::new(RwLock::new(false)),
             last_update: Arc::new(RwLock::new(None)),
+            revision: Arc::new(AtomicU64::new(0)),
             sensor_logger: Arc::new(RwLock::new(None)),
         }
     }
@@ -222,16 +234,19 @@ impl ClientContext {
 
     /// Update structure and parse devices/rooms
     pub async fn update_structure(&self, structure: LoxoneStructure) -> Result<()> {
-        // Parse devices from structure
-        let mut devices = HashMap::new();
-        let mut rooms = HashMap::new();
+        // Parse devices from structure; both maps end up with one entry per
+        // room or control, so size them up front
+        let mut devices = HashMap::with_capacity(structure.controls.len());
+        let mut rooms = HashMap::with_capacity(structure.rooms.len());
         let mut capabilities = SystemCapabilities::default();
+        let mut device_index = DeviceIndex::new();
 
         // Parse rooms first
         for (uuid, room_data) in &structure.rooms {
             if let Ok(name) =
                 serde_json::from_value::<String>(room_data.get("name").cloned().unwrap_or_default())
             {
+                device_index.insert_room(uuid, &name);
                 rooms.insert(
                     uuid.clone(),
                     LoxoneRoom {
@@ -258,17 +273,7 @@ impl ClientContext {
                     .unwrap_or("Unknown")
                     .to_string();
 
-                let room_uuid = control_obj
-                    .get("room")
-                    .and_then(|v| v.as_str())
-                    .map(|s| s.to_string());
-
-                // Get room name if room UUID is available
-                let room_name = if let Some(ref room_uuid) = room_uuid {
-                    rooms.get(room_uuid).map(|r| r.name.clone())
-                } else {
-                    None
-                };
+                let room_uuid = control_obj.get("room").and_then(|v| v.as_str());
 
                 // Parse states
                 let states = control_obj
@@ -292,18 +297,22 @@ impl ClientContext {
                     })
                     .unwrap_or_default();
 
-                // Determine category based on type
-                let category = self.categorize_device(&device_type);
-
-                // Update capabilities
-                self.update_capabilities(&mut capabilities, &device_type, &category);
-
-                // Update room device count
-                if let Some(room_uuid) = &room_uuid
-                    && let Some(room) = rooms.get_mut(room_uuid)
-                {
-                    room.device_count += 1;
-                }
+                // Classify once; capabilities and the role index are fed from
+                // this same sweep over the controls
+                let category = Self::categorize_device(&device_type);
+                Self::update_capabilities(&mut capabilities, category);
+                device_index.insert(uuid, &device_type, &name);
+                device_index.insert_name(uuid, &name);
+
+                // Resolve the room name and update its device count with a
+                // single lookup
+                let room_name = room_uuid.and_then(|room_uuid| {
+                    device_index.insert_in_room(room_uuid, uuid, &device_type);
+                    rooms.get_mut(room_uuid).map(|room| {
+                        room.device_count += 1;
+                        room.name.clone()
+                    })
+                });
 
                 devices.insert(
                     uuid.clone(),
@@ -313,47 +322,39 @@ impl ClientContext {
                         device_type,
                         room: room_name,
                         states,
-                        category,
+                        category: category.to_string(),
                         sub_controls,
                     },
                 );
             }
         }
 
+        device_index.shrink_to_fit();
+
         // Update context
         *self.structure.write().await = Some(structure);
         *self.devices.write().await = devices;
         *self.rooms.write().await = rooms;
         *self.capabilities.write().await = capabilities;
+        *self.device_index.write().await = device_index;
         *self.last_update.write().await = Some(chrono::Utc::now());
+        self.revision.fetch_add(1, Ordering::Release);
 
         Ok(())
     }
 
+    /// Current structure revision
+    pub fn revision(&self) -> u64 {
+        self.revision.load(Ordering::Acquire)
+    }
+
     /// Categorize device based on type
-    fn categorize_device(&self, device_type: &str) -> String {
-        match device_type.to_lowercase().as_str() {
-            t if t.contains("light") || t.contains("dimmer") => "lights".to_string(),
-            t if t.contains("jalousie") || t.contains("blind") => "blinds".to_string(),
-            t if t.contains("climate") || t.contains("heating") || t.contains("temperature") => {
-                "climate".to_string()
-            }
-            t if t.contains("sensor") || t.contains("analog") => "sensors".to_string(),
-            t if t.contains("weather") => "weather".to_string(),
-            t if t.contains("security") || t.contains("alarm") => "security".to_string(),
-            t if t.contains("energy") || t.contains("meter") => "energy".to_string(),
-            t if t.contains("audio") || t.contains("music") => "audio".to_string(),
-            _ => "other".to_string(),
-        }
+    fn categorize_device(device_type: &str) -> &'static str {
+        device_index::category_for_type(device_type)
     }
 
-    /// Update system capabilities based on device
-    fn update_capabilities(
-        &self,
-        capabilities: &mut SystemCapabilities,
-        _device_type: &str,
-        category: &str,
-    ) {
+    /// Update system capabilities based on device category
+    fn update_capabilities(capabilities: &mut SystemCapabilities, category: &str) {
         match category {
             "lights" => {
                 capabilities.has_lighting = true;
@@ -382,25 +383,24 @@ impl ClientContext {
     /// Get devices by category
     pub async fn get_devices_by_category(&self, category: &str) -> Result<Vec<LoxoneDevice>> {
         let devices = self.devices.read().await;
-        Ok(devices
-            .values()
-            .filter(|device| device.category == category)
+        let index = self.device_index.read().await;
+        Ok(index
+            .matching_types(|device_type| Self::categorize_device(device_type) == category)
+            .filter_map(|uuid| devices.get(uuid))
             .cloned()
             .collect())
     }
 
     /// Get devices by room
     pub async fn get_devices_by_room(&self, room_name: &str) -> Result<Vec<LoxoneDevice>> {
+        let rooms = self.rooms.read().await;
         let devices = self.devices.read().await;
-        Ok(devices
+        let index = self.device_index.read().await;
+        Ok(rooms
             .values()
-            .filter(|device| {
-                device
-                    .room
-                    .as_ref()
-                    .map(|r| r == room_name)
-                    .unwrap_or(false)
-            })
+            .filter(|room| room.name == room_name)
+            .flat_map(|room| index.room_controls(&room.uuid))
+            .filter_map(|uuid| devices.get(uuid))
             .cloned()
             .collect())
     }
@@ -414,14 +414,13 @@ impl ClientContext {
             return Ok(Some(device.clone()));
         }
 
-        // Try by name
-        for device in devices.values() {
-            if device.name.to_lowercase() == identifier.to_lowercase() {
-                return Ok(Some(device.clone()));
-            }
-        }
-
-        Ok(None)
+        // Try by name, against the lowercased names kept in the device index
+        let lower = identifier.to_lowercase();
+        let index = self.device_index.read().await;
+        Ok(index
+            .find_by_name(&lower)
+            .and_then(|uuid| devices.get(uuid))
+            .cloned())
     }
 
     /// Check if structure needs refresh (older than cache TTL)
@@ -593,9 +593,9 @@ impl PoolHealthMonitor {
             // Add new alerts
             for alert in new_alerts {
                 let alert_key = format!("{:?}", alert.alert_type);
-                let is_new = !active_alerts.contains_key(&alert_key);
-
-                active_alerts.insert(alert_key.clone(), alert.clone());
+                let is_new = active_alerts
+                    .insert(alert_key.clone(), alert.clone())
+                    .is_none();
 
                 if is_new {
                     warn!("New alert: {} - {}", alert_key, alert.message);
@@ -14,13 +14,14 @@ use crate::config::{LoxoneConfig, credentials::LoxoneCredentials};
 use crate::error::{LoxoneError, Result};
 use crate::mcp_consent::{ConsentDecision, ConsentManager, OperationType};
 use async_trait::async_trait;
+use futures_util::{StreamExt, future, stream};
 use reqwest::{Client, ClientBuilder};
 use serde_json;
 use std::collections::HashMap;
 use std::sync::Arc;
 use std::time::Duration;
 use tokio::sync::RwLock;
-use tracing::{debug, error, info, warn};
+use tracing::{Level, debug, error, info, warn};
 use url::Url;
 
 /// Validate a Loxone UUID format.
@@ -88,7 +89,13 @@ impl TokenHttpClient {
         // Build HTTP client without default auth headers
         let mut client_builder = ClientBuilder::new()
             .timeout(config.timeout)
-            .user_agent(format!("loxone-mcp-rust/{}", env!("CARGO_PKG_VERSION")));
+            .user_agent(format!("loxone-mcp-rust/{}", env!("CARGO_PKG_VERSION")))
+            // Small request/response exchanges: send immediately and keep
+            // connections to the Miniserver warm as long as the pool does
+            .tcp_nodelay(true)
+            .tcp_keepalive(Duration::from_secs(60))
+            .pool_idle_timeout(Duration::from_secs(300))
+            .pool_max_idle_per_host(config.max_connections.unwrap_or(10));
 
         // Handle SSL verification
         if !config.verify_ssl {
@@ -136,6 +143,11 @@ impl TokenHttpClient {
         Ok(client)
     }
 
+    /// Requests a batch read keeps in flight, matching the connection pool size
+    fn max_concurrent_requests(&self) -> usize {
+        self.config.max_connections.unwrap_or(10)
+    }
+
     /// Build URL for API endpoint
     fn build_url(&self, path: &str) -> Result<Url> {
         self.base_url
@@ -497,12 +509,16 @@ impl LoxoneClient for TokenHttpClient {
                         info!("Structure loaded successfully");
                         self.context.update_structure(structure).await?;
 
-                        let capabilities = self.context.capabilities.read().await;
-                        info!("System capabilities detected:");
-                        info!("  Lighting: {} devices", capabilities.light_count);
-                        info!("  Blinds: {} devices", capabilities.blind_count);
-                        info!("  Climate: {} devices", capabilities.climate_count);
-                        info!("  Sensors: {} devices", capabilities.sensor_count);
+                        // Only take the capabilities lock when the summary
+                        // will actually be emitted
+                        if tracing::enabled!(Level::INFO) {
+                            let capabilities = self.context.capabilities.read().await;
+                            info!("System capabilities detected:");
+                            info!("  Lighting: {} devices", capabilities.light_count);
+                            info!("  Blinds: {} devices", capabilities.blind_count);
+                            info!("  Climate: {} devices", capabilities.climate_count);
+                            info!("  Sensors: {} devices", capabilities.sensor_count);
+                        }
                     }
                     Err(e) => {
                         warn!("Failed to load structure: {e}");
@@ -650,13 +666,15 @@ impl LoxoneClient for TokenHttpClient {
         let url = self.build_url("data/LoxAPP3.json")?;
 
         let response = self.execute_request(url).await?;
-        let text = response
-            .text()
+        let body = response
+            .bytes()
             .await
             .map_err(|e| LoxoneError::connection(format!("Failed to read structure: {e}")))?;
 
-        // Parse structure JSON
-        let structure: LoxoneStructure = serde_json::from_str(&text).map_err(LoxoneError::Json)?;
+        // Parse structure JSON straight from the body, without decoding it
+        // into an intermediate String first
+        let structure: LoxoneStructure =
+            serde_json::from_slice(&body).map_err(LoxoneError::Json)?;
 
         debug!(
             "Structure loaded: {} controls, {} rooms",
@@ -671,32 +689,23 @@ impl LoxoneClient for TokenHttpClient {
         &self,
         uuids: &[String],
     ) -> Result<HashMap<String, serde_json::Value>> {
-        let mut states = HashMap::new();
-
-        // Process requests concurrently to avoid timeout issues
-        let futures: Vec<_> = uuids
-            .iter()
-            .map(|uuid| {
-                let uuid = uuid.clone();
-                async move {
-                    match self.send_command(&uuid, "state").await {
-                        Ok(response) => Some((uuid, response.value)),
-                        Err(e) => {
-                            warn!("Failed to get state for device {uuid}: {e}");
-                            None
-                        }
+        // Process requests concurrently, but no more at once than the
+        // connection pool admits; the pool rejects requests once its queue
+        // is full, which failed large batches
+        let states = stream::iter(uuids)
+            .map(|uuid| async move {
+                match self.send_command(uuid, "state").await {
+                    Ok(response) => Some((uuid.clone(), response.value)),
+                    Err(e) => {
+                        warn!("Failed to get state for device {uuid}: {e}");
+                        None
                     }
                 }
             })
-            .collect();
-
-        // Execute all requests concurrently
-        let results = futures_util::future::join_all(futures).await;
-
-        // Collect successful results
-        for (uuid, value) in results.into_iter().flatten() {
-            states.insert(uuid, value);
-        }
+            .buffer_unordered(self.max_concurrent_requests())
+            .filter_map(future::ready)
+            .collect()
+            .await;
 
         Ok(states)
     }
@@ -813,9 +822,11 @@ impl TokenHttpClient {
     /// Get devices by type (e.g., `LightController`, `Jalousie`)
     pub async fn get_devices_by_type(&self, device_type: &str) -> Result<Vec<LoxoneDevice>> {
         let devices = self.context.devices.read().await;
-        Ok(devices
-            .values()
-            .filter(|device| device.device_type == device_type)
+        let index = self.context.device_index.read().await;
+        Ok(index
+            .of_type(device_type)
+            .iter()
+            .filter_map(|uuid| devices.get(uuid))
             .cloned()
             .collect())
     }
@@ -825,32 +836,21 @@ impl TokenHttpClient {
         &self,
         state_uuids: &[String],
     ) -> Result<HashMap<String, serde_json::Value>> {
-        let mut state_values = HashMap::new();
-
-        // Process requests concurrently to avoid timeout issues
-        let futures: Vec<_> = state_uuids
-            .iter()
-            .map(|state_uuid| {
-                let state_uuid = state_uuid.clone();
-                async move {
-                    match self.get_state_value_by_uuid(&state_uuid).await {
-                        Ok(value) => Some((state_uuid, value)),
-                        Err(e) => {
-                            warn!("Failed to get state value for UUID {state_uuid}: {e}");
-                            None
-                        }
+        // Process requests concurrently, bounded like get_device_states
+        let state_values = stream::iter(state_uuids)
+            .map(|state_uuid| async move {
+                match self.get_state_value_by_uuid(state_uuid).await {
+                    Ok(value) => Some((state_uuid.clone(), value)),
+                    Err(e) => {
+                        warn!("Failed to get state value for UUID {state_uuid}: {e}");
+                        None
                     }
                 }
             })
-            .collect();
-
-        // Execute all requests concurrently
-        let results = futures_util::future::join_all(futures).await;
-
-        // Collect successful results
-        for (state_uuid, value) in results.into_iter().flatten() {
-            state_values.insert(state_uuid, value);
-        }
+            .buffer_unordered(self.max_concurrent_requests())
+            .filter_map(future::ready)
+            .collect()
+            .await;
 
         Ok(state_values)
     }
@@ -2569,22 +2569,22 @@ impl LoxoneClient for LoxoneWebSocketClient {
         if let Some(http_client) = &self.http_client {
             http_client.get_state_values(state_uuids).await
         } else {
-            // Fallback: try to resolve from cached device states
-            let mut state_values = HashMap::new();
+            // Fallback: try to resolve from cached device states, looking up
+            // every device state once against the requested UUIDs rather than
+            // rescanning all devices for each of them
+            let wanted: HashSet<&str> = state_uuids.iter().map(String::as_str).collect();
+            let mut state_values = HashMap::with_capacity(wanted.len());
             let devices = self.context.devices.read().await;
 
-            for state_uuid in state_uuids {
-                // Look for the state UUID in device states
-                for device in devices.values() {
-                    for state_value in device.states.values() {
-                        if let Some(uuid_str) = state_value.as_str()
-                            && uuid_str == state_uuid
-                        {
-                            // Found the state UUID, but we need the actual value
-                            // For now, return the UUID itself - this is a limitation without HTTP client
-                            state_values.insert(state_uuid.clone(), state_value.clone());
-                            break;
-                        }
+            for state_value in devices.values().flat_map(|device| device.states.values()) {
+                if let Some(uuid_str) = state_value.as_str()
+                    && wanted.contains(uuid_str)
+                {
+                    // Found the state UUID, but we need the actual value
+                    // For now, return the UUID itself - this is a limitation without HTTP client
+                    state_values.insert(uuid_str.to_string(), state_value.clone());
+                    if state_values.len() == wanted.len() {
+                        break;
                     }
                 }
             }
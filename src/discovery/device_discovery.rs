@@ -21,18 +21,24 @@ impl DeviceDiscovery {
 
     pub async fn discover_all_devices(&self) -> Result<Vec<Value>> {
         let structure = self.client.get_structure().await?;
-        let mut devices = Vec::new();
 
-        for (uuid, control) in &structure.controls {
-            let device = json!({
-                "uuid": uuid,
-                "name": control.get("name").unwrap_or(&Value::String("Unknown".to_string())),
-                "type": control.get("type").unwrap_or(&Value::String("Unknown".to_string())),
-                "room": control.get("room").unwrap_or(&Value::String("".to_string())),
-                "category": control.get("cat").unwrap_or(&Value::String("".to_string()))
-            });
-            devices.push(device);
-        }
+        // Fallbacks are built once, not evaluated into fresh strings for
+        // every field of every control
+        let unknown = Value::from("Unknown");
+        let empty = Value::from("");
+        let devices = structure
+            .controls
+            .iter()
+            .map(|(uuid, control)| {
+                json!({
+                    "uuid": uuid,
+                    "name": control.get("name").unwrap_or(&unknown),
+                    "type": control.get("type").unwrap_or(&unknown),
+                    "room": control.get("room").unwrap_or(&empty),
+                    "category": control.get("cat").unwrap_or(&empty)
+                })
+            })
+            .collect();
 
         Ok(devices)
     }
@@ -73,15 +79,21 @@ impl DeviceDiscovery {
 
     pub async fn discover_working_sensors(&self) -> Result<Vec<Value>> {
         let sensors = self.discover_sensors().await?;
-        let mut working_sensors = Vec::new();
 
-        for sensor in sensors {
-            if let Some(uuid) = sensor.get("uuid").and_then(|u| u.as_str())
-                && self.test_device_connectivity(uuid).await.unwrap_or(false)
-            {
-                working_sensors.push(sensor);
+        // Probe every sensor concurrently; the results keep sensor order
+        let probes = sensors.iter().map(|sensor| async move {
+            match sensor.get("uuid").and_then(|u| u.as_str()) {
+                Some(uuid) => self.test_device_connectivity(uuid).await.unwrap_or(false),
+                None => false,
             }
-        }
+        });
+        let reachable = futures_util::future::join_all(probes).await;
+
+        let working_sensors = sensors
+            .into_iter()
+            .zip(reachable)
+            .filter_map(|(sensor, ok)| ok.then_some(sensor))
+            .collect();
 
         Ok(working_sensors)
     }
@@ -680,15 +680,17 @@ impl DiscoveryCache {
     /// Save cache to persistent storage
     async fn save_to_disk(&self) -> Result<()> {
         if let Some(cache_file) = &self.config.cache_file_path {
-            let cache = self.cache.read().await;
-            let serialized = serde_json::to_string_pretty(&*cache)?;
+            let (serialized, entries) = {
+                let cache = self.cache.read().await;
+                (serde_json::to_vec(&*cache)?, cache.len())
+            };
 
             if let Some(parent) = cache_file.parent() {
                 tokio::fs::create_dir_all(parent).await?;
             }
 
             tokio::fs::write(cache_file, serialized).await?;
-            info!("Saved {} entries to cache file", cache.len());
+            info!("Saved {} entries to cache file", entries);
         }
 
         Ok(())
@@ -9,7 +9,7 @@ use crate::error::{LoxoneError, Result};
 use crate::utils::parse_socket_addr_safe;
 use serde::{Deserialize, Serialize};
 use std::{
-    collections::HashMap,
+    collections::{HashMap, HashSet},
     net::{SocketAddr, UdpSocket},
     time::Duration,
 };
@@ -43,7 +43,7 @@ impl NetworkDiscovery {
 
     /// Discover Loxone servers using multiple methods
     pub async fn discover_servers(&self) -> Result<Vec<DiscoveredServer>> {
-        let mut servers = Vec::new();
+        let mut servers: Vec<DiscoveredServer> = Vec::new();
 
         info!("🔍 Discovering Loxone Miniservers on your network...");
 
@@ -64,6 +64,9 @@ impl NetworkDiscovery {
             }
         }
 
+        // IPs already reported, so later methods only add new servers
+        let mut seen_ips: HashSet<String> = servers.iter().map(|s| s.ip.clone()).collect();
+
         // Method 2: UDP Discovery (Loxone specific protocol)
         info!("   • Trying UDP discovery...");
         match self.udp_discovery().await {
@@ -71,7 +74,7 @@ impl NetworkDiscovery {
                 info!("✅ Found {} server(s)", udp_servers.len());
                 // Merge results, avoiding duplicates
                 for server in udp_servers {
-                    if !servers.iter().any(|s: &DiscoveredServer| s.ip == server.ip) {
+                    if seen_ips.insert(server.ip.clone()) {
                         servers.push(server);
                     }
                 }
@@ -89,7 +92,7 @@ impl NetworkDiscovery {
             Ok(http_servers) => {
                 let new_servers: Vec<_> = http_servers
                     .into_iter()
-                    .filter(|server| !servers.iter().any(|s| s.ip == server.ip))
+                    .filter(|server| seen_ips.insert(server.ip.clone()))
                     .collect();
 
                 if !new_servers.is_empty() {
@@ -36,14 +36,22 @@ impl DiagnosticsCollector {
             .unwrap()
             .as_secs();
 
+        // The collectors are independent, so they run concurrently
+        let (process_info, network_info, disk_info, runtime_metrics) = tokio::try_join!(
+            self.collect_process_info(),
+            self.collect_network_info(),
+            self.collect_disk_info(),
+            self.collect_runtime_metrics(),
+        )?;
+
         let snapshot = DiagnosticSnapshot {
             timestamp,
             system_info: SystemInfo::current(),
-            process_info: self.collect_process_info().await?,
-            network_info: self.collect_network_info().await?,
-            disk_info: self.collect_disk_info().await?,
+            process_info,
+            network_info,
+            disk_info,
             environment_info: self.collect_environment_info(),
-            runtime_metrics: self.collect_runtime_metrics().await?,
+            runtime_metrics,
         };
 
         // Store in history
@@ -596,29 +596,35 @@ impl HealthChecker {
             })
             .collect();
 
-        let results = futures::future::join_all(check_futures).await;
-
-        // Run dependency checks
-        let mut dependencies = Vec::new();
-        for dep_check in &self.dependency_checks {
-            match dep_check.check().await {
-                Ok(status) => dependencies.push(status),
-                Err(e) => {
-                    warn!("Dependency check {} failed: {}", dep_check.name(), e);
-                    dependencies.push(DependencyStatus {
-                        name: dep_check.name().to_string(),
-                        dependency_type: dep_check.dependency_type(),
-                        status: HealthStatus::Unhealthy,
-                        message: "Check failed".to_string(),
-                        endpoint: dep_check.endpoint().to_string(),
-                        response_time_ms: 0,
-                        last_success: None,
-                        error: Some(e.to_string()),
-                        critical: dep_check.is_critical(),
-                    });
+        // Run dependency checks alongside them
+        let dependency_futures: Vec<_> = self
+            .dependency_checks
+            .iter()
+            .map(|dep_check| async {
+                match dep_check.check().await {
+                    Ok(status) => status,
+                    Err(e) => {
+                        warn!("Dependency check {} failed: {}", dep_check.name(), e);
+                        DependencyStatus {
+                            name: dep_check.name().to_string(),
+                            dependency_type: dep_check.dependency_type(),
+                            status: HealthStatus::Unhealthy,
+                            message: "Check failed".to_string(),
+                            endpoint: dep_check.endpoint().to_string(),
+                            response_time_ms: 0,
+                            last_success: None,
+                            error: Some(e.to_string()),
+                            critical: dep_check.is_critical(),
+                        }
+                    }
                 }
-            }
-        }
+            })
+            .collect();
+
+        let (results, dependencies) = tokio::join!(
+            futures::future::join_all(check_futures),
+            futures::future::join_all(dependency_futures)
+        );
 
         let report = HealthReport::new(results)
             .with_dependencies(dependencies)
@@ -631,35 +637,40 @@ impl HealthChecker {
     /// Perform a quick liveness check (subset of all checks)
     pub async fn check_liveness(&self) -> HealthStatus {
         // Run only critical checks for liveness
-        let critical_checks: Vec<_> = self.checks.iter().filter(|c| c.is_critical()).collect();
+        let critical_checks: Vec<_> = self
+            .checks
+            .iter()
+            .filter(|c| c.is_critical())
+            .map(|check| async {
+                match tokio::time::timeout(Duration::from_secs(1), check.check()).await {
+                    Ok(Ok(result)) => result.status,
+                    _ => HealthStatus::Unhealthy,
+                }
+            })
+            .collect();
 
         if critical_checks.is_empty() {
             return HealthStatus::Healthy;
         }
 
-        let mut critical_results = Vec::new();
-        for check in critical_checks {
-            match tokio::time::timeout(Duration::from_secs(1), check.check()).await {
-                Ok(Ok(result)) => critical_results.push(result.status),
-                _ => critical_results.push(HealthStatus::Unhealthy),
-            }
-        }
+        let critical_results = futures::future::join_all(critical_checks).await;
 
         HealthStatus::combine(&critical_results)
     }
 
     /// Perform a readiness check (all dependencies must be available)
     pub async fn check_readiness(&self) -> HealthStatus {
-        let mut dependency_statuses = Vec::new();
-
-        for dep_check in &self.dependency_checks {
-            if dep_check.is_critical() {
+        let dependency_checks = self
+            .dependency_checks
+            .iter()
+            .filter(|dep_check| dep_check.is_critical())
+            .map(|dep_check| async {
                 match dep_check.check().await {
-                    Ok(status) => dependency_statuses.push(status.status),
-                    Err(_) => dependency_statuses.push(HealthStatus::Unhealthy),
+                    Ok(status) => status.status,
+                    Err(_) => HealthStatus::Unhealthy,
                 }
-            }
-        }
+            });
+        let dependency_statuses = futures::future::join_all(dependency_checks).await;
 
         HealthStatus::combine(&dependency_statuses)
     }
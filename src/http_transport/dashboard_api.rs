@@ -6,6 +6,7 @@
 use crate::client::ClientContext;
 use axum::{extract::State, response::Json};
 use serde_json::{json, Value};
+use std::collections::HashMap;
 use std::sync::Arc;
 
 /// Get all rooms with device counts and sensor data
@@ -208,32 +209,33 @@ pub async fn get_dashboard_json(State(context): State<Arc<ClientContext>>) -> Js
         })
         .collect();
 
-    // Process rooms with full data
-    let mut room_data = Vec::new();
-    for (_uuid, room) in rooms.iter() {
-        let room_devices: Vec<_> = devices
-            .values()
-            .filter(|device| device.room.as_ref() == Some(&room.name))
-            .collect();
+    // Count devices and sensors per room in one pass each instead of
+    // rescanning both for every room
+    let mut room_device_counts: HashMap<&str, usize> = HashMap::new();
+    for room_name in devices.values().filter_map(|device| device.room.as_deref()) {
+        *room_device_counts.entry(room_name).or_default() += 1;
+    }
+    let mut room_sensor_counts: HashMap<&str, usize> = HashMap::new();
+    for room_name in sensor_readings
+        .values()
+        .filter_map(|reading| reading.get("room")?.as_str())
+    {
+        *room_sensor_counts.entry(room_name).or_default() += 1;
+    }
 
-        let room_sensors: Vec<_> = sensor_readings
-            .iter()
-            .filter(|(_, reading)| {
-                reading
-                    .get("room")
-                    .and_then(|r| r.as_str())
-                    .map(|room_name| room_name == room.name)
-                    .unwrap_or(false)
+    // Process rooms with full data
+    let room_data: Vec<Value> = rooms
+        .values()
+        .map(|room| {
+            let name = room.name.as_str();
+            json!({
+                "name": room.name,
+                "uuid": room.uuid,
+                "devices": room_device_counts.get(name).copied().unwrap_or(0),
+                "sensors": room_sensor_counts.get(name).copied().unwrap_or(0),
             })
-            .collect();
-
-        room_data.push(json!({
-            "name": room.name,
-            "uuid": room.uuid,
-            "devices": room_devices.len(),
-            "sensors": room_sensors.len(),
-        }));
-    }
+        })
+        .collect();
 
     Json(json!({
         "connection": {
@@ -11,6 +11,18 @@ use std::collections::HashMap;
 
 /// Get dashboard data using unified value resolution (replaces get_dashboard_data_from_server)
 pub async fn get_unified_dashboard_data(server: &LoxoneMcpServer) -> Value {
+    get_unified_dashboard_data_with_matrix(server, true).await
+}
+
+/// Get dashboard data, optionally skipping the per-room device matrix
+///
+/// The matrix regroups every device row by room, which dominates the cost of
+/// a dashboard build on large installations. Callers that do not render it
+/// can pass `include_device_matrix = false` to get an empty matrix instead.
+pub async fn get_unified_dashboard_data_with_matrix(
+    server: &LoxoneMcpServer,
+    include_device_matrix: bool,
+) -> Value {
     let resolver = server.get_value_resolver();
     let context = &server.context;
     let state_manager = server.get_state_manager();
@@ -132,7 +144,12 @@ pub async fn get_unified_dashboard_data(server: &LoxoneMcpServer) -> Value {
 
     // Build device matrix for dashboard
     let mut device_matrix = Vec::new();
-    for room in &rooms_data {
+    let matrix_rooms: &[Value] = if include_device_matrix {
+        &rooms_data
+    } else {
+        &[]
+    };
+    for room in matrix_rooms {
         if let Some(room_name) = room.get("name").and_then(|n| n.as_str()) {
             let mut all_room_devices = Vec::new();
 
@@ -518,17 +535,16 @@ fn build_device_json(
                             } else {
                                 // Check the formatted value for text states
                                 let state_text = &resolved.formatted_value;
-                                if state_text.to_lowercase().contains("on")
-                                    || state_text.to_lowercase().contains("active")
-                                {
+                                let state_lower = state_text.to_lowercase();
+                                if state_lower.contains("on") || state_lower.contains("active") {
                                     (
                                         "On".to_string(),
                                         "green".to_string(),
                                         state_text.clone(),
                                         1.0,
                                     )
-                                } else if state_text.to_lowercase().contains("off")
-                                    || state_text.to_lowercase().contains("inactive")
+                                } else if state_lower.contains("off")
+                                    || state_lower.contains("inactive")
                                 {
                                     (
                                         "Off".to_string(),
@@ -566,9 +582,8 @@ fn build_device_json(
                                 }
                             } else {
                                 let state_text = &resolved.formatted_value;
-                                if state_text.to_lowercase().contains("armed")
-                                    || state_text.to_lowercase().contains("active")
-                                {
+                                let state_lower = state_text.to_lowercase();
+                                if state_lower.contains("armed") || state_lower.contains("active") {
                                     (
                                         "Armed".to_string(),
                                         "red".to_string(),
@@ -617,21 +632,21 @@ fn build_device_json(
                                 } else {
                                     // Check formatted value for meaningful states
                                     let state_text = &resolved.formatted_value;
-                                    if state_text.to_lowercase() == "closed" {
+                                    if state_text.eq_ignore_ascii_case("closed") {
                                         (
                                             "Closed".to_string(),
                                             "blue".to_string(),
                                             "Closed".to_string(),
                                             0.0,
                                         )
-                                    } else if state_text.to_lowercase() == "open" {
+                                    } else if state_text.eq_ignore_ascii_case("open") {
                                         (
                                             "Open".to_string(),
                                             "green".to_string(),
                                             "Open".to_string(),
                                             0.0,
                                         )
-                                    } else if state_text.to_lowercase() != "idle"
+                                    } else if !state_text.eq_ignore_ascii_case("idle")
                                         && !state_text.is_empty()
                                     {
                                         // Show the actual formatted state instead of "Idle"
@@ -653,30 +668,31 @@ fn build_device_json(
                             } else {
                                 // No numeric value - check formatted value
                                 let state_text = &resolved.formatted_value;
-                                if !state_text.is_empty() && state_text.to_lowercase() != "idle" {
+                                let state_lower = state_text.to_lowercase();
+                                if !state_text.is_empty() && state_lower != "idle" {
                                     // Check for common state patterns
-                                    if state_text.to_lowercase().contains("closed") {
+                                    if state_lower.contains("closed") {
                                         (
                                             "Closed".to_string(),
                                             "blue".to_string(),
                                             state_text.clone(),
                                             0.0,
                                         )
-                                    } else if state_text.to_lowercase().contains("open") {
+                                    } else if state_lower.contains("open") {
                                         (
                                             "Open".to_string(),
                                             "green".to_string(),
                                             state_text.clone(),
                                             0.0,
                                         )
-                                    } else if state_text.to_lowercase().contains("on") {
+                                    } else if state_lower.contains("on") {
                                         (
                                             "On".to_string(),
                                             "green".to_string(),
                                             state_text.clone(),
                                             1.0,
                                         )
-                                    } else if state_text.to_lowercase().contains("off") {
+                                    } else if state_lower.contains("off") {
                                         (
                                             "Off".to_string(),
                                             "gray".to_string(),
@@ -774,23 +790,20 @@ async fn collect_trend_data(
         }
     }
 
-    // Collect daily activity patterns (changes by type)
-    let mut daily_activity = Vec::new();
-    for (change_type, count) in &change_stats.changes_by_type {
-        daily_activity.push(json!({
-            "type": change_type,
-            "count": count,
-            "percentage": (*count as f64 / change_stats.total_changes as f64 * 100.0).round()
-        }));
-    }
-
-    // Sort by count descending
-    daily_activity.sort_by(|a, b| {
-        b["count"]
-            .as_u64()
-            .unwrap_or(0)
-            .cmp(&a["count"].as_u64().unwrap_or(0))
-    });
+    // Collect daily activity patterns (changes by type), sorting the counts
+    // by descending frequency before they are rendered
+    let mut changes_by_type: Vec<_> = change_stats.changes_by_type.iter().collect();
+    changes_by_type.sort_unstable_by(|a, b| b.1.cmp(a.1));
+    let daily_activity: Vec<Value> = changes_by_type
+        .into_iter()
+        .map(|(change_type, count)| {
+            json!({
+                "type": change_type,
+                "count": count,
+                "percentage": (*count as f64 / change_stats.total_changes as f64 * 100.0).round()
+            })
+        })
+        .collect();
 
     // Collect performance trends from recent device changes
     let mut performance_trends = Vec::new();
@@ -839,21 +852,19 @@ async fn collect_trend_data(
         }
     }
 
-    // Room activity analysis
-    let mut room_activity = Vec::new();
-    for (room, count) in &change_stats.changes_by_room {
-        room_activity.push(json!({
-            "room": room,
-            "activity_count": count,
-            "activity_level": if *count > 200 { "very_active" } else if *count > 100 { "active" } else if *count > 50 { "moderate" } else { "quiet" }
-        }));
-    }
-    room_activity.sort_by(|a, b| {
-        b["activity_count"]
-            .as_u64()
-            .unwrap_or(0)
-            .cmp(&a["activity_count"].as_u64().unwrap_or(0))
-    });
+    // Room activity analysis, most active room first
+    let mut changes_by_room: Vec<_> = change_stats.changes_by_room.iter().collect();
+    changes_by_room.sort_unstable_by(|a, b| b.1.cmp(a.1));
+    let room_activity: Vec<Value> = changes_by_room
+        .into_iter()
+        .map(|(room, count)| {
+            json!({
+                "room": room,
+                "activity_count": count,
+                "activity_level": if *count > 200 { "very_active" } else if *count > 100 { "active" } else if *count > 50 { "moderate" } else { "quiet" }
+            })
+        })
+        .collect();
 
     // If we have no real data, provide some sample trends for demonstration
     let (daily_activity, device_usage_data, performance_trends, room_activity) = if change_stats
@@ -209,9 +209,14 @@ pub async fn performance_handler(
 
 /// Get full dashboard with all features
 async fn get_full_dashboard(server: &LoxoneMcpServer, params: &DashboardQuery) -> Value {
-    // Use the existing unified dashboard but with performance enhancements
+    // Use the existing unified dashboard but with performance enhancements;
+    // the device matrix is only built when device details are requested
     let mut data =
-        crate::http_transport::dashboard_data_unified::get_unified_dashboard_data(server).await;
+        crate::http_transport::dashboard_data_unified::get_unified_dashboard_data_with_matrix(
+            server,
+            params.devices,
+        )
+        .await;
 
     // Add performance-specific metadata
     data["performance_mode"] = json!("full");
@@ -223,10 +228,6 @@ async fn get_full_dashboard(server: &LoxoneMcpServer, params: &DashboardQuery) -
     });
 
     // Conditionally include expensive features
-    if !params.devices {
-        data["devices"]["device_matrix"] = json!([]);
-    }
-
     if !params.metrics {
         data["operational"] = json!({});
     }
@@ -183,39 +183,12 @@ async fn try_auto_detect_credentials() -> Result<(String, String, String)> {
     Ok((host, credentials.username, credentials.password))
 }
 
-#[tokio::main]
-async fn main() -> Result<()> {
-    let config = Config::parse();
-
-    // Initialize logging
-    config.initialize_logging();
-
-    // Validate configuration
-    config.validate()?;
-
-    if config.insecure {
-        warn!(
-            "SSL certificate verification is DISABLED (--insecure). This is not recommended for production use."
-        );
-    }
-
-    // Ensure the PulseEngine master encryption key is available.
-    // This prevents the "aead::Error" on restart (issue #23).
-    if let Err(e) = loxone_mcp_rust::config::master_key::ensure_master_key() {
-        tracing::warn!(
-            "Failed to ensure master encryption key (falling back to framework default): {e}"
-        );
-    }
-
-    info!(
-        "🚀 Starting Loxone MCP Server v{}",
-        env!("CARGO_PKG_VERSION")
-    );
-
-    // Load credentials with precedence: credential_id > direct args > auto-detect
-    let (loxone_host, loxone_user, _loxone_password) = if let Some(credential_id) =
-        &config.credential_id
-    {
+/// Load credentials with precedence: credential_id > direct args > auto-detect
+///
+/// Only modes that connect to a Miniserver call this, so offline and
+/// development runs neither touch the credential stores nor fail without them.
+async fn resolve_credentials(config: &Config) -> Result<(String, String, String)> {
+    let credentials = if let Some(credential_id) = &config.credential_id {
         info!("🔑 Loading credentials from ID: {}", credential_id);
         load_credentials_by_id(credential_id).await?
     } else if config.loxone_host.is_some()
@@ -248,6 +221,37 @@ async fn main() -> Result<()> {
             }
         }
     };
+    Ok(credentials)
+}
+
+#[tokio::main]
+async fn main() -> Result<()> {
+    let config = Config::parse();
+
+    // Initialize logging
+    config.initialize_logging();
+
+    // Validate configuration
+    config.validate()?;
+
+    if config.insecure {
+        warn!(
+            "SSL certificate verification is DISABLED (--insecure). This is not recommended for production use."
+        );
+    }
+
+    // Ensure the PulseEngine master encryption key is available.
+    // This prevents the "aead::Error" on restart (issue #23).
+    if let Err(e) = loxone_mcp_rust::config::master_key::ensure_master_key() {
+        tracing::warn!(
+            "Failed to ensure master encryption key (falling back to framework default): {e}"
+        );
+    }
+
+    info!(
+        "🚀 Starting Loxone MCP Server v{}",
+        env!("CARGO_PKG_VERSION")
+    );
 
     // Build a LoxoneMcpServer with Loxone client for all online modes
     let build_mcp_server =
@@ -308,22 +312,17 @@ async fn main() -> Result<()> {
             }
         };
 
-    match config.transport {
+    match &config.transport {
         TransportCommand::Stdio { offline } => {
             LoxoneMcpServer::configure_stdio_logging();
 
-            let server = if offline {
+            let server = if *offline {
                 info!("🚀 Starting MCP server in offline mode (stdio)");
                 LoxoneMcpServer::with_defaults()
             } else {
                 info!("🚀 Starting MCP server with Loxone connection (stdio)");
-                build_mcp_server(
-                    &loxone_host,
-                    &loxone_user,
-                    &_loxone_password,
-                    config.insecure,
-                )
-                .await?
+                let (host, user, password) = resolve_credentials(&config).await?;
+                build_mcp_server(&host, &user, &password, config.insecure).await?
             };
 
             let mut mcp_server = server.serve_stdio().await.map_err(|e| {
@@ -336,7 +335,7 @@ async fn main() -> Result<()> {
         }
 
         TransportCommand::Http { port, dev_mode, .. } => {
-            let server = if dev_mode {
+            let server = if *dev_mode {
                 warn!("Development mode enabled — no auth, localhost only");
                 LoxoneMcpServer::with_defaults()
             } else {
@@ -344,19 +343,14 @@ async fn main() -> Result<()> {
                     "🚀 Starting MCP server with Loxone connection (HTTP port {})",
                     port
                 );
-                build_mcp_server(
-                    &loxone_host,
-                    &loxone_user,
-                    &_loxone_password,
-                    config.insecure,
-                )
-                .await?
+                let (host, user, password) = resolve_credentials(&config).await?;
+                build_mcp_server(&host, &user, &password, config.insecure).await?
             };
 
             let serve_result: std::result::Result<
                 pulseengine_mcp_server::McpServer<LoxoneMcpServer>,
                 _,
-            > = server.serve_http(port).await;
+            > = server.serve_http(*port).await;
             let mut mcp_server = serve_result.map_err(|e| {
                 loxone_mcp_rust::LoxoneError::connection(format!("Failed to start server: {e}"))
             })?;
@@ -372,18 +366,13 @@ async fn main() -> Result<()> {
                 "🚀 Starting MCP server with Loxone connection (Streamable HTTP port {})",
                 port
             );
-            let server = build_mcp_server(
-                &loxone_host,
-                &loxone_user,
-                &_loxone_password,
-                config.insecure,
-            )
-            .await?;
+            let (host, user, password) = resolve_credentials(&config).await?;
+            let server = build_mcp_server(&host, &user, &password, config.insecure).await?;
 
             let serve_result: std::result::Result<
                 pulseengine_mcp_server::McpServer<LoxoneMcpServer>,
                 _,
-            > = server.serve_http(port).await;
+            > = server.serve_http(*port).await;
             let mut mcp_server = serve_result.map_err(|e| {
                 loxone_mcp_rust::LoxoneError::connection(format!("Failed to start server: {e}"))
             })?;
@@ -3,7 +3,7 @@
 //! This module collects Loxone device and sensor statistics, integrates with
 //! the existing MetricsCollector, and pushes data to InfluxDB for historical analysis.
 
-use crate::client::{ClientContext, LoxoneClient, LoxoneDevice};
+use crate::client::{ClientContext, LoxoneClient, LoxoneDevice, device_index};
 use crate::error::Result;
 use crate::services::SensorType;
 use chrono::{DateTime, Utc};
@@ -19,6 +19,17 @@ use tracing::{debug, error, info};
 use super::influxdb::{DeviceStateData, InfluxManager, LoxoneSensorData};
 use super::metrics::MetricsCollector;
 
+/// Temperature bands (°C) with their comfort score, narrowest first
+const TEMPERATURE_COMFORT_BANDS: &[(f64, f64, f64)] =
+    &[(20.0, 24.0, 100.0), (18.0, 26.0, 80.0), (16.0, 28.0, 60.0)];
+/// Temperature comfort score outside every band
+const TEMPERATURE_FALLBACK_SCORE: f64 = 40.0;
+
+/// Relative humidity bands (%) with their comfort score, narrowest first
+const HUMIDITY_COMFORT_BANDS: &[(f64, f64, f64)] = &[(40.0, 60.0, 100.0), (30.0, 70.0, 80.0)];
+/// Humidity comfort score outside every band
+const HUMIDITY_FALLBACK_SCORE: f64 = 60.0;
+
 /// Device usage statistics
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DeviceUsageStats {
@@ -331,17 +342,21 @@ impl LoxoneStatsCollector {
             }
         }
 
-        // Collect device states
-        let device_stats = self.collect_device_statistics().await?;
-
-        // Collect climate data
-        let climate_stats = self.collect_climate_statistics().await?;
-
-        // Collect energy data
-        let energy_stats = self.collect_energy_statistics().await?;
-
-        // Collect automation data
-        let automation_stats = self.collect_automation_statistics().await?;
+        // Collect device states, climate, energy and automation data; each
+        // collector keeps its own buffers, so they run concurrently
+        let (device_stats, climate_stats, energy_stats, automation_stats) = tokio::try_join!(
+            self.collect_device_statistics(),
+            self.collect_climate_statistics(),
+            self.collect_energy_statistics(),
+            self.collect_automation_statistics(),
+        )?;
+
+        // The device pass just refreshed every tracked state, so active
+        // devices are counted from its results instead of the trackers
+        let active_devices = device_stats
+            .iter()
+            .filter(|d| self.is_on_state(&d.current_state))
+            .count();
 
         // Calculate system health
         let health_score = self
@@ -355,7 +370,7 @@ impl LoxoneStatsCollector {
             room_climate: climate_stats,
             automations: automation_stats,
             energy: energy_stats,
-            active_devices: self.count_active_devices().await,
+            active_devices,
             total_sensors: self.context.devices.read().await.len(),
             health_score,
         };
@@ -381,6 +396,10 @@ impl LoxoneStatsCollector {
         let mut trackers = self.device_trackers.write().await;
         let mut stats = Vec::new();
 
+        // One clock sample for the whole collection pass
+        let now = Instant::now();
+        let now_utc = Utc::now();
+
         for device in devices.values() {
             // Skip non-controllable devices
             if !self.is_controllable_device(device) {
@@ -400,7 +419,7 @@ impl LoxoneStatsCollector {
                         device_type: device.device_type.clone(),
                         room: device.room.clone(),
                         last_state: current_state.clone(),
-                        last_change: Instant::now(),
+                        last_change: now,
                         on_since: None,
                         power_cycles: 0,
                         total_on_time: Duration::ZERO,
@@ -408,17 +427,19 @@ impl LoxoneStatsCollector {
 
             // Update tracker if state changed
             if tracker.last_state != current_state {
-                tracker.last_change = Instant::now();
+                tracker.last_change = now;
 
                 // Track on/off cycles
-                if self.is_on_state(&current_state) && !self.is_on_state(&tracker.last_state) {
+                let is_on = self.is_on_state(&current_state);
+                let was_on = self.is_on_state(&tracker.last_state);
+                if is_on && !was_on {
                     tracker.power_cycles += 1;
-                    tracker.on_since = Some(Instant::now());
-                } else if !self.is_on_state(&current_state)
-                    && self.is_on_state(&tracker.last_state)
+                    tracker.on_since = Some(now);
+                } else if !is_on
+                    && was_on
                     && let Some(on_since) = tracker.on_since
                 {
-                    tracker.total_on_time += Instant::now().duration_since(on_since);
+                    tracker.total_on_time += now.duration_since(on_since);
                     tracker.on_since = None;
                 }
 
@@ -428,7 +449,7 @@ impl LoxoneStatsCollector {
             // Update current on time
             let mut total_on_time = tracker.total_on_time;
             if let Some(on_since) = tracker.on_since {
-                total_on_time += Instant::now().duration_since(on_since);
+                total_on_time += now.duration_since(on_since);
             }
 
             stats.push(DeviceUsageStats {
@@ -438,8 +459,10 @@ impl LoxoneStatsCollector {
                 room: device.room.clone(),
                 power_cycles: tracker.power_cycles,
                 total_on_time: total_on_time.as_secs(),
-                last_state_change: Utc::now()
-                    - chrono::Duration::seconds(tracker.last_change.elapsed().as_secs() as i64),
+                last_state_change: now_utc
+                    - chrono::Duration::seconds(
+                        now.duration_since(tracker.last_change).as_secs() as i64
+                    ),
                 current_state,
                 energy_consumed: None, // TODO: Get from energy meters if available
                 average_power: None,   // TODO: Calculate from energy data
@@ -454,6 +477,8 @@ impl LoxoneStatsCollector {
         let devices = self.context.devices.read().await;
         let mut climate_buffer = self.climate_buffer.write().await;
         let mut room_stats: HashMap<String, RoomClimateStats> = HashMap::new();
+        let now = Utc::now();
+        let cutoff = now - chrono::Duration::hours(1);
 
         // Find temperature and humidity sensors
         for device in devices.values() {
@@ -468,53 +493,35 @@ impl LoxoneStatsCollector {
                 if temp.is_some() || humidity.is_some() {
                     // Buffer data for historical calculations
                     let entry = climate_buffer.entry(room.clone()).or_insert_with(Vec::new);
-                    entry.push((Utc::now(), temp.unwrap_or(0.0), humidity));
+                    entry.push((now, temp.unwrap_or(0.0), humidity));
 
                     // Keep only last hour of data
-                    let cutoff = Utc::now() - chrono::Duration::hours(1);
                     entry.retain(|(ts, _, _)| *ts > cutoff);
 
                     // Calculate statistics
-                    if !entry.is_empty() {
-                        let temps: Vec<f64> = entry
-                            .iter()
-                            .filter_map(|(_, t, _)| if *t > 0.0 { Some(*t) } else { None })
-                            .collect();
-                        let humidities: Vec<f64> =
-                            entry.iter().filter_map(|(_, _, h)| *h).collect();
-
-                        if !temps.is_empty() {
-                            let avg_temp = temps.iter().sum::<f64>() / temps.len() as f64;
-                            let min_temp = temps.iter().cloned().fold(f64::INFINITY, f64::min);
-                            let max_temp = temps.iter().cloned().fold(f64::NEG_INFINITY, f64::max);
-
-                            let avg_humidity = if !humidities.is_empty() {
-                                Some(humidities.iter().sum::<f64>() / humidities.len() as f64)
-                            } else {
-                                None
-                            };
-
-                            // Calculate comfort index (simple formula)
-                            let comfort_index =
-                                self.calculate_comfort_index(avg_temp, avg_humidity);
-                            let comfort_time_percent =
-                                self.calculate_comfort_time_percent(&temps, &humidities);
-
-                            room_stats.insert(
-                                room.clone(),
-                                RoomClimateStats {
-                                    room: room.clone(),
-                                    current_temperature: temp,
-                                    avg_temperature: avg_temp,
-                                    min_temperature: min_temp,
-                                    max_temperature: max_temp,
-                                    current_humidity: humidity,
-                                    avg_humidity,
-                                    comfort_index,
-                                    comfort_time_percent,
-                                },
-                            );
-                        }
+                    if let Some(aggregate) = ClimateAggregate::from_samples(entry, |t, h| {
+                        self.calculate_comfort_index(t, h)
+                    }) {
+                        // Calculate comfort index (simple formula)
+                        let comfort_index = self.calculate_comfort_index(
+                            aggregate.avg_temperature,
+                            aggregate.avg_humidity,
+                        );
+
+                        room_stats.insert(
+                            room.clone(),
+                            RoomClimateStats {
+                                room: room.clone(),
+                                current_temperature: temp,
+                                avg_temperature: aggregate.avg_temperature,
+                                min_temperature: aggregate.min_temperature,
+                                max_temperature: aggregate.max_temperature,
+                                current_humidity: humidity,
+                                avg_humidity: aggregate.avg_humidity,
+                                comfort_index,
+                                comfort_time_percent: aggregate.comfort_time_percent,
+                            },
+                        );
                     }
                 }
             }
@@ -655,21 +662,12 @@ impl LoxoneStatsCollector {
 
     /// Check if device is controllable
     pub fn is_controllable_device(&self, device: &LoxoneDevice) -> bool {
-        matches!(
-            device.device_type.to_lowercase().as_str(),
-            t if t.contains("light") ||
-                 t.contains("switch") ||
-                 t.contains("dimmer") ||
-                 t.contains("jalousie") ||
-                 t.contains("blind")
-        )
+        device_index::is_controllable_type(&device.device_type)
     }
 
     /// Check if device is a climate sensor
     pub fn is_climate_sensor(&self, device: &LoxoneDevice) -> bool {
-        device.device_type.to_lowercase().contains("temperature")
-            || device.device_type.to_lowercase().contains("humidity")
-            || device.device_type.to_lowercase().contains("climate")
+        device_index::is_climate_sensor_type(&device.device_type)
     }
 
     /// Get device state
@@ -719,58 +717,16 @@ impl LoxoneStatsCollector {
     pub fn calculate_comfort_index(&self, temp: f64, humidity: Option<f64>) -> f64 {
         // Simple comfort index calculation
         // Ideal temp: 20-24°C, ideal humidity: 40-60%
-        let temp_score: f64 = if (20.0..=24.0).contains(&temp) {
-            100.0
-        } else if (18.0..=26.0).contains(&temp) {
-            80.0
-        } else if (16.0..=28.0).contains(&temp) {
-            60.0
-        } else {
-            40.0
-        };
+        let temp_score = band_score(TEMPERATURE_COMFORT_BANDS, temp, TEMPERATURE_FALLBACK_SCORE);
 
-        let humidity_score: f64 = if let Some(h) = humidity {
-            if (40.0..=60.0).contains(&h) {
-                100.0
-            } else if (30.0..=70.0).contains(&h) {
-                80.0
-            } else {
-                60.0
-            }
-        } else {
-            80.0 // No humidity data, assume ok
+        let humidity_score = match humidity {
+            Some(h) => band_score(HUMIDITY_COMFORT_BANDS, h, HUMIDITY_FALLBACK_SCORE),
+            None => 80.0, // No humidity data, assume ok
         };
 
         (temp_score * 0.7 + humidity_score * 0.3).min(100.0)
     }
 
-    /// Calculate percentage of time in comfort range
-    fn calculate_comfort_time_percent(&self, temps: &[f64], humidities: &[f64]) -> f64 {
-        if temps.is_empty() {
-            return 0.0;
-        }
-
-        let comfort_count = temps
-            .iter()
-            .enumerate()
-            .filter(|(i, t)| {
-                let humidity = humidities.get(*i).copied();
-                self.calculate_comfort_index(**t, humidity) >= 80.0
-            })
-            .count();
-
-        (comfort_count as f64 / temps.len() as f64) * 100.0
-    }
-
-    /// Count active devices
-    async fn count_active_devices(&self) -> usize {
-        let trackers = self.device_trackers.read().await;
-        trackers
-            .values()
-            .filter(|t| self.is_on_state(&t.last_state))
-            .count()
-    }
-
     /// Calculate system health score
     async fn calculate_system_health(
         &self,
@@ -832,15 +788,77 @@ impl Clone for LoxoneStatsCollector {
     }
 }
 
+/// Score of the first (narrowest) band containing `value`, else `fallback`
+fn band_score(bands: &[(f64, f64, f64)], value: f64, fallback: f64) -> f64 {
+    bands
+        .iter()
+        .find(|(low, high, _)| (*low..=*high).contains(&value))
+        .map_or(fallback, |&(_, _, score)| score)
+}
+
+/// Statistics over one room's buffered climate samples
+#[derive(Debug, Clone, Copy, PartialEq)]
+struct ClimateAggregate {
+    min_temperature: f64,
+    max_temperature: f64,
+    avg_temperature: f64,
+    avg_humidity: Option<f64>,
+    /// Share of temperature samples with a comfort index of at least 80
+    comfort_time_percent: f64,
+}
+
+impl ClimateAggregate {
+    /// Aggregate `(timestamp, temperature, humidity)` samples in a single pass
+    ///
+    /// Samples without a positive temperature only count towards the humidity
+    /// average. Returns `None` if no sample has a temperature.
+    fn from_samples(
+        samples: &[(DateTime<Utc>, f64, Option<f64>)],
+        comfort_index: impl Fn(f64, Option<f64>) -> f64,
+    ) -> Option<Self> {
+        let (mut min, mut max) = (f64::INFINITY, f64::NEG_INFINITY);
+        let (mut temp_sum, mut temp_count) = (0.0, 0usize);
+        let (mut humidity_sum, mut humidity_count) = (0.0, 0usize);
+        let mut comfortable = 0usize;
+
+        for &(_, temp, humidity) in samples {
+            if let Some(h) = humidity {
+                humidity_sum += h;
+                humidity_count += 1;
+            }
+            if temp > 0.0 {
+                min = min.min(temp);
+                max = max.max(temp);
+                temp_sum += temp;
+                temp_count += 1;
+                if comfort_index(temp, humidity) >= 80.0 {
+                    comfortable += 1;
+                }
+            }
+        }
+
+        if temp_count == 0 {
+            return None;
+        }
+        Some(Self {
+            min_temperature: min,
+            max_temperature: max,
+            avg_temperature: temp_sum / temp_count as f64,
+            avg_humidity: (humidity_count > 0).then(|| humidity_sum / humidity_count as f64),
+            comfort_time_percent: comfortable as f64 / temp_count as f64 * 100.0,
+        })
+    }
+}
+
 /// Helper function to check if a sensor value represents an "open" state
 #[allow(dead_code)]
 fn is_open_state(value: &serde_json::Value) -> bool {
     match value {
         serde_json::Value::Bool(b) => *b,
         serde_json::Value::Number(n) => n.as_f64().map(|v| v > 0.5).unwrap_or(false),
-        serde_json::Value::String(s) => {
-            matches!(s.to_lowercase().as_str(), "open" | "on" | "true" | "1")
-        }
+        serde_json::Value::String(s) => ["open", "on", "true", "1"]
+            .iter()
+            .any(|open| s.eq_ignore_ascii_case(open)),
         _ => false,
     }
 }
@@ -919,6 +937,48 @@ mod tests {
         assert!(collector.calculate_comfort_index(30.0, Some(80.0)) < 70.0);
     }
 
+    #[test]
+    fn test_band_score() {
+        assert_eq!(band_score(TEMPERATURE_COMFORT_BANDS, 22.0, 40.0), 100.0);
+        assert_eq!(band_score(TEMPERATURE_COMFORT_BANDS, 24.0, 40.0), 100.0);
+        assert_eq!(band_score(TEMPERATURE_COMFORT_BANDS, 17.0, 40.0), 60.0);
+        assert_eq!(band_score(TEMPERATURE_COMFORT_BANDS, 30.0, 40.0), 40.0);
+        assert_eq!(band_score(HUMIDITY_COMFORT_BANDS, 65.0, 60.0), 80.0);
+        assert_eq!(band_score(HUMIDITY_COMFORT_BANDS, f64::NAN, 60.0), 60.0);
+    }
+
+    #[test]
+    fn test_climate_aggregate() {
+        let now = Utc::now();
+        let comfort = |t: f64, _: Option<f64>| if t >= 21.0 { 100.0 } else { 60.0 };
+        let samples = |values: &[(f64, Option<f64>)]| -> Vec<_> {
+            values.iter().map(|&(t, h)| (now, t, h)).collect()
+        };
+
+        assert_eq!(ClimateAggregate::from_samples(&[], comfort), None);
+        assert_eq!(
+            ClimateAggregate::from_samples(&samples(&[(0.0, Some(40.0))]), comfort),
+            None
+        );
+
+        let aggregate = ClimateAggregate::from_samples(
+            &samples(&[
+                (19.5, Some(40.0)),
+                (23.5, None),
+                (0.0, Some(50.0)),
+                (21.0, Some(60.0)),
+                (22.0, None),
+            ]),
+            comfort,
+        )
+        .unwrap();
+        assert_eq!(aggregate.min_temperature, 19.5);
+        assert_eq!(aggregate.max_temperature, 23.5);
+        assert_eq!(aggregate.avg_temperature, 21.5);
+        assert_eq!(aggregate.avg_humidity, Some(50.0));
+        assert_eq!(aggregate.comfort_time_percent, 75.0);
+    }
+
     #[test]
     fn test_is_open_state() {
         assert!(is_open_state(&serde_json::json!(true)));
@@ -1079,32 +1079,34 @@ impl PerformanceAnalyzer {
             return ResourceStatistics::default();
         }
 
-        let cpu_values: Vec<f64> = measurements
-            .iter()
-            .filter_map(|m| m.resource_usage.cpu_usage)
-            .collect();
-
-        let memory_values: Vec<u64> = measurements
-            .iter()
-            .filter_map(|m| m.resource_usage.memory_usage)
-            .collect();
+        // Running sums and peaks, accumulated in one pass over the measurements
+        let (mut cpu_sum, mut cpu_count, mut peak_cpu_usage) = (0.0, 0u64, 0.0f64);
+        let (mut memory_sum, mut memory_count, mut peak_memory_usage) = (0u64, 0u64, 0u64);
+        for usage in measurements.iter().map(|m| &m.resource_usage) {
+            if let Some(cpu) = usage.cpu_usage {
+                cpu_sum += cpu;
+                cpu_count += 1;
+                peak_cpu_usage = peak_cpu_usage.max(cpu);
+            }
+            if let Some(memory) = usage.memory_usage {
+                memory_sum += memory;
+                memory_count += 1;
+                peak_memory_usage = peak_memory_usage.max(memory);
+            }
+        }
 
-        let avg_cpu_usage = if !cpu_values.is_empty() {
-            cpu_values.iter().sum::<f64>() / cpu_values.len() as f64
+        let avg_cpu_usage = if cpu_count > 0 {
+            cpu_sum / cpu_count as f64
         } else {
             0.0
         };
 
-        let peak_cpu_usage = cpu_values.iter().fold(0.0f64, |a, &b| a.max(b));
-
-        let avg_memory_usage = if !memory_values.is_empty() {
-            memory_values.iter().sum::<u64>() / memory_values.len() as u64
+        let avg_memory_usage = if memory_count > 0 {
+            memory_sum / memory_count
         } else {
             0
         };
 
-        let peak_memory_usage = memory_values.iter().fold(0, |a, &b| a.max(b));
-
         ResourceStatistics {
             avg_cpu_usage,
             peak_cpu_usage,
@@ -719,11 +719,10 @@ impl PerformanceProfiler {
         for bottleneck in new_bottlenecks {
             let key = format!("{}:{:?}", bottleneck.location, bottleneck.bottleneck_type);
 
-            if let Some(existing) = bottlenecks.get_mut(&key) {
-                existing.occurrences += 1;
-            } else {
-                bottlenecks.insert(key, bottleneck);
-            }
+            bottlenecks
+                .entry(key)
+                .and_modify(|existing| existing.occurrences += 1)
+                .or_insert(bottleneck);
         }
 
         Ok(())
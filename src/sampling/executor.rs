@@ -8,6 +8,7 @@ use super::response_parser::{DeviceCommand, SamplingResponse};
 use crate::client::ClientContext;
 use crate::error::{LoxoneError, Result};
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::sync::Arc;
 use tracing::{debug, info, warn};
@@ -169,8 +170,9 @@ impl CommandExecutor {
             )));
         }
 
-        let mut results = Vec::new();
+        let mut results = Vec::with_capacity(commands.len());
         let mut approval_required = Vec::new();
+        let mut success_count = 0;
 
         // Refresh device cache if needed
         self.refresh_device_cache().await?;
@@ -195,11 +197,13 @@ impl CommandExecutor {
 
             // Execute individual command
             let result = self.execute_single_command(command, &context).await;
+            if result.success {
+                success_count += 1;
+            }
             results.push(result);
         }
 
         let total_time_ms = start_time.elapsed().as_millis() as u64;
-        let success_count = results.iter().filter(|r| r.success).count();
         let failure_count = results.len() - success_count;
 
         info!(
@@ -365,9 +369,15 @@ impl CommandExecutor {
             }
         }
 
-        // Try fuzzy matching
+        // Try fuzzy matching, against the lowercased names kept in the
+        // device index where available
+        let index = self.client_context.device_index.read().await;
+        let command_lower = command.device.to_lowercase();
         for (uuid, device) in devices.iter() {
-            if self.fuzzy_match(&device.name, &command.device) {
+            let device_lower = index
+                .lower_name(uuid)
+                .map_or_else(|| Cow::Owned(device.name.to_lowercase()), Cow::Borrowed);
+            if Self::fuzzy_match(&device_lower, &command_lower) {
                 // Cache the result
                 self.device_cache
                     .write()
@@ -380,8 +390,12 @@ impl CommandExecutor {
         // Try room-based matching
         if let Some(ref room) = command.room {
             let device_type = self.infer_device_type(&command.device);
+            let room_lower = room.to_lowercase();
             for (uuid, device) in devices.iter() {
-                if device.room.as_ref().map(|r| r.to_lowercase()) == Some(room.to_lowercase())
+                if device
+                    .room
+                    .as_ref()
+                    .is_some_and(|r| r.to_lowercase() == room_lower)
                     && device.device_type.to_lowercase().contains(&device_type)
                 {
                     // Cache the result
@@ -400,13 +414,10 @@ impl CommandExecutor {
         )))
     }
 
-    /// Fuzzy match device names
-    fn fuzzy_match(&self, device_name: &str, command_name: &str) -> bool {
-        let device_lower = device_name.to_lowercase();
-        let command_lower = command_name.to_lowercase();
-
+    /// Fuzzy match already lowercased device and command names
+    fn fuzzy_match(device_lower: &str, command_lower: &str) -> bool {
         // Check if command name contains device name or vice versa
-        device_lower.contains(&command_lower) || command_lower.contains(&device_lower)
+        device_lower.contains(command_lower) || command_lower.contains(device_lower)
     }
 
     /// Infer device type from device name
@@ -646,6 +657,35 @@ mod tests {
         assert_eq!(uuid, "test-uuid");
     }
 
+    #[tokio::test]
+    async fn test_fuzzy_device_resolution() {
+        let client_context = Arc::new(ClientContext::new());
+        client_context.devices.write().await.insert(
+            "kitchen-uuid".to_string(),
+            LoxoneDevice {
+                uuid: "kitchen-uuid".to_string(),
+                name: "Kitchen Ceiling Light".to_string(),
+                device_type: "LightControllerV2".to_string(),
+                room: Some("Kitchen".to_string()),
+                states: HashMap::new(),
+                category: "lights".to_string(),
+                sub_controls: HashMap::new(),
+            },
+        );
+
+        let executor = CommandExecutor::new(client_context);
+        let command = DeviceCommand {
+            device: "ceiling light".to_string(),
+            action: "on".to_string(),
+            value: None,
+            room: None,
+            confidence: 0.9,
+        };
+
+        let uuid = executor.resolve_device_uuid(&command).await.unwrap();
+        assert_eq!(uuid, "kitchen-uuid");
+    }
+
     #[tokio::test]
     async fn test_safety_rules() {
         let client_context = Arc::new(ClientContext::new());
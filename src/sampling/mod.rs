@@ -16,6 +16,21 @@ pub mod service;
 use crate::error::Result;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::fmt::Write;
+
+/// System prompt every home automation sampling request starts from
+const AUTOMATION_SYSTEM_PROMPT: &str = "You are an intelligent home automation assistant for a Loxone system. \
+    Analyze the current home state and provide specific, actionable automation recommendations. \
+    Consider user preferences, time of day, weather, and energy efficiency. \
+    Respond with clear device control suggestions using available Loxone commands.";
+
+/// Context data keys and the headings they are rendered under, in prompt order
+const CONTEXT_SECTIONS: [(&str, &str); 4] = [
+    ("rooms", "Available Rooms"),
+    ("devices", "Lighting Devices"),
+    ("sensors", "Temperature Readings"),
+    ("weather", "Weather Data"),
+];
 
 /// MCP Sampling request message content
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -232,10 +247,7 @@ impl AutomationSamplingBuilder {
     /// Create new builder with home automation system prompt
     pub fn new() -> Self {
         Self {
-            system_prompt: "You are an intelligent home automation assistant for a Loxone system. \
-                           Analyze the current home state and provide specific, actionable automation recommendations. \
-                           Consider user preferences, time of day, weather, and energy efficiency. \
-                           Respond with clear device control suggestions using available Loxone commands.".to_string(),
+            system_prompt: AUTOMATION_SYSTEM_PROMPT.to_string(),
             context_data: HashMap::new(),
         }
     }
@@ -318,13 +330,13 @@ impl AutomationSamplingBuilder {
 
         let mut event_description = format!("I'm preparing for a {event_type}");
         if let Some(room) = room {
-            event_description.push_str(&format!(" in the {room}"));
+            let _ = write!(event_description, " in the {room}");
         }
         if let Some(duration) = duration {
-            event_description.push_str(&format!(" lasting {duration}"));
+            let _ = write!(event_description, " lasting {duration}");
         }
         if let Some(guest_count) = guest_count {
-            event_description.push_str(&format!(" with {guest_count} guests"));
+            let _ = write!(event_description, " with {guest_count} guests");
         }
 
         let user_message = SamplingMessage::user(format!(
@@ -357,37 +369,21 @@ impl AutomationSamplingBuilder {
 
     /// Build context text from available data
     pub fn build_context_text(&self) -> Result<String> {
-        let mut context_parts = Vec::new();
-
-        if let Some(rooms) = self.context_data.get("rooms") {
-            context_parts.push(format!(
-                "Available Rooms:\n{}",
-                serde_json::to_string_pretty(rooms).unwrap_or_default()
-            ));
-        }
-
-        if let Some(devices) = self.context_data.get("devices") {
-            context_parts.push(format!(
-                "Lighting Devices:\n{}",
-                serde_json::to_string_pretty(devices).unwrap_or_default()
-            ));
-        }
-
-        if let Some(sensors) = self.context_data.get("sensors") {
-            context_parts.push(format!(
-                "Temperature Readings:\n{}",
-                serde_json::to_string_pretty(sensors).unwrap_or_default()
-            ));
-        }
-
-        if let Some(weather) = self.context_data.get("weather") {
-            context_parts.push(format!(
-                "Weather Data:\n{}",
-                serde_json::to_string_pretty(weather).unwrap_or_default()
-            ));
+        let mut context = String::new();
+        for (key, heading) in CONTEXT_SECTIONS {
+            if let Some(data) = self.context_data.get(key) {
+                if !context.is_empty() {
+                    context.push_str("\n\n");
+                }
+                let _ = write!(
+                    context,
+                    "{heading}:\n{}",
+                    serde_json::to_string_pretty(data).unwrap_or_default()
+                );
+            }
         }
 
-        Ok(context_parts.join("\n\n"))
+        Ok(context)
     }
 }
 
@@ -4,10 +4,19 @@
 //! for home automation execution.
 
 use crate::error::Result;
+use regex::Regex;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::sync::OnceLock;
 use tracing::debug;
 
+/// Temperature value with an optional degree/unit suffix
+static TEMPERATURE_VALUE_REGEX: OnceLock<Regex> = OnceLock::new();
+/// Number followed by a percent sign
+static PERCENTAGE_VALUE_REGEX: OnceLock<Regex> = OnceLock::new();
+/// Any bare number
+static NUMBER_REGEX: OnceLock<Regex> = OnceLock::new();
+
 /// Parsed sampling response with extracted commands
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct SamplingResponse {
@@ -53,8 +62,11 @@ pub struct Recommendation {
 
 /// Command extractor for parsing sampling responses
 pub struct CommandExtractor {
-    /// Device name patterns for recognition
-    device_patterns: HashMap<String, Vec<String>>,
+    /// Device name patterns compiled into one alternation, one capture
+    /// group per entry of `device_types`
+    device_matcher: Regex,
+    /// Device type for each capture group of `device_matcher`
+    device_types: Vec<String>,
     /// Action patterns for recognition
     action_patterns: HashMap<String, Vec<String>>,
     /// Room name patterns
@@ -178,8 +190,11 @@ impl Default for CommandExtractor {
             "attic".to_string(),
         ];
 
+        let (device_matcher, device_types) = compile_device_patterns(&device_patterns);
+
         Self {
-            device_patterns,
+            device_matcher,
+            device_types,
             action_patterns,
             room_patterns,
         }
@@ -237,24 +252,11 @@ impl CommandExtractor {
     fn parse_command_line(&self, line: &str) -> Option<DeviceCommand> {
         let line_lower = line.to_lowercase();
 
-        // Find device type
-        let mut device_type = None;
-        let mut device_match = None;
-
-        for (dev_type, patterns) in &self.device_patterns {
-            for pattern in patterns {
-                if line_lower.contains(pattern) {
-                    device_type = Some(dev_type.clone());
-                    device_match = Some(pattern.clone());
-                    break;
-                }
-            }
-            if device_type.is_some() {
-                break;
-            }
-        }
-
-        let device_type = device_type?;
+        // Find device type with a single scan over all device patterns
+        let captures = self.device_matcher.captures(&line_lower)?;
+        let group = captures.iter().skip(1).position(|group| group.is_some())?;
+        let device_type = self.device_types[group].clone();
+        let device_match = captures[0].to_string();
 
         // Find action
         let mut action = None;
@@ -279,7 +281,7 @@ impl CommandExtractor {
         let value = self.extract_value(line, &action);
 
         // Calculate confidence based on pattern matches
-        let confidence = self.calculate_command_confidence(line, &device_match.unwrap_or_default());
+        let confidence = self.calculate_command_confidence(line, &line_lower, &device_match);
 
         Some(DeviceCommand {
             device: device_name,
@@ -331,10 +333,9 @@ impl CommandExtractor {
 
     /// Extract temperature value from text
     fn extract_temperature_value(&self, text: &str) -> Option<String> {
-        use regex::Regex;
-
-        // Pattern for temperature values
-        let re = Regex::new(r"(\d+(?:\.\d+)?)\s*°?[CcFf]?").ok()?;
+        let re = TEMPERATURE_VALUE_REGEX.get_or_init(|| {
+            Regex::new(r"(\d+(?:\.\d+)?)\s*°?[CcFf]?").expect("Invalid temperature value regex")
+        });
 
         if let Some(caps) = re.captures(text)
             && let Some(temp_match) = caps.get(1)
@@ -342,7 +343,7 @@ impl CommandExtractor {
             let temp_str = temp_match.as_str();
 
             // Check if it's Fahrenheit and convert
-            if (text.to_lowercase().contains('f') || text.to_lowercase().contains("fahrenheit"))
+            if text.contains(['f', 'F'])
                 && let Ok(f) = temp_str.parse::<f32>()
             {
                 let c = (f - 32.0) * 5.0 / 9.0;
@@ -357,16 +358,16 @@ impl CommandExtractor {
 
     /// Extract percentage value from text
     fn extract_percentage_value(&self, text: &str) -> Option<String> {
-        use regex::Regex;
-
-        let re = Regex::new(r"(\d+)\s*%").ok()?;
+        let re = PERCENTAGE_VALUE_REGEX
+            .get_or_init(|| Regex::new(r"(\d+)\s*%").expect("Invalid percentage regex"));
 
         if let Some(caps) = re.captures(text) {
             return caps.get(1).map(|m| m.as_str().to_string());
         }
 
         // Look for numeric values that could be percentages
-        let re_num = Regex::new(r"(\d+)").ok()?;
+        let re_num =
+            NUMBER_REGEX.get_or_init(|| Regex::new(r"(\d+)").expect("Invalid number regex"));
         if let Some(caps) = re_num.captures(text)
             && let Some(num_str) = caps.get(1).map(|m| m.as_str())
             && let Ok(num) = num_str.parse::<u32>()
@@ -563,14 +564,16 @@ impl CommandExtractor {
     }
 
     /// Calculate confidence for a single command
-    fn calculate_command_confidence(&self, line: &str, _pattern: &str) -> f32 {
+    ///
+    /// `line_lower` is the lowercased line the caller already matched against.
+    fn calculate_command_confidence(&self, line: &str, line_lower: &str, _pattern: &str) -> f32 {
         let mut confidence: f32 = 0.5; // Base confidence
 
         // Boost for clear device names
         if self
             .room_patterns
             .iter()
-            .any(|room| line.to_lowercase().contains(room))
+            .any(|room| line_lower.contains(room.as_str()))
         {
             confidence += 0.2;
         }
@@ -581,7 +584,7 @@ impl CommandExtractor {
         }
 
         // Boost for strong action verbs
-        if line.to_lowercase().contains("turn on") || line.to_lowercase().contains("set to") {
+        if line_lower.contains("turn on") || line_lower.contains("set to") {
             confidence += 0.1;
         }
 
@@ -612,6 +615,23 @@ impl CommandExtractor {
     }
 }
 
+/// Compile device patterns into one regex alternation
+///
+/// Each device type becomes a capture group of its escaped patterns, so a
+/// single search finds the first device mention in a line and the index of
+/// the matching group identifies its type.
+fn compile_device_patterns(patterns: &HashMap<String, Vec<String>>) -> (Regex, Vec<String>) {
+    let mut device_types = Vec::with_capacity(patterns.len());
+    let mut groups = Vec::with_capacity(patterns.len());
+    for (device_type, variations) in patterns {
+        let alternatives: Vec<String> = variations.iter().map(|v| regex::escape(v)).collect();
+        groups.push(format!("({})", alternatives.join("|")));
+        device_types.push(device_type.clone());
+    }
+    let matcher = Regex::new(&groups.join("|")).expect("Invalid device pattern regex");
+    (matcher, device_types)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -646,6 +666,38 @@ mod tests {
         assert_eq!(command.room, Some("Living Room".to_string()));
     }
 
+    #[test]
+    fn test_parse_command_line_device_types() {
+        let extractor = CommandExtractor::default();
+
+        let command = extractor
+            .parse_command_line("Close the kitchen rolladen")
+            .unwrap();
+        assert_eq!(command.device, "Kitchen Blind");
+        assert_eq!(command.action, "down");
+
+        let command = extractor.parse_command_line("Mute the speaker").unwrap();
+        assert_eq!(command.device, "Audio");
+
+        assert!(extractor.parse_command_line("Nothing to do here").is_none());
+    }
+
+    #[test]
+    fn test_parse_command_line_action_priority() {
+        let extractor = CommandExtractor::default();
+
+        // Actions are tried in list order, so a keyword hidden in an earlier
+        // word ("up" in "upstairs") does not win over the intended action
+        let command = extractor
+            .parse_command_line("In the upstairs office, close the blinds")
+            .unwrap();
+        assert_eq!(command.action, "down");
+        assert_eq!(command.room, Some("Office".to_string()));
+
+        let command = extractor.parse_command_line("Mute the speaker").unwrap();
+        assert_eq!(command.action, "mute");
+    }
+
     #[test]
     fn test_extract_recommendations() {
         let extractor = CommandExtractor::default();
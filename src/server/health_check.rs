@@ -169,34 +169,44 @@ impl HealthChecker {
         let start_time = Instant::now();
         info!("🔍 Starting comprehensive health check");
 
-        let mut checks = Vec::new();
-
+        // The checks are independent, so they run concurrently; the report
+        // lists them in their usual order:
         // 1. Basic connectivity check
-        checks.push(self.check_connectivity().await);
-
         // 2. System information check
-        checks.push(self.check_system_info().await);
-
         // 3. Structure availability check
-        checks.push(self.check_structure().await);
-
         // 4. Performance monitoring (if enabled)
-        if self.config.enable_performance_monitoring {
-            checks.push(self.check_performance().await);
-        }
-
         // 5. Device sampling (if enabled)
-        if self.config.enable_device_sampling {
-            checks.push(self.check_device_sampling().await);
-        }
-
         // 6. Memory and resource usage
-        checks.push(self.check_resources().await);
+        let (connectivity, system_info, structure, performance, sampling, resources) = tokio::join!(
+            self.check_connectivity(),
+            self.check_system_info(),
+            self.check_structure(),
+            async {
+                if self.config.enable_performance_monitoring {
+                    Some(self.check_performance().await)
+                } else {
+                    None
+                }
+            },
+            async {
+                if self.config.enable_device_sampling {
+                    Some(self.check_device_sampling().await)
+                } else {
+                    None
+                }
+            },
+            self.check_resources(),
+        );
+
+        let mut checks = vec![connectivity, system_info, structure];
+        checks.extend(performance);
+        checks.extend(sampling);
+        checks.push(resources);
 
         // Calculate overall status and metrics
         let overall_response_time_ms = start_time.elapsed().as_millis() as u64;
-        let overall_status = self.calculate_overall_status(&checks);
         let summary = self.generate_summary(&checks, overall_response_time_ms);
+        let overall_status = self.calculate_overall_status(&summary);
 
         let report = HealthReport {
             overall_status,
@@ -509,32 +519,19 @@ impl HealthChecker {
         .with_metadata("memory_test_passed".to_string(), serde_json::json!(true))
     }
 
-    /// Calculate overall status from individual checks
-    fn calculate_overall_status(&self, checks: &[HealthCheckResult]) -> HealthStatus {
-        if checks.is_empty() {
+    /// Calculate overall status from the per-status counts of the summary
+    fn calculate_overall_status(&self, summary: &HealthSummary) -> HealthStatus {
+        if summary.total_checks == 0 {
             return HealthStatus::Critical;
         }
 
-        let mut critical_count = 0;
-        let mut unhealthy_count = 0;
-        let mut degraded_count = 0;
-        let mut _healthy_count = 0;
-
-        for check in checks {
-            match check.status {
-                HealthStatus::Critical => critical_count += 1,
-                HealthStatus::Unhealthy => unhealthy_count += 1,
-                HealthStatus::Degraded => degraded_count += 1,
-                HealthStatus::Healthy => _healthy_count += 1,
-            }
-        }
-
         // Determine overall status based on check results
-        if critical_count > 0 {
+        if summary.critical_checks > 0 {
             HealthStatus::Critical
-        } else if unhealthy_count > checks.len() / 2 {
+        } else if summary.unhealthy_checks > summary.total_checks / 2 {
             HealthStatus::Unhealthy
-        } else if unhealthy_count > 0 || degraded_count > checks.len() / 2 {
+        } else if summary.unhealthy_checks > 0 || summary.degraded_checks > summary.total_checks / 2
+        {
             HealthStatus::Degraded
         } else {
             HealthStatus::Healthy
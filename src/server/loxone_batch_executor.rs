@@ -1,22 +1,62 @@
 //! Loxone-specific implementation of BatchExecutor for request coalescing
 
 use super::request_coalescing::BatchExecutor;
-use crate::client::LoxoneClient;
+use crate::client::{LoxoneClient, LoxoneStructure};
 use crate::error::Result;
 use serde_json::Value;
 use std::collections::HashMap;
 use std::sync::Arc;
+use std::time::{Duration, Instant};
+use tokio::sync::Mutex;
 use tracing::{debug, warn};
 
+/// How long a fetched structure is reused by the following batches
+const STRUCTURE_CACHE_TTL: Duration = Duration::from_secs(5);
+
+/// Sensor type names (English, German) and the unit their values are reported in
+const SENSOR_UNITS: &[(&str, &str, &str)] = &[
+    ("temperature", "temperatur", "°C"),
+    ("humidity", "feuchtigkeit", "%"),
+    ("brightness", "helligkeit", "lux"),
+    ("pressure", "druck", "hPa"),
+    ("windspeed", "windgeschwindigkeit", "km/h"),
+    ("precipitation", "niederschlag", "mm"),
+    ("energy", "energie", "kWh"),
+    ("power", "leistung", "W"),
+    ("voltage", "spannung", "V"),
+    ("current", "strom", "A"),
+];
+
 /// Loxone-specific batch executor implementation
 pub struct LoxoneBatchExecutor {
     client: Arc<dyn LoxoneClient + Send + Sync>,
+    /// Last fetched structure and when it was read; holding the lock while
+    /// fetching lets concurrent batches share one download
+    structure_cache: Mutex<Option<(Instant, Arc<LoxoneStructure>)>>,
 }
 
 impl LoxoneBatchExecutor {
     /// Create a new Loxone batch executor
     pub fn new(client: Arc<dyn LoxoneClient + Send + Sync>) -> Self {
-        Self { client }
+        Self {
+            client,
+            structure_cache: Mutex::new(None),
+        }
+    }
+
+    /// Structure fetched within [`STRUCTURE_CACHE_TTL`], or a fresh one
+    async fn structure(&self) -> Result<Arc<LoxoneStructure>> {
+        let mut cached = self.structure_cache.lock().await;
+        if let Some((read_at, structure)) = cached.as_ref()
+            && read_at.elapsed() < STRUCTURE_CACHE_TTL
+        {
+            debug!("Reusing structure fetched for an earlier batch");
+            return Ok(Arc::clone(structure));
+        }
+
+        let structure = Arc::new(self.client.get_structure().await?);
+        *cached = Some((Instant::now(), Arc::clone(&structure)));
+        Ok(structure)
     }
 
     /// Helper method to get device states efficiently
@@ -26,11 +66,15 @@ impl LoxoneBatchExecutor {
     ) -> Result<HashMap<String, Value>> {
         debug!("Fetching states for {} devices", device_uuids.len());
 
-        // Get the structure first to validate devices exist
-        let structure = self.client.get_structure().await?;
+        // The structure (to validate devices exist) and the batched states
+        // are independent requests, so fetch them concurrently
+        let (structure, states) = tokio::join!(
+            self.structure(),
+            self.client.get_device_states(device_uuids)
+        );
+        let structure = structure?;
 
-        // Use the batched get_device_states method
-        match self.client.get_device_states(device_uuids).await {
+        match states {
             Ok(states) => {
                 let mut results = HashMap::new();
 
@@ -89,7 +133,7 @@ impl LoxoneBatchExecutor {
     ) -> Result<HashMap<String, Vec<Value>>> {
         debug!("Fetching devices for {} rooms", room_uuids.len());
 
-        let structure = self.client.get_structure().await?;
+        let structure = self.structure().await?;
         let mut results = HashMap::new();
 
         for room_uuid in room_uuids {
@@ -132,10 +176,14 @@ impl LoxoneBatchExecutor {
     ) -> Result<HashMap<String, Value>> {
         debug!("Fetching readings for {} sensors", sensor_uuids.len());
 
-        let structure = self.client.get_structure().await?;
+        // Fetch the structure and the batched sensor states concurrently
+        let (structure, states) = tokio::join!(
+            self.structure(),
+            self.client.get_device_states(sensor_uuids)
+        );
+        let structure = structure?;
 
-        // Use the batched get_device_states method for sensors too
-        match self.client.get_device_states(sensor_uuids).await {
+        match states {
             Ok(states) => {
                 let mut results = HashMap::new();
 
@@ -194,20 +242,14 @@ impl LoxoneBatchExecutor {
     }
 
     /// Get the appropriate unit for a sensor type
-    fn get_sensor_unit(&self, sensor_type: &str) -> Option<String> {
-        match sensor_type.to_lowercase().as_str() {
-            "temperature" | "temperatur" => Some("°C".to_string()),
-            "humidity" | "feuchtigkeit" => Some("%".to_string()),
-            "brightness" | "helligkeit" => Some("lux".to_string()),
-            "pressure" | "druck" => Some("hPa".to_string()),
-            "windspeed" | "windgeschwindigkeit" => Some("km/h".to_string()),
-            "precipitation" | "niederschlag" => Some("mm".to_string()),
-            "energy" | "energie" => Some("kWh".to_string()),
-            "power" | "leistung" => Some("W".to_string()),
-            "voltage" | "spannung" => Some("V".to_string()),
-            "current" | "strom" => Some("A".to_string()),
-            _ => None,
-        }
+    fn get_sensor_unit(&self, sensor_type: &str) -> Option<&'static str> {
+        SENSOR_UNITS
+            .iter()
+            .find(|(english, german, _)| {
+                sensor_type.eq_ignore_ascii_case(english)
+                    || sensor_type.eq_ignore_ascii_case(german)
+            })
+            .map(|&(_, _, unit)| unit)
     }
 
     /// Helper method to get multiple structure information types
@@ -217,11 +259,40 @@ impl LoxoneBatchExecutor {
     ) -> Result<HashMap<String, Value>> {
         debug!("Fetching structure info for {} types", info_types.len());
 
+        let wants_structure = info_types
+            .iter()
+            .any(|t| matches!(t.as_str(), "rooms" | "categories" | "controls"));
+        let wants_system_info = info_types
+            .iter()
+            .any(|t| matches!(t.as_str(), "system_info" | "version"));
+
+        // Every structure-backed type reads the same file, so fetch it once
+        // rather than per type, concurrently with the system info
+        let (structure, system_info) = tokio::join!(
+            async {
+                if wants_structure {
+                    self.structure().await.map_err(|e| e.to_string())
+                } else {
+                    Err("Structure not requested".to_string())
+                }
+            },
+            async {
+                if wants_system_info {
+                    self.client
+                        .get_system_info()
+                        .await
+                        .map_err(|e| e.to_string())
+                } else {
+                    Err("System info not requested".to_string())
+                }
+            }
+        );
+
         let mut results = HashMap::new();
 
         for info_type in info_types {
             match info_type.as_str() {
-                "rooms" => match self.client.get_structure().await {
+                "rooms" => match &structure {
                     Ok(structure) => {
                         let rooms: Vec<Value> = structure.rooms
                                 .values()
@@ -247,7 +318,7 @@ impl LoxoneBatchExecutor {
                     }
                 },
 
-                "categories" => match self.client.get_structure().await {
+                "categories" => match &structure {
                     Ok(structure) => {
                         let categories: Vec<Value> = structure.cats
                                 .values()
@@ -274,7 +345,7 @@ impl LoxoneBatchExecutor {
                     }
                 },
 
-                "controls" => match self.client.get_structure().await {
+                "controls" => match &structure {
                     Ok(structure) => {
                         let controls: Vec<Value> = structure.controls
                                 .values()
@@ -302,9 +373,9 @@ impl LoxoneBatchExecutor {
                     }
                 },
 
-                "system_info" | "version" => match self.client.get_system_info().await {
+                "system_info" | "version" => match &system_info {
                     Ok(system_info) => {
-                        results.insert(info_type.clone(), system_info);
+                        results.insert(info_type.clone(), system_info.clone());
                     }
                     Err(e) => {
                         results.insert(
@@ -401,9 +472,11 @@ mod tests {
     use crate::client::{LoxoneResponse, LoxoneStructure};
     use async_trait::async_trait;
     use std::collections::HashMap;
+    use std::sync::atomic::{AtomicUsize, Ordering};
 
     struct MockLoxoneClient {
         structure: LoxoneStructure,
+        structure_fetches: AtomicUsize,
     }
 
     impl MockLoxoneClient {
@@ -445,6 +518,7 @@ mod tests {
                     cats: HashMap::new(),
                     global_states: HashMap::new(),
                 },
+                structure_fetches: AtomicUsize::new(0),
             }
         }
     }
@@ -464,6 +538,7 @@ mod tests {
         }
 
         async fn get_structure(&self) -> Result<LoxoneStructure> {
+            self.structure_fetches.fetch_add(1, Ordering::Relaxed);
             Ok(self.structure.clone())
         }
 
@@ -579,16 +654,31 @@ mod tests {
         assert_eq!(rooms.as_array().unwrap().len(), 1);
     }
 
+    #[tokio::test]
+    async fn test_structure_reused_across_batches() {
+        let client = Arc::new(MockLoxoneClient::new());
+        let executor = LoxoneBatchExecutor::new(client.clone());
+
+        executor
+            .execute_device_state_batch(vec!["device1".to_string()])
+            .await
+            .unwrap();
+        executor
+            .execute_room_devices_batch(vec!["room1".to_string()])
+            .await
+            .unwrap();
+
+        assert_eq!(client.structure_fetches.load(Ordering::Relaxed), 1);
+    }
+
     #[test]
     fn test_sensor_unit_detection() {
         let client = Arc::new(MockLoxoneClient::new());
         let executor = LoxoneBatchExecutor::new(client);
 
-        assert_eq!(
-            executor.get_sensor_unit("temperature"),
-            Some("°C".to_string())
-        );
-        assert_eq!(executor.get_sensor_unit("humidity"), Some("%".to_string()));
+        assert_eq!(executor.get_sensor_unit("temperature"), Some("°C"));
+        assert_eq!(executor.get_sensor_unit("Helligkeit"), Some("lux"));
+        assert_eq!(executor.get_sensor_unit("humidity"), Some("%"));
         assert_eq!(executor.get_sensor_unit("unknown"), None);
     }
 }
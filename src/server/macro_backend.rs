@@ -7,13 +7,124 @@
 //! - Parameter validation
 //! - Error handling
 
-use crate::client::{ClientContext, LoxoneClient, LoxoneStructure};
+use crate::client::device_index::{CLIMATE_TYPES, SCENE_TYPES};
+use crate::client::{ClientContext, DeviceIndex, LoxoneClient, LoxoneResponse, LoxoneStructure};
 use crate::config::ServerConfig;
+use crate::error::LoxoneError;
 use crate::services::{StateManager, UnifiedValueResolver};
+use futures::future::{self, BoxFuture, FutureExt, Shared};
+use futures::stream::{self, StreamExt};
 use pulseengine_mcp_macros::{mcp_server, mcp_tools};
 use serde_json::{Value, json};
+use std::borrow::Cow;
+use std::collections::{HashMap, HashSet};
+use std::ops::Deref;
 use std::sync::Arc;
-use tracing::{info, warn};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::time::{Duration, Instant};
+use tokio::sync::{Mutex, RwLock, RwLockReadGuard};
+use tracing::{debug, info, warn};
+
+/// Maximum number of commands in flight when one tool targets several devices
+const MAX_CONCURRENT_COMMANDS: usize = 8;
+
+/// Longest a single Miniserver request may take before a tool gives up on it
+const COMMAND_TIMEOUT: Duration = Duration::from_secs(5);
+
+/// How long a live device state is reused before it is read again
+const STATE_CACHE_TTL: Duration = Duration::from_secs(2);
+
+/// How long the loaded structure is used before it is downloaded again
+const STRUCTURE_TTL: Duration = Duration::from_secs(300);
+
+/// Lowercase a user-supplied keyword (action, mode, scope) for matching
+///
+/// Keywords are nearly always short lowercase ASCII, which is borrowed as-is;
+/// only input with non-ASCII characters takes the full Unicode lowercasing.
+fn normalize_keyword(input: &str) -> Cow<'_, str> {
+    if !input.is_ascii() {
+        Cow::Owned(input.to_lowercase())
+    } else if input.bytes().any(|b| b.is_ascii_uppercase()) {
+        Cow::Owned(input.to_ascii_lowercase())
+    } else {
+        Cow::Borrowed(input)
+    }
+}
+
+/// Read the indexed structure, failing the tool if none has been loaded
+///
+/// The guard is narrowed to the structure itself so callers do not repeat
+/// the `Option` check. Callers hold it only while they read from the
+/// structure and release it before awaiting anything else, so a structure
+/// reload never waits on a device request or another cache.
+async fn loaded_structure(
+    context: &ClientContext,
+) -> std::result::Result<RwLockReadGuard<'_, LoxoneStructure>, String> {
+    RwLockReadGuard::try_map(context.structure.read().await, Option::as_ref)
+        .map_err(|_| "Structure not loaded".to_string())
+}
+
+/// Tool output rendered from the structure, tagged with the structure revision
+#[derive(Debug, Clone)]
+struct CachedSummary {
+    revision: u64,
+    value: Arc<Value>,
+}
+
+/// Live device state read from the Miniserver, tagged with the command epoch
+#[derive(Debug, Clone)]
+struct CachedState {
+    epoch: u64,
+    read_at: Instant,
+    value: Value,
+}
+
+/// Client used by a tool that sends commands, dereferencing to the client
+///
+/// Dropping it bumps the command epoch, so a state read that raced the
+/// commands cannot be served from the cache once they completed.
+struct CommandClient<'a> {
+    client: &'a Arc<dyn LoxoneClient>,
+    epoch: &'a AtomicU64,
+}
+
+impl Deref for CommandClient<'_> {
+    type Target = Arc<dyn LoxoneClient>;
+
+    fn deref(&self) -> &Self::Target {
+        self.client
+    }
+}
+
+impl Drop for CommandClient<'_> {
+    fn drop(&mut self) {
+        self.epoch.fetch_add(1, Ordering::AcqRel);
+    }
+}
+
+/// Live state read shared by every call waiting on the same UUIDs
+type StateRead = Shared<BoxFuture<'static, Arc<HashMap<String, Value>>>>;
+
+/// Live state read in flight, tagged with the command epoch it was started in
+#[derive(Clone)]
+struct InFlightRead {
+    id: u64,
+    epoch: u64,
+    read: StateRead,
+}
+
+/// Find the mood of a scene controller whose name contains `scene_lower`
+fn match_mood(control: &Value, scene_lower: &str) -> Option<String> {
+    control
+        .get("moods")
+        .and_then(|moods| moods.as_object())?
+        .iter()
+        .find(|(_, v)| {
+            v.as_str()
+                .is_some_and(|s| s.to_lowercase().contains(scene_lower))
+        })
+        .map(|(id, _)| id.clone())
+}
 
 /// Loxone MCP Server with macro-based tool definitions
 ///
@@ -36,6 +147,18 @@ pub struct LoxoneMcpServer {
     state_manager: Option<Arc<StateManager>>,
     /// Server configuration (for future use)
     config: Option<ServerConfig>,
+    /// Rendered structure summaries keyed by tool
+    summary_cache: Arc<RwLock<HashMap<&'static str, CachedSummary>>>,
+    /// Recently read live device states keyed by UUID
+    state_cache: Arc<RwLock<HashMap<String, CachedState>>>,
+    /// Bumped whenever a tool sends commands, invalidating cached states
+    command_epoch: Arc<AtomicU64>,
+    /// Live state reads in flight keyed by UUID, joined by concurrent calls
+    in_flight_reads: Arc<Mutex<HashMap<String, InFlightRead>>>,
+    /// Identifies each live state read so it only clears its own entries
+    next_read_id: Arc<AtomicU64>,
+    /// Held while the structure is loaded so concurrent first calls share one download
+    structure_load_lock: Arc<Mutex<()>>,
 }
 
 impl LoxoneMcpServer {
@@ -54,15 +177,23 @@ impl LoxoneMcpServer {
             value_resolver: Some(value_resolver),
             state_manager,
             config: Some(config),
+            summary_cache: Arc::default(),
+            state_cache: Arc::default(),
+            command_epoch: Arc::default(),
+            in_flight_reads: Arc::default(),
+            next_read_id: Arc::default(),
+            structure_load_lock: Arc::default(),
         }
     }
 
     /// Check if connected to Loxone
-    fn ensure_connected(&self) -> std::result::Result<(), String> {
-        if self.client.is_none() {
-            return Err("Server not initialized with Loxone client".to_string());
-        }
-        Ok(())
+    ///
+    /// Every tool starts with this guard; read-only tools use the returned
+    /// client directly instead of looking it up a second time.
+    fn ensure_connected(&self) -> std::result::Result<&Arc<dyn LoxoneClient>, String> {
+        self.client
+            .as_ref()
+            .ok_or_else(|| "Server not initialized with Loxone client".to_string())
     }
 
     /// Get the Loxone client
@@ -72,33 +203,168 @@ impl LoxoneMcpServer {
             .ok_or_else(|| "Client not initialized".to_string())
     }
 
-    /// Resolve a room name to its UUID by searching the structure's rooms.
-    /// Returns None if no matching room is found.
-    fn resolve_room_uuid(structure: &LoxoneStructure, room_name: &str) -> Option<String> {
-        let lower = room_name.to_lowercase();
-        for (uuid, room) in &structure.rooms {
-            if let Some(name) = room.get("name").and_then(|v| v.as_str())
-                && (name.to_lowercase() == lower || name.to_lowercase().contains(&lower))
+    /// Get the Loxone client for sending commands
+    ///
+    /// Commands can change any device, so cached live states are invalidated
+    /// before the client is handed out and again once the returned guard is
+    /// dropped after the commands completed.
+    fn command_client(&self) -> std::result::Result<CommandClient<'_>, String> {
+        let client = self.get_client()?;
+        self.command_epoch.fetch_add(1, Ordering::AcqRel);
+        Ok(CommandClient {
+            client,
+            epoch: &self.command_epoch,
+        })
+    }
+
+    /// Return the shared context, loading and indexing the structure on first use.
+    ///
+    /// Tools that select devices by role read the precomputed
+    /// [`DeviceIndex`](crate::client::DeviceIndex) instead of rescanning every
+    /// control of a freshly downloaded structure file. The structure is
+    /// downloaded again once it is older than [`STRUCTURE_TTL`], so devices
+    /// added or renamed in Loxone Config show up without a reconnect; it is
+    /// only re-indexed when its modification timestamp changed.
+    async fn indexed_context(&self) -> std::result::Result<&Arc<ClientContext>, String> {
+        let context = self
+            .context
+            .as_ref()
+            .ok_or_else(|| "Client context not initialized".to_string())?;
+        if context.structure.read().await.is_some() && !context.needs_refresh(STRUCTURE_TTL).await {
+            return Ok(context);
+        }
+
+        // Calls arriving while the structure downloads wait for that download
+        let _load_guard = self.structure_load_lock.lock().await;
+        let loaded = context.structure.read().await.is_some();
+        if loaded && !context.needs_refresh(STRUCTURE_TTL).await {
+            return Ok(context);
+        }
+
+        let structure = match self.get_client()?.get_structure().await {
+            Ok(structure) => structure,
+            Err(e) if loaded => {
+                // Retry after another TTL instead of on every call while the
+                // Miniserver is unreachable
+                warn!("Failed to refresh structure, keeping the loaded one: {e}");
+                *context.last_update.write().await = Some(chrono::Utc::now());
+                return Ok(context);
+            }
+            Err(e) => return Err(format!("Failed to get structure: {e}")),
+        };
+        let unchanged = context
+            .structure
+            .read()
+            .await
+            .as_ref()
+            .is_some_and(|current| current.last_modified == structure.last_modified);
+        if unchanged {
+            // Keep the index and every revision-keyed summary
+            *context.last_update.write().await = Some(chrono::Utc::now());
+        } else {
+            context
+                .update_structure(structure)
+                .await
+                .map_err(|e| format!("Failed to index structure: {e}"))?;
+        }
+        Ok(context)
+    }
+
+    /// Return a summary rendered earlier if the structure has not changed since.
+    ///
+    /// Summaries depend on nothing but the structure, and every structure
+    /// update bumps the revision, so an entry stays valid until then.
+    async fn cached_summary(
+        &self,
+        context: &ClientContext,
+        key: &'static str,
+    ) -> Option<Arc<Value>> {
+        let cache = self.summary_cache.read().await;
+        let entry = cache.get(key)?;
+        if entry.revision == context.revision() {
+            debug!("Serving cached {key} summary");
+            Some(Arc::clone(&entry.value))
+        } else {
+            None
+        }
+    }
+
+    /// Remember a rendered summary for the structure revision it was built from.
+    ///
+    /// The summary is shared with the cache rather than copied into it.
+    async fn store_summary(&self, revision: u64, key: &'static str, value: Value) -> Arc<Value> {
+        let value = Arc::new(value);
+        self.summary_cache.write().await.insert(
+            key,
+            CachedSummary {
+                revision,
+                value: Arc::clone(&value),
+            },
+        );
+        value
+    }
+
+    /// Rendered `list_devices` rows grouped by room UUID
+    ///
+    /// Rows are rendered once per structure revision; unfiltered and
+    /// room-filtered listings are then assembled from these sections instead
+    /// of rescanning the structure. Devices without a room are kept under
+    /// the empty key.
+    async fn device_sections(&self, context: &ClientContext) -> Arc<Value> {
+        if let Some(cached) = self.cached_summary(context, "device_sections").await {
+            return cached;
+        }
+
+        let revision = context.revision();
+        let structure = context.structure.read().await;
+        let mut sections = serde_json::Map::new();
+        for (uuid, control) in structure.iter().flat_map(|s| &s.controls) {
+            let room = control.get("room").and_then(|v| v.as_str());
+            let row = json!({
+                "uuid": uuid,
+                "name": control.get("name").and_then(|v| v.as_str()).unwrap_or("Unknown"),
+                "type": control.get("type").and_then(|v| v.as_str()).unwrap_or("Unknown"),
+                "room": room.unwrap_or("Unknown"),
+                "category": control.get("cat").and_then(|v| v.as_str()).unwrap_or("Unknown")
+            });
+            if let Value::Array(rows) = sections
+                .entry(room.unwrap_or_default())
+                .or_insert_with(|| Value::Array(Vec::new()))
             {
-                return Some(uuid.clone());
+                rows.push(row);
             }
         }
-        None
+
+        drop(structure);
+        self.store_summary(revision, "device_sections", Value::Object(sections))
+            .await
+    }
+
+    /// Look up the structure entries for a list of indexed device UUIDs.
+    fn indexed_controls<'a>(
+        structure: &'a LoxoneStructure,
+        uuids: &'a [String],
+    ) -> Vec<(&'a String, &'a Value)> {
+        uuids
+            .iter()
+            .filter_map(|uuid| structure.controls.get(uuid).map(|control| (uuid, control)))
+            .collect()
     }
 
     /// Find controls matching the given types within a specific room (by room UUID).
     fn find_controls_by_type_in_room<'a>(
         structure: &'a LoxoneStructure,
+        index: &DeviceIndex,
         room_uuid: &str,
         types: &[&str],
     ) -> Vec<(&'a String, &'a Value)> {
-        structure
-            .controls
+        index
+            .room_controls(room_uuid)
             .iter()
+            .filter_map(|uuid| structure.controls.get_key_value(uuid))
             .filter(|(_, control)| {
                 let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-                let control_room = control.get("room").and_then(|v| v.as_str()).unwrap_or("");
-                types.contains(&control_type) && control_room == room_uuid
+                types.contains(&control_type)
             })
             .collect()
     }
@@ -106,88 +372,331 @@ impl LoxoneMcpServer {
     /// Find controls matching the given types across the entire system.
     fn find_controls_by_type<'a>(
         structure: &'a LoxoneStructure,
+        index: &DeviceIndex,
         types: &[&str],
     ) -> Vec<(&'a String, &'a Value)> {
-        structure
-            .controls
-            .iter()
-            .filter(|(_, control)| {
-                let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-                types.contains(&control_type)
-            })
+        index
+            .of_types(types)
+            .filter_map(|uuid| structure.controls.get_key_value(uuid))
             .collect()
     }
 
     /// Find a single control by UUID or by name (case-insensitive partial match).
     /// Returns the (uuid, control) pair.
+    ///
+    /// Names made of whole indexed words are resolved from the
+    /// [`DeviceIndex`] name index; partial words fall back to a full scan.
     fn find_control_by_id_or_name<'a>(
         structure: &'a LoxoneStructure,
+        index: &DeviceIndex,
         identifier: &str,
     ) -> Option<(&'a String, &'a Value)> {
         // Try exact UUID match first
-        if let Some(control) = structure.controls.get(identifier) {
-            return structure
-                .controls
-                .get_key_value(identifier)
-                .map(|(k, _)| (k, control));
+        if let Some(entry) = structure.controls.get_key_value(identifier) {
+            return Some(entry);
         }
-        // Fall back to name search
+        // Fall back to name search over the precomputed lowercase names
         let lower = identifier.to_lowercase();
-        structure.controls.iter().find(|(_, control)| {
-            control
-                .get("name")
-                .and_then(|v| v.as_str())
-                .map(|n| n.to_lowercase() == lower || n.to_lowercase().contains(&lower))
-                .unwrap_or(false)
-        })
+        let name_matches = |uuid: &str| {
+            index
+                .lower_name(uuid)
+                .is_some_and(|name| name.contains(&lower))
+        };
+        let found = index
+            .name_candidates(&lower)
+            .and_then(|candidates| candidates.iter().find(|uuid| name_matches(uuid)))
+            .or_else(|| index.lower_names.keys().find(|uuid| name_matches(uuid)))?;
+        structure.controls.get_key_value(found)
+    }
+
+    /// Find a single control of one of `types` by UUID or by name.
+    ///
+    /// Only the controls of those types are compared, not every control in
+    /// the structure. A case-insensitive exact name wins over the first name
+    /// merely containing `identifier`.
+    fn find_typed_control<'a>(
+        structure: &'a LoxoneStructure,
+        index: &DeviceIndex,
+        identifier: &str,
+        types: &[&str],
+    ) -> Option<(&'a String, &'a Value)> {
+        if let Some(entry) = structure.controls.get_key_value(identifier) {
+            let control_type = entry.1.get("type").and_then(|v| v.as_str()).unwrap_or("");
+            return types.contains(&control_type).then_some(entry);
+        }
+        let lower = identifier.to_lowercase();
+        let found = index
+            .of_types(types)
+            .find(|uuid| index.lower_name(uuid) == Some(lower.as_str()))
+            .or_else(|| {
+                index.of_types(types).find(|uuid| {
+                    index
+                        .lower_name(uuid)
+                        .is_some_and(|name| name.contains(&lower))
+                })
+            })?;
+        structure.controls.get_key_value(found)
     }
 
     /// Search for climate controllers in a room by room name.
     fn find_climate_in_room<'a>(
         structure: &'a LoxoneStructure,
+        index: &DeviceIndex,
         room_name: &str,
         climate_types: &[&str],
     ) -> std::result::Result<Vec<(&'a String, &'a Value)>, String> {
-        if let Some(room_uuid) = Self::resolve_room_uuid(structure, room_name) {
+        if let Some(room_uuid) = index.find_room(room_name) {
             Ok(Self::find_controls_by_type_in_room(
                 structure,
-                &room_uuid,
+                index,
+                room_uuid,
                 climate_types,
             ))
         } else {
             // If room name didn't resolve, try to find climate controllers whose name contains the room
             let lower = room_name.to_lowercase();
-            Ok(structure
-                .controls
-                .iter()
-                .filter(|(_, control)| {
-                    let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-                    let name = control
-                        .get("name")
-                        .and_then(|v| v.as_str())
-                        .unwrap_or("")
-                        .to_lowercase();
-                    climate_types.contains(&control_type) && name.contains(&lower)
+            Ok(index
+                .of_types(climate_types)
+                .filter(|uuid| {
+                    index
+                        .lower_name(uuid)
+                        .is_some_and(|name| name.contains(&lower))
                 })
+                .filter_map(|uuid| structure.controls.get_key_value(uuid))
                 .collect())
         }
     }
 
     /// Fetch live state for a list of UUIDs and return a mapping from UUID to state value.
+    ///
+    /// States read within [`STATE_CACHE_TTL`] and not invalidated by a command
+    /// since are served from memory. A UUID another call is already reading
+    /// joins that read; only the remaining UUIDs are requested, so concurrent
+    /// calls never wait on reads of devices they did not ask for.
     async fn fetch_live_states(
+        &self,
         client: &Arc<dyn LoxoneClient>,
         uuids: &[String],
-    ) -> std::collections::HashMap<String, Value> {
+    ) -> HashMap<String, Value> {
         if uuids.is_empty() {
-            return std::collections::HashMap::new();
+            return HashMap::new();
+        }
+
+        let epoch = self.command_epoch.load(Ordering::Acquire);
+        let mut states = HashMap::with_capacity(uuids.len());
+        let missing = self.take_cached_states(uuids, epoch, &mut states).await;
+        if missing.is_empty() {
+            debug!("Serving {} live states from cache", states.len());
+            return states;
         }
-        match client.get_device_states(uuids).await {
-            Ok(states) => states,
-            Err(e) => {
+
+        let mut reads = Vec::new();
+        {
+            let mut in_flight = self.in_flight_reads.lock().await;
+            let mut joined = HashSet::new();
+            let mut unread = Vec::new();
+            for uuid in &missing {
+                match in_flight.get(uuid) {
+                    Some(pending) if pending.epoch == epoch => {
+                        if joined.insert(pending.id) {
+                            reads.push(pending.read.clone());
+                        }
+                    }
+                    _ => unread.push(uuid.clone()),
+                }
+            }
+            if !joined.is_empty() {
+                debug!("Joining {} live state reads in flight", joined.len());
+            }
+            if !unread.is_empty() {
+                let id = self.next_read_id.fetch_add(1, Ordering::Relaxed);
+                let read = self.start_state_read(client, id, epoch, unread.clone());
+                for uuid in unread {
+                    in_flight.insert(
+                        uuid,
+                        InFlightRead {
+                            id,
+                            epoch,
+                            read: read.clone(),
+                        },
+                    );
+                }
+                reads.push(read);
+            }
+        }
+
+        for fresh in future::join_all(reads).await {
+            for uuid in &missing {
+                if let Some(value) = fresh.get(uuid) {
+                    states.insert(uuid.clone(), value.clone());
+                }
+            }
+        }
+        states
+    }
+
+    /// Start reading live states for `uuids`, shared by every call that joins it
+    ///
+    /// The read caches what it gets, unless a command was sent while it was in
+    /// flight, and then clears its own in-flight entries, so later calls find
+    /// the states in the cache instead. A failed or slow read yields no states.
+    fn start_state_read(
+        &self,
+        client: &Arc<dyn LoxoneClient>,
+        id: u64,
+        epoch: u64,
+        uuids: Vec<String>,
+    ) -> StateRead {
+        let client = Arc::clone(client);
+        let state_cache = Arc::clone(&self.state_cache);
+        let command_epoch = Arc::clone(&self.command_epoch);
+        let in_flight_reads = Arc::clone(&self.in_flight_reads);
+        async move {
+            let fresh = tokio::time::timeout(COMMAND_TIMEOUT, client.get_device_states(&uuids))
+                .await
+                .unwrap_or_else(|_| Err(LoxoneError::timeout("Device state request timed out")));
+            let fresh = fresh.unwrap_or_else(|e| {
                 warn!("Failed to fetch live device states: {e}");
-                std::collections::HashMap::new()
+                HashMap::new()
+            });
+
+            if !fresh.is_empty() {
+                let read_at = Instant::now();
+                let mut cache = state_cache.write().await;
+                // States read across a command could never be served, and
+                // evicting would drop what a newer read has cached since
+                if command_epoch.load(Ordering::Acquire) == epoch {
+                    cache.retain(|_, entry| {
+                        entry.epoch >= epoch && entry.read_at.elapsed() < STATE_CACHE_TTL
+                    });
+                    for (uuid, value) in &fresh {
+                        cache.insert(
+                            uuid.clone(),
+                            CachedState {
+                                epoch,
+                                read_at,
+                                value: value.clone(),
+                            },
+                        );
+                    }
+                } else {
+                    debug!(
+                        "Not caching {} live states read across a command",
+                        fresh.len()
+                    );
+                }
+            }
+
+            let mut in_flight = in_flight_reads.lock().await;
+            for uuid in &uuids {
+                if in_flight.get(uuid).is_some_and(|pending| pending.id == id) {
+                    in_flight.remove(uuid);
+                }
+            }
+            Arc::new(fresh)
+        }
+        .boxed()
+        .shared()
+    }
+
+    /// Copy still-valid cached states for `uuids` into `states` and return the
+    /// UUIDs that have none.
+    async fn take_cached_states(
+        &self,
+        uuids: &[String],
+        epoch: u64,
+        states: &mut HashMap<String, Value>,
+    ) -> Vec<String> {
+        let cache = self.state_cache.read().await;
+        let mut missing = Vec::new();
+        for uuid in uuids {
+            match cache.get(uuid) {
+                Some(entry)
+                    if entry.epoch == epoch && entry.read_at.elapsed() < STATE_CACHE_TTL =>
+                {
+                    states.insert(uuid.clone(), entry.value.clone());
+                }
+                _ => missing.push(uuid.clone()),
             }
         }
+        missing
+    }
+
+    /// Send one command, failing with a timeout error after [`COMMAND_TIMEOUT`]
+    ///
+    /// A stalled device then only fails its own result instead of holding up
+    /// every other command of the tool call.
+    async fn send_with_timeout(
+        client: &Arc<dyn LoxoneClient>,
+        uuid: &str,
+        command: &str,
+    ) -> crate::error::Result<LoxoneResponse> {
+        tokio::time::timeout(COMMAND_TIMEOUT, client.send_command(uuid, command))
+            .await
+            .unwrap_or_else(|_| {
+                Err(LoxoneError::timeout(format!(
+                    "Command '{command}' to {uuid} timed out"
+                )))
+            })
+    }
+
+    /// Send the same command to several devices concurrently
+    ///
+    /// At most [`MAX_CONCURRENT_COMMANDS`] requests are in flight at once so a
+    /// large room does not flood the Miniserver. Results are returned in the
+    /// order of `uuids`.
+    async fn send_to_all<'a>(
+        client: &Arc<dyn LoxoneClient>,
+        uuids: impl IntoIterator<Item = &'a String>,
+        command: &str,
+    ) -> Vec<crate::error::Result<LoxoneResponse>> {
+        stream::iter(uuids)
+            .map(|uuid| Self::send_with_timeout(client, uuid, command))
+            .buffered(MAX_CONCURRENT_COMMANDS)
+            .collect()
+            .await
+    }
+
+    /// Copy the UUID and name of each control a command is sent to
+    ///
+    /// Tools collect these while reading the structure so the structure and
+    /// index guards are released before any request goes out.
+    fn command_targets(controls: &[(&String, &Value)]) -> Vec<(String, String)> {
+        controls
+            .iter()
+            .map(|(uuid, control)| {
+                let name = control
+                    .get("name")
+                    .and_then(|v| v.as_str())
+                    .unwrap_or("Unknown");
+                ((*uuid).clone(), name.to_string())
+            })
+            .collect()
+    }
+
+    /// Render one result row per target for the responses of [`Self::send_to_all`].
+    fn command_results(
+        targets: &[(String, String)],
+        responses: Vec<crate::error::Result<LoxoneResponse>>,
+    ) -> Vec<Value> {
+        targets
+            .iter()
+            .zip(responses)
+            .map(|((uuid, name), response)| match response {
+                Ok(response) => json!({
+                    "uuid": uuid,
+                    "name": name,
+                    "status": "executed",
+                    "miniserver_response": response.value
+                }),
+                Err(e) => json!({
+                    "uuid": uuid,
+                    "name": name,
+                    "status": "error",
+                    "error": format!("{e}")
+                }),
+            })
+            .collect()
     }
 }
 
@@ -214,7 +723,7 @@ impl LoxoneMcpServer {
         self.ensure_connected()?;
 
         // Normalize action (multi-language support)
-        let normalized_action = match action.to_lowercase().as_str() {
+        let normalized_action = match normalize_keyword(&action).as_ref() {
             "on" | "ein" | "an" | "einschalten" => "on",
             "off" | "aus" | "ab" | "ausschalten" => "off",
             "dim" | "dimmen" => "dim",
@@ -234,19 +743,19 @@ impl LoxoneMcpServer {
         }
 
         // Build the Loxone command string from the normalized action + brightness
-        let command = match (normalized_action, brightness) {
-            (_, Some(level)) => format!("{level}"),
-            ("on", None) => "on".to_string(),
-            ("off", None) => "off".to_string(),
-            ("dim", None) => "25".to_string(), // default dim level
-            ("bright", None) => "100".to_string(), // full brightness
-            _ => "on".to_string(),
+        let command: Cow<'static, str> = match (normalized_action, brightness) {
+            (_, Some(level)) => Cow::Owned(level.to_string()),
+            ("on", None) => Cow::Borrowed("on"),
+            ("off", None) => Cow::Borrowed("off"),
+            ("dim", None) => Cow::Borrowed("25"), // default dim level
+            ("bright", None) => Cow::Borrowed("100"), // full brightness
+            _ => Cow::Borrowed("on"),
         };
 
-        let client = self.get_client()?;
-        let light_types = &["Switch", "Dimmer", "LightController", "ColorPicker"];
+        let client = self.command_client()?;
 
-        match scope.to_lowercase().as_str() {
+        let scope = normalize_keyword(&scope);
+        match scope.as_ref() {
             "device" => {
                 let target_id = target
                     .as_deref()
@@ -265,98 +774,56 @@ impl LoxoneMcpServer {
                     "miniserver_response": response.value
                 }))
             }
-            "room" => {
-                let room_name = target.as_deref().ok_or_else(|| {
-                    "target (room name) is required when scope is 'room'".to_string()
-                })?;
-                let structure = client
-                    .get_structure()
-                    .await
-                    .map_err(|e| format!("Failed to get structure: {e}"))?;
-                let room_uuid = Self::resolve_room_uuid(&structure, room_name)
-                    .ok_or_else(|| format!("Room '{room_name}' not found"))?;
-                let controls =
-                    Self::find_controls_by_type_in_room(&structure, &room_uuid, light_types);
-                if controls.is_empty() {
-                    return Err(format!("No lights found in room '{room_name}'"));
-                }
-                let mut results = Vec::new();
-                for (uuid, control) in &controls {
-                    let name = control
-                        .get("name")
-                        .and_then(|v| v.as_str())
-                        .unwrap_or("Unknown");
-                    match client.send_command(uuid, &command).await {
-                        Ok(response) => {
-                            results.push(json!({
-                                "uuid": uuid,
-                                "name": name,
-                                "status": "executed",
-                                "miniserver_response": response.value
-                            }));
-                        }
-                        Err(e) => {
-                            results.push(json!({
-                                "uuid": uuid,
-                                "name": name,
-                                "status": "error",
-                                "error": format!("{e}")
-                            }));
+            "room" | "system" => {
+                let context = self.indexed_context().await?;
+
+                // The affected lights come straight from the index, either
+                // the room's light list or every light in the system
+                let room_name = if scope == "room" {
+                    Some(target.as_deref().ok_or_else(|| {
+                        "target (room name) is required when scope is 'room'".to_string()
+                    })?)
+                } else {
+                    None
+                };
+                let targets = {
+                    let structure = loaded_structure(context).await?;
+                    let index = context.device_index.read().await;
+                    let light_uuids = match room_name {
+                        Some(room_name) => {
+                            let room_uuid = index
+                                .find_room(room_name)
+                                .ok_or_else(|| format!("Room '{room_name}' not found"))?;
+                            index.room_lights(room_uuid)
                         }
-                    }
+                        None => &index.lights,
+                    };
+                    Self::command_targets(&Self::indexed_controls(&structure, light_uuids))
+                };
+                if targets.is_empty() {
+                    return Err(match room_name {
+                        Some(room_name) => format!("No lights found in room '{room_name}'"),
+                        None => "No lights found in the system".to_string(),
+                    });
                 }
-                Ok(json!({
-                    "scope": "room",
-                    "target": room_name,
+
+                let responses =
+                    Self::send_to_all(&client, targets.iter().map(|(uuid, _)| uuid), &command)
+                        .await;
+                let results = Self::command_results(&targets, responses);
+
+                let mut response = json!({
+                    "scope": scope,
                     "action": normalized_action,
                     "brightness": brightness,
                     "command_sent": command,
                     "devices_affected": results.len(),
                     "results": results
-                }))
-            }
-            "system" => {
-                let structure = client
-                    .get_structure()
-                    .await
-                    .map_err(|e| format!("Failed to get structure: {e}"))?;
-                let controls = Self::find_controls_by_type(&structure, light_types);
-                if controls.is_empty() {
-                    return Err("No lights found in the system".to_string());
-                }
-                let mut results = Vec::new();
-                for (uuid, control) in &controls {
-                    let name = control
-                        .get("name")
-                        .and_then(|v| v.as_str())
-                        .unwrap_or("Unknown");
-                    match client.send_command(uuid, &command).await {
-                        Ok(response) => {
-                            results.push(json!({
-                                "uuid": uuid,
-                                "name": name,
-                                "status": "executed",
-                                "miniserver_response": response.value
-                            }));
-                        }
-                        Err(e) => {
-                            results.push(json!({
-                                "uuid": uuid,
-                                "name": name,
-                                "status": "error",
-                                "error": format!("{e}")
-                            }));
-                        }
-                    }
+                });
+                if let Some(room_name) = room_name {
+                    response["target"] = json!(room_name);
                 }
-                Ok(json!({
-                    "scope": "system",
-                    "action": normalized_action,
-                    "brightness": brightness,
-                    "command_sent": command,
-                    "devices_affected": results.len(),
-                    "results": results
-                }))
+                Ok(response)
             }
             _ => Err(format!(
                 "Invalid scope '{scope}'. Use: device, room, system"
@@ -369,34 +836,21 @@ impl LoxoneMcpServer {
     /// Returns a list of all lighting devices with their current state,
     /// brightness level, and room location.
     pub async fn get_lights_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
-
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut light_uuids = Vec::new();
-        let mut light_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-
-            if matches!(
-                control_type,
-                "Switch" | "Dimmer" | "LightController" | "ColorPicker"
-            ) {
-                light_uuids.push(uuid.clone());
-                light_info.push((uuid.clone(), control.clone()));
-            }
-        }
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let light_uuids = context.device_index.read().await.lights.clone();
 
         // Fetch live states for all lights
-        let live_states = Self::fetch_live_states(client, &light_uuids).await;
+        let live_states = self.fetch_live_states(client, &light_uuids).await;
+
+        let structure = context.structure.read().await;
+        let light_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &light_uuids))
+            .unwrap_or_default();
 
         let lights: Vec<Value> = light_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -449,27 +903,22 @@ impl LoxoneMcpServer {
             return Err(format!("Invalid mode '{mode}'. Use: heat, cool, auto, off"));
         }
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let climate_types = &["IRoomController", "Intelligent Room Controller"];
+        let client = self.command_client()?;
+        let context = self.indexed_context().await?;
 
         // Try to find the thermostat: first by direct UUID/name, then by room
-        let thermostat = Self::find_control_by_id_or_name(&structure, &room);
-        let targets: Vec<(&String, &Value)> = if let Some(target) = thermostat {
-            // Check it's actually a climate controller
-            let control_type = target.1.get("type").and_then(|v| v.as_str()).unwrap_or("");
-            if climate_types.contains(&control_type) {
-                vec![target]
-            } else {
-                // Not a climate controller, search by room
-                Self::find_climate_in_room(&structure, &room, climate_types)?
+        let targets = {
+            let structure = loaded_structure(context).await?;
+            let index = context.device_index.read().await;
+            match Self::find_typed_control(&structure, &index, &room, CLIMATE_TYPES) {
+                Some(target) => Self::command_targets(&[target]),
+                None => Self::command_targets(&Self::find_climate_in_room(
+                    &structure,
+                    &index,
+                    &room,
+                    CLIMATE_TYPES,
+                )?),
             }
-        } else {
-            Self::find_climate_in_room(&structure, &room, climate_types)?
         };
 
         if targets.is_empty() {
@@ -477,31 +926,9 @@ impl LoxoneMcpServer {
         }
 
         let command = format!("settemp/{temperature}");
-        let mut results = Vec::new();
-        for (uuid, control) in &targets {
-            let name = control
-                .get("name")
-                .and_then(|v| v.as_str())
-                .unwrap_or("Unknown");
-            match client.send_command(uuid, &command).await {
-                Ok(response) => {
-                    results.push(json!({
-                        "uuid": uuid,
-                        "name": name,
-                        "status": "executed",
-                        "miniserver_response": response.value
-                    }));
-                }
-                Err(e) => {
-                    results.push(json!({
-                        "uuid": uuid,
-                        "name": name,
-                        "status": "error",
-                        "error": format!("{e}")
-                    }));
-                }
-            }
-        }
+        let responses =
+            Self::send_to_all(&client, targets.iter().map(|(uuid, _)| uuid), &command).await;
+        let results = Self::command_results(&targets, responses);
 
         // Also send mode command if not "auto" (the default)
         if mode != "auto" {
@@ -511,8 +938,11 @@ impl LoxoneMcpServer {
                 "off" => "setmode/0",
                 _ => "setmode/3", // auto
             };
-            for (uuid, _) in &targets {
-                if let Err(e) = client.send_command(uuid, mode_command).await {
+            let responses =
+                Self::send_to_all(&client, targets.iter().map(|(uuid, _)| uuid), mode_command)
+                    .await;
+            for ((uuid, _), response) in targets.iter().zip(responses) {
+                if let Err(e) = response {
                     warn!("Failed to set mode on {uuid}: {e}");
                 }
             }
@@ -530,33 +960,20 @@ impl LoxoneMcpServer {
 
     /// Get current climate status for all rooms
     pub async fn get_climate_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let climate_uuids = context.device_index.read().await.climate.clone();
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut climate_uuids = Vec::new();
-        let mut climate_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-
-            if matches!(
-                control_type,
-                "IRoomController" | "Intelligent Room Controller"
-            ) {
-                climate_uuids.push(uuid.clone());
-                climate_info.push((uuid.clone(), control.clone()));
-            }
-        }
+        let live_states = self.fetch_live_states(client, &climate_uuids).await;
 
-        let live_states = Self::fetch_live_states(client, &climate_uuids).await;
+        let structure = context.structure.read().await;
+        let climate_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &climate_uuids))
+            .unwrap_or_default();
 
         let climate_data: Vec<Value> = climate_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -603,24 +1020,24 @@ impl LoxoneMcpServer {
             if pos > 100 {
                 return Err("Position must be between 0-100".to_string());
             }
-            format!("ManualPosition/{pos}")
+            Cow::Owned(format!("ManualPosition/{pos}"))
         } else if let Some(ref act) = action {
-            match act.to_lowercase().as_str() {
-                "up" | "open" | "auf" => "FullUp".to_string(),
-                "down" | "close" | "ab" | "zu" => "FullDown".to_string(),
-                "stop" | "halt" => "Stop".to_string(),
-                "shade" | "schatten" => "Shade".to_string(),
+            Cow::Borrowed(match normalize_keyword(&act).as_ref() {
+                "up" | "open" | "auf" => "FullUp",
+                "down" | "close" | "ab" | "zu" => "FullDown",
+                "stop" | "halt" => "Stop",
+                "shade" | "schatten" => "Shade",
                 _ => {
                     return Err(format!(
                         "Invalid action '{act}'. Use: up, down, stop, shade"
                     ));
                 }
-            }
+            })
         } else {
             return Err("Either action or position must be provided".to_string());
         };
 
-        let client = self.get_client()?;
+        let client = self.command_client()?;
 
         // Target can be a UUID or a device name; send command directly
         let response = client
@@ -640,30 +1057,20 @@ impl LoxoneMcpServer {
 
     /// Get status of all blinds/rolladen
     pub async fn get_blinds_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
-
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut blind_uuids = Vec::new();
-        let mut blind_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let blind_uuids = context.device_index.read().await.blinds.clone();
 
-            if matches!(control_type, "Jalousie" | "Blinds" | "Rolladen") {
-                blind_uuids.push(uuid.clone());
-                blind_info.push((uuid.clone(), control.clone()));
-            }
-        }
+        let live_states = self.fetch_live_states(client, &blind_uuids).await;
 
-        let live_states = Self::fetch_live_states(client, &blind_uuids).await;
+        let structure = context.structure.read().await;
+        let blind_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &blind_uuids))
+            .unwrap_or_default();
 
         let blinds: Vec<Value> = blind_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -698,15 +1105,16 @@ impl LoxoneMcpServer {
     pub async fn list_rooms(&self) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
+        let context = self.indexed_context().await?;
+        if let Some(cached) = self.cached_summary(context, "list_rooms").await {
+            return Ok(Value::clone(&cached));
+        }
 
+        let revision = context.revision();
+        let structure = context.structure.read().await;
         let rooms: Vec<_> = structure
-            .rooms
             .iter()
+            .flat_map(|s| &s.rooms)
             .map(|(uuid, room)| {
                 json!({
                     "uuid": uuid,
@@ -715,11 +1123,14 @@ impl LoxoneMcpServer {
                 })
             })
             .collect();
+        drop(structure);
 
-        Ok(json!({
+        let result = json!({
             "rooms": rooms,
             "count": rooms.len()
-        }))
+        });
+        let result = self.store_summary(revision, "list_rooms", result).await;
+        Ok(Value::clone(&result))
     }
 
     /// List all devices in a specific room or system-wide
@@ -729,35 +1140,25 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
+        let context = self.indexed_context().await?;
+        let sections = self.device_sections(context).await;
+        let Value::Object(sections) = sections.as_ref() else {
+            return Err("Device listing unavailable".to_string());
+        };
 
-        let devices: Vec<_> = structure
-            .controls
+        let room_filter = room.as_deref().map(str::to_lowercase);
+        // Only the rows that are listed are copied out of the shared sections
+        let devices: Vec<Value> = sections
             .iter()
-            .filter(|(_, control)| {
-                if let Some(ref room_filter) = room {
-                    control
-                        .get("room")
-                        .and_then(|v| v.as_str())
-                        .map(|r| r.to_lowercase().contains(&room_filter.to_lowercase()))
-                        .unwrap_or(false)
-                } else {
-                    true
+            .filter(|(room_uuid, _)| match &room_filter {
+                Some(room_filter) => {
+                    !room_uuid.is_empty() && room_uuid.to_lowercase().contains(room_filter)
                 }
+                None => true,
             })
-            .map(|(uuid, control)| {
-                json!({
-                    "uuid": uuid,
-                    "name": control.get("name").and_then(|v| v.as_str()).unwrap_or("Unknown"),
-                    "type": control.get("type").and_then(|v| v.as_str()).unwrap_or("Unknown"),
-                    "room": control.get("room").and_then(|v| v.as_str()).unwrap_or("Unknown"),
-                    "category": control.get("cat").and_then(|v| v.as_str()).unwrap_or("Unknown")
-                })
-            })
+            .filter_map(|(_, rows)| rows.as_array())
+            .flatten()
+            .cloned()
             .collect();
 
         Ok(json!({
@@ -774,21 +1175,15 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
+        let context = self.indexed_context().await?;
+        let structure = loaded_structure(context).await?;
 
         // Find device by UUID or name
-        let device = structure.controls.iter().find(|(uuid, control)| {
-            uuid.to_string() == device_id
-                || control
-                    .get("name")
-                    .and_then(|v| v.as_str())
-                    .map(|n| n.to_lowercase().contains(&device_id.to_lowercase()))
-                    .unwrap_or(false)
-        });
+        let device = Self::find_control_by_id_or_name(
+            &structure,
+            &*context.device_index.read().await,
+            &device_id,
+        );
 
         match device {
             Some((uuid, control)) => Ok(json!({
@@ -828,14 +1223,15 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let normalized_action = match action.to_lowercase().as_str() {
-            "play" | "abspielen" | "start" => "play",
-            "pause" | "pausieren" => "pause",
-            "stop" | "stopp" | "anhalten" => "stop",
-            "next" | "weiter" | "nächster" => "next",
-            "previous" | "zurück" | "vorheriger" => "previous",
-            "mute" | "stumm" => "mute",
-            "unmute" | "laut" => "unmute",
+        // Normalize the action and map it to its Loxone audio command
+        let (normalized_action, command) = match normalize_keyword(&action).as_ref() {
+            "play" | "abspielen" | "start" => ("play", "play"),
+            "pause" | "pausieren" => ("pause", "pause"),
+            "stop" | "stopp" | "anhalten" => ("stop", "stop"),
+            "next" | "weiter" | "nächster" => ("next", "queueplus"),
+            "previous" | "zurück" | "vorheriger" => ("previous", "queueminus"),
+            "mute" | "stumm" => ("mute", "mute"),
+            "unmute" | "laut" => ("unmute", "unmute"),
             _ => {
                 return Err(format!(
                     "Invalid action '{action}'. Use: play, pause, stop, next, previous, mute, unmute"
@@ -843,19 +1239,7 @@ impl LoxoneMcpServer {
             }
         };
 
-        let client = self.get_client()?;
-
-        // Map normalized actions to Loxone audio commands
-        let command = match normalized_action {
-            "play" => "play",
-            "pause" => "pause",
-            "stop" => "stop",
-            "next" => "queueplus",
-            "previous" => "queueminus",
-            "mute" => "mute",
-            "unmute" => "unmute",
-            _ => normalized_action,
-        };
+        let client = self.command_client()?;
 
         let response = client
             .send_command(&zone, command)
@@ -885,7 +1269,7 @@ impl LoxoneMcpServer {
             return Err("Volume must be between 0-100".to_string());
         }
 
-        let client = self.get_client()?;
+        let client = self.command_client()?;
         let command = format!("volume/{volume}");
         let response = client
             .send_command(&zone, &command)
@@ -903,30 +1287,20 @@ impl LoxoneMcpServer {
 
     /// Get status of all audio zones
     pub async fn get_audio_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
-
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let audio_uuids = context.device_index.read().await.audio.clone();
 
-        let mut audio_uuids = Vec::new();
-        let mut audio_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-
-            if control_type.contains("Audio") || control_type == "MediaController" {
-                audio_uuids.push(uuid.clone());
-                audio_info.push((uuid.clone(), control.clone()));
-            }
-        }
+        let live_states = self.fetch_live_states(client, &audio_uuids).await;
 
-        let live_states = Self::fetch_live_states(client, &audio_uuids).await;
+        let structure = context.structure.read().await;
+        let audio_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &audio_uuids))
+            .unwrap_or_default();
 
         let audio_zones: Vec<Value> = audio_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -963,40 +1337,20 @@ impl LoxoneMcpServer {
     ///
     /// Returns current values from all sensors (temperature, humidity, motion, etc.)
     pub async fn get_sensor_readings(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let sensor_uuids = context.device_index.read().await.sensors.clone();
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut sensor_uuids = Vec::new();
-        let mut sensor_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-
-            // Match sensor types
-            if matches!(
-                control_type,
-                "InfoOnlyAnalog"
-                    | "InfoOnlyDigital"
-                    | "PresenceDetector"
-                    | "MotionSensor"
-                    | "SmokeAlarm"
-                    | "Meter"
-                    | "Sensor"
-            ) {
-                sensor_uuids.push(uuid.clone());
-                sensor_info.push((uuid.clone(), control.clone()));
-            }
-        }
+        let live_states = self.fetch_live_states(client, &sensor_uuids).await;
 
-        let live_states = Self::fetch_live_states(client, &sensor_uuids).await;
+        let structure = context.structure.read().await;
+        let sensor_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &sensor_uuids))
+            .unwrap_or_default();
 
         let sensors: Vec<Value> = sensor_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -1029,41 +1383,20 @@ impl LoxoneMcpServer {
     ///
     /// Returns open/closed state of all door and window sensors
     pub async fn get_door_window_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let dw_uuids = context.device_index.read().await.door_window.clone();
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut dw_uuids = Vec::new();
-        let mut dw_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-            let name = control
-                .get("name")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_lowercase();
-
-            // Match door/window sensors
-            if control_type == "InfoOnlyDigital"
-                && (name.contains("door")
-                    || name.contains("window")
-                    || name.contains("tür")
-                    || name.contains("fenster"))
-            {
-                dw_uuids.push(uuid.clone());
-                dw_info.push((uuid.clone(), control.clone()));
-            }
-        }
+        let live_states = self.fetch_live_states(client, &dw_uuids).await;
 
-        let live_states = Self::fetch_live_states(client, &dw_uuids).await;
+        let structure = context.structure.read().await;
+        let dw_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &dw_uuids))
+            .unwrap_or_default();
 
         let door_windows: Vec<Value> = dw_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let display_name = control
                     .get("name")
@@ -1092,30 +1425,20 @@ impl LoxoneMcpServer {
 
     /// Get motion detector status
     pub async fn get_motion_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
-
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut motion_uuids = Vec::new();
-        let mut motion_info = Vec::new();
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let motion_uuids = context.device_index.read().await.motion.clone();
 
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
+        let live_states = self.fetch_live_states(client, &motion_uuids).await;
 
-            if matches!(control_type, "PresenceDetector" | "MotionSensor") {
-                motion_uuids.push(uuid.clone());
-                motion_info.push((uuid.clone(), control.clone()));
-            }
-        }
-
-        let live_states = Self::fetch_live_states(client, &motion_uuids).await;
+        let structure = context.structure.read().await;
+        let motion_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &motion_uuids))
+            .unwrap_or_default();
 
         let motion_sensors: Vec<Value> = motion_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -1150,30 +1473,20 @@ impl LoxoneMcpServer {
     ///
     /// Returns weather station readings (temperature, humidity, wind, rain)
     pub async fn get_weather(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
-
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut weather_uuids = Vec::new();
-        let mut weather_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let weather_uuids = context.device_index.read().await.weather.clone();
 
-            if control_type.contains("Weather") {
-                weather_uuids.push(uuid.clone());
-                weather_info.push((uuid.clone(), control.clone()));
-            }
-        }
+        let live_states = self.fetch_live_states(client, &weather_uuids).await;
 
-        let live_states = Self::fetch_live_states(client, &weather_uuids).await;
+        let structure = context.structure.read().await;
+        let weather_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &weather_uuids))
+            .unwrap_or_default();
 
         let weather_devices: Vec<Value> = weather_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -1205,32 +1518,20 @@ impl LoxoneMcpServer {
     ///
     /// Returns current power usage and energy meters
     pub async fn get_energy_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
-
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let energy_uuids = context.device_index.read().await.energy.clone();
 
-        let mut energy_uuids = Vec::new();
-        let mut energy_info = Vec::new();
+        let live_states = self.fetch_live_states(client, &energy_uuids).await;
 
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-
-            if matches!(control_type, "Meter" | "EnergyManager" | "EnergyMonitor")
-                || control_type.contains("Energy")
-            {
-                energy_uuids.push(uuid.clone());
-                energy_info.push((uuid.clone(), control.clone()));
-            }
-        }
-
-        let live_states = Self::fetch_live_states(client, &energy_uuids).await;
+        let structure = context.structure.read().await;
+        let energy_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &energy_uuids))
+            .unwrap_or_default();
 
         let energy_devices: Vec<Value> = energy_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -1270,7 +1571,7 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let normalized_action = match action.to_lowercase().as_str() {
+        let normalized_action = match normalize_keyword(&action).as_ref() {
             "start" | "laden" => "start",
             "stop" | "stoppen" => "stop",
             "pause" | "pausieren" => "pause",
@@ -1281,7 +1582,7 @@ impl LoxoneMcpServer {
             }
         };
 
-        let client = self.get_client()?;
+        let client = self.command_client()?;
 
         // Map actions to Loxone commands
         let command = match normalized_action {
@@ -1329,34 +1630,20 @@ impl LoxoneMcpServer {
     ///
     /// Returns alarm system state, door locks, and security sensors
     pub async fn get_security_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let security_uuids = context.device_index.read().await.security.clone();
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
+        let live_states = self.fetch_live_states(client, &security_uuids).await;
 
-        let mut security_uuids = Vec::new();
-        let mut security_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-
-            if matches!(
-                control_type,
-                "Alarm" | "SmokeAlarm" | "Gate" | "DoorLock" | "AccessControl"
-            ) || control_type.contains("Security")
-            {
-                security_uuids.push(uuid.clone());
-                security_info.push((uuid.clone(), control.clone()));
-            }
-        }
-
-        let live_states = Self::fetch_live_states(client, &security_uuids).await;
+        let structure = context.structure.read().await;
+        let security_info = structure
+            .as_ref()
+            .map(|s| Self::indexed_controls(s, &security_uuids))
+            .unwrap_or_default();
 
         let security_devices: Vec<Value> = security_info
-            .iter()
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -1395,7 +1682,7 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let normalized_mode = match mode.to_lowercase().as_str() {
+        let normalized_mode = match normalize_keyword(&mode).as_ref() {
             "arm" | "arm_away" | "scharf" | "abwesend" => "arm_away",
             "arm_home" | "arm_stay" | "zuhause" => "arm_home",
             "disarm" | "unscharf" | "aus" => "disarm",
@@ -1406,22 +1693,22 @@ impl LoxoneMcpServer {
             }
         };
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
+        let client = self.command_client()?;
+        let context = self.indexed_context().await?;
 
         // Find alarm/security controls
-        let security_controls: Vec<(&String, &Value)> = structure
-            .controls
-            .iter()
-            .filter(|(_, control)| {
-                let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-                matches!(control_type, "Alarm" | "AccessControl")
-                    || control_type.contains("Security")
-            })
-            .collect();
+        let security_controls = {
+            let structure = loaded_structure(context).await?;
+            let index = context.device_index.read().await;
+            let controls: Vec<(&String, &Value)> = index
+                .matching_types(|control_type| {
+                    matches!(control_type, "Alarm" | "AccessControl")
+                        || control_type.contains("Security")
+                })
+                .filter_map(|uuid| structure.controls.get_key_value(uuid))
+                .collect();
+            Self::command_targets(&controls)
+        };
 
         if security_controls.is_empty() {
             return Err("No security/alarm devices found in the system".to_string());
@@ -1438,31 +1725,13 @@ impl LoxoneMcpServer {
             _ => "off".to_string(),
         };
 
-        let mut results = Vec::new();
-        for (uuid, control) in &security_controls {
-            let name = control
-                .get("name")
-                .and_then(|v| v.as_str())
-                .unwrap_or("Unknown");
-            match client.send_command(uuid, &command).await {
-                Ok(response) => {
-                    results.push(json!({
-                        "uuid": uuid,
-                        "name": name,
-                        "status": "executed",
-                        "miniserver_response": response.value
-                    }));
-                }
-                Err(e) => {
-                    results.push(json!({
-                        "uuid": uuid,
-                        "name": name,
-                        "status": "error",
-                        "error": format!("{e}")
-                    }));
-                }
-            }
-        }
+        let responses = Self::send_to_all(
+            &client,
+            security_controls.iter().map(|(uuid, _)| uuid),
+            &command,
+        )
+        .await;
+        let results = Self::command_results(&security_controls, responses);
 
         Ok(json!({
             "mode": normalized_mode,
@@ -1483,18 +1752,13 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let normalized_action = match action.to_lowercase().as_str() {
-            "lock" | "abschließen" | "zu" => "lock",
-            "unlock" | "aufschließen" | "auf" => "unlock",
+        let (normalized_action, command) = match normalize_keyword(&action).as_ref() {
+            "lock" | "abschließen" | "zu" => ("lock", "on"),
+            "unlock" | "aufschließen" | "auf" => ("unlock", "off"),
             _ => return Err(format!("Invalid action '{action}'. Use: lock, unlock")),
         };
 
-        let client = self.get_client()?;
-        let command = match normalized_action {
-            "lock" => "on",
-            "unlock" => "off",
-            _ => "off",
-        };
+        let client = self.command_client()?;
 
         let response = client
             .send_command(&lock, command)
@@ -1518,32 +1782,24 @@ impl LoxoneMcpServer {
     ///
     /// Returns list of cameras and video intercoms
     pub async fn get_camera_status(&self) -> std::result::Result<serde_json::Value, String> {
-        self.ensure_connected()?;
-
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
+        let client = self.ensure_connected()?;
+        let context = self.indexed_context().await?;
+        let camera_uuids: Vec<String> = context
+            .device_index
+            .read()
             .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut camera_uuids = Vec::new();
-        let mut camera_info = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-
-            if matches!(control_type, "Intercom" | "Camera" | "Doorbell")
-                || control_type.contains("Camera")
-            {
-                camera_uuids.push(uuid.clone());
-                camera_info.push((uuid.clone(), control.clone()));
-            }
-        }
+            .matching_types(|control_type| {
+                matches!(control_type, "Intercom" | "Camera" | "Doorbell")
+                    || control_type.contains("Camera")
+            })
+            .cloned()
+            .collect();
 
-        let live_states = Self::fetch_live_states(client, &camera_uuids).await;
+        let live_states = self.fetch_live_states(client, &camera_uuids).await;
 
-        let cameras: Vec<Value> = camera_info
-            .iter()
+        let structure = loaded_structure(context).await?;
+        let cameras: Vec<Value> = Self::indexed_controls(&structure, &camera_uuids)
+            .into_iter()
             .map(|(uuid, control)| {
                 let name = control
                     .get("name")
@@ -1586,7 +1842,7 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let normalized_action = match action.to_lowercase().as_str() {
+        let normalized_action = match normalize_keyword(&action).as_ref() {
             "answer" | "annehmen" | "abheben" => "answer",
             "hangup" | "auflegen" | "beenden" => "hangup",
             "open" | "öffnen" | "tür" => "open_door",
@@ -1599,7 +1855,7 @@ impl LoxoneMcpServer {
             }
         };
 
-        let client = self.get_client()?;
+        let client = self.command_client()?;
 
         // Map intercom actions to Loxone commands
         let command = match normalized_action {
@@ -1649,13 +1905,7 @@ impl LoxoneMcpServer {
     ) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let scene_types = &["LightController", "MoodSwitch"];
+        let client = self.command_client()?;
 
         // If scene looks like a UUID, send command directly
         if scene.contains('-') && scene.len() > 30 {
@@ -1673,28 +1923,38 @@ impl LoxoneMcpServer {
             }));
         }
 
-        // Search for matching scene controllers
-        let controllers: Vec<(&String, &Value)> = if let Some(ref room_name) = room {
-            if let Some(room_uuid) = Self::resolve_room_uuid(&structure, room_name) {
-                Self::find_controls_by_type_in_room(&structure, &room_uuid, scene_types)
+        let context = self.indexed_context().await?;
+        let scene_lower = scene.to_lowercase();
+
+        // Search for matching scene controllers and match the scene name to
+        // their mood IDs, releasing the structure before any command is sent
+        let (controllers, mood_ids) = {
+            let structure = loaded_structure(context).await?;
+            let index = context.device_index.read().await;
+            let controllers: Vec<(&String, &Value)> = if let Some(ref room_name) = room {
+                if let Some(room_uuid) = index.find_room(room_name) {
+                    Self::find_controls_by_type_in_room(&structure, &index, room_uuid, SCENE_TYPES)
+                } else {
+                    // Try matching by name
+                    let room_lower = room_name.to_lowercase();
+                    index
+                        .of_types(SCENE_TYPES)
+                        .filter(|uuid| {
+                            index
+                                .lower_name(uuid)
+                                .is_some_and(|name| name.contains(&room_lower))
+                        })
+                        .filter_map(|uuid| structure.controls.get_key_value(uuid))
+                        .collect()
+                }
             } else {
-                // Try matching by name
-                structure
-                    .controls
-                    .iter()
-                    .filter(|(_, control)| {
-                        let ct = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
-                        let name = control
-                            .get("name")
-                            .and_then(|v| v.as_str())
-                            .unwrap_or("")
-                            .to_lowercase();
-                        scene_types.contains(&ct) && name.contains(&room_name.to_lowercase())
-                    })
-                    .collect()
-            }
-        } else {
-            Self::find_controls_by_type(&structure, scene_types)
+                Self::find_controls_by_type(&structure, &index, SCENE_TYPES)
+            };
+            let mood_ids: Vec<_> = controllers
+                .iter()
+                .map(|(_, control)| match_mood(control, &scene_lower))
+                .collect();
+            (Self::command_targets(&controllers), mood_ids)
         };
 
         if controllers.is_empty() {
@@ -1706,62 +1966,53 @@ impl LoxoneMcpServer {
             ));
         }
 
-        // Try to match the scene name to a mood ID, or use the scene value directly
-        let scene_lower = scene.to_lowercase();
-        let mut results = Vec::new();
-        for (uuid, control) in &controllers {
-            let name = control
-                .get("name")
-                .and_then(|v| v.as_str())
-                .unwrap_or("Unknown");
-
-            // Check if there are moods defined that match the scene name
-            let mood_id = if let Some(moods) = control.get("moods") {
-                if let Some(moods_obj) = moods.as_object() {
-                    moods_obj
-                        .iter()
-                        .find(|(_, v)| {
-                            v.as_str()
-                                .map(|s| s.to_lowercase().contains(&scene_lower))
-                                .unwrap_or(false)
-                        })
-                        .map(|(id, _)| id.clone())
+        // Use the matched mood ID, or the scene value directly.
+        // Controllers without a matching mood all share this command, so it
+        // is built once rather than once per controller
+        let scene_command = format!("changeTo/{scene}");
+        let commands: Vec<(Option<String>, Cow<'_, str>)> = mood_ids
+            .into_iter()
+            .map(|mood_id| {
+                let command = if let Some(ref id) = mood_id {
+                    Cow::Owned(format!("changeTo/{id}"))
                 } else {
-                    None
-                }
-            } else {
-                None
-            };
+                    // Try the scene string as a direct command (could be a mood number)
+                    Cow::Borrowed(scene_command.as_str())
+                };
+                (mood_id, command)
+            })
+            .collect();
 
-            let command = if let Some(ref id) = mood_id {
-                format!("changeTo/{id}")
-            } else {
-                // Try the scene string as a direct command (could be a mood number)
-                format!("changeTo/{scene}")
-            };
+        let responses: Vec<_> = stream::iter(controllers.iter().zip(&commands))
+            .map(|((uuid, _), (_, command))| Self::send_with_timeout(&client, uuid, command))
+            .buffered(MAX_CONCURRENT_COMMANDS)
+            .collect()
+            .await;
 
-            match client.send_command(uuid, &command).await {
-                Ok(response) => {
-                    results.push(json!({
+        let results: Vec<Value> = controllers
+            .iter()
+            .zip(commands)
+            .zip(responses)
+            .map(
+                |(((uuid, name), (mood_id, command)), response)| match response {
+                    Ok(response) => json!({
                         "uuid": uuid,
                         "name": name,
                         "command_sent": command,
                         "mood_id": mood_id,
                         "status": "activated",
                         "miniserver_response": response.value
-                    }));
-                }
-                Err(e) => {
-                    results.push(json!({
+                    }),
+                    Err(e) => json!({
                         "uuid": uuid,
                         "name": name,
                         "command_sent": command,
                         "status": "error",
                         "error": format!("{e}")
-                    }));
-                }
-            }
-        }
+                    }),
+                },
+            )
+            .collect();
 
         Ok(json!({
             "scene": scene,
@@ -1775,18 +2026,17 @@ impl LoxoneMcpServer {
     pub async fn list_scenes(&self) -> std::result::Result<serde_json::Value, String> {
         self.ensure_connected()?;
 
-        let client = self.get_client()?;
-        let structure = client
-            .get_structure()
-            .await
-            .map_err(|e| format!("Failed to get structure: {e}"))?;
-
-        let mut scenes = Vec::new();
-
-        for (uuid, control) in &structure.controls {
-            let control_type = control.get("type").and_then(|v| v.as_str()).unwrap_or("");
+        let context = self.indexed_context().await?;
+        if let Some(cached) = self.cached_summary(context, "list_scenes").await {
+            return Ok(Value::clone(&cached));
+        }
 
-            if matches!(control_type, "LightController" | "MoodSwitch") {
+        let revision = context.revision();
+        let structure = loaded_structure(context).await?;
+        let index = context.device_index.read().await;
+        let scenes: Vec<Value> = Self::find_controls_by_type(&structure, &index, SCENE_TYPES)
+            .into_iter()
+            .map(|(uuid, control)| {
                 let name = control
                     .get("name")
                     .and_then(|v| v.as_str())
@@ -1799,18 +2049,176 @@ impl LoxoneMcpServer {
                 // Extract moods if available
                 let moods = control.get("moods").cloned().unwrap_or(json!([]));
 
-                scenes.push(json!({
+                json!({
                     "uuid": uuid,
                     "name": name,
                     "room": room,
                     "moods": moods
-                }));
-            }
-        }
+                })
+            })
+            .collect();
+        drop(index);
+        drop(structure);
 
-        Ok(json!({
+        let result = json!({
             "scene_controllers": scenes,
             "count": scenes.len()
-        }))
+        });
+        let result = self.store_summary(revision, "list_scenes", result).await;
+        Ok(Value::clone(&result))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::error::Result;
+    use async_trait::async_trait;
+    use std::sync::atomic::AtomicUsize;
+
+    /// Client that counts live state reads, each taking `read_delay`
+    #[derive(Default)]
+    struct CountingClient {
+        state_reads: AtomicUsize,
+        read_delay: Duration,
+    }
+
+    #[async_trait]
+    impl LoxoneClient for CountingClient {
+        async fn connect(&mut self) -> Result<()> {
+            Ok(())
+        }
+
+        async fn is_connected(&self) -> Result<bool> {
+            Ok(true)
+        }
+
+        async fn disconnect(&mut self) -> Result<()> {
+            Ok(())
+        }
+
+        async fn send_command(&self, _uuid: &str, _command: &str) -> Result<LoxoneResponse> {
+            Ok(LoxoneResponse {
+                code: 200,
+                value: json!("OK"),
+            })
+        }
+
+        async fn get_structure(&self) -> Result<LoxoneStructure> {
+            Err(LoxoneError::connection("No structure in counting client"))
+        }
+
+        async fn get_device_states(&self, uuids: &[String]) -> Result<HashMap<String, Value>> {
+            let read = self.state_reads.fetch_add(1, Ordering::SeqCst) + 1;
+            tokio::time::sleep(self.read_delay).await;
+            Ok(uuids
+                .iter()
+                .map(|uuid| (uuid.clone(), json!({ "read": read })))
+                .collect())
+        }
+
+        async fn get_state_values(
+            &self,
+            _state_uuids: &[String],
+        ) -> Result<HashMap<String, Value>> {
+            Ok(HashMap::new())
+        }
+
+        async fn get_system_info(&self) -> Result<Value> {
+            Ok(json!({}))
+        }
+
+        async fn health_check(&self) -> Result<bool> {
+            Ok(true)
+        }
+
+        fn as_any(&self) -> &dyn std::any::Any {
+            self
+        }
+    }
+
+    fn server_with(client: &Arc<CountingClient>) -> (LoxoneMcpServer, Arc<dyn LoxoneClient>) {
+        let client: Arc<dyn LoxoneClient> = Arc::clone(client) as Arc<dyn LoxoneClient>;
+        let server = LoxoneMcpServer {
+            client: Some(Arc::clone(&client)),
+            ..Default::default()
+        };
+        (server, client)
+    }
+
+    fn uuids(names: &[&str]) -> Vec<String> {
+        names.iter().map(|name| name.to_string()).collect()
+    }
+
+    #[tokio::test]
+    async fn test_live_states_served_from_cache_within_ttl() {
+        let counting = Arc::new(CountingClient::default());
+        let (server, client) = server_with(&counting);
+        let lights = uuids(&["light1", "light2"]);
+
+        let first = server.fetch_live_states(&client, &lights).await;
+        let second = server.fetch_live_states(&client, &lights).await;
+
+        assert_eq!(counting.state_reads.load(Ordering::SeqCst), 1);
+        assert_eq!(first, second);
+        assert_eq!(second["light1"], json!({ "read": 1 }));
+    }
+
+    #[tokio::test]
+    async fn test_live_states_invalidated_after_command() {
+        let counting = Arc::new(CountingClient::default());
+        let (server, client) = server_with(&counting);
+        let lights = uuids(&["light1"]);
+
+        // States read while the command is in flight may predate its effect,
+        // so they must not be served once the command client is dropped
+        let command_client = server.command_client().unwrap();
+        server.fetch_live_states(&client, &lights).await;
+        command_client.send_command("light1", "on").await.unwrap();
+        drop(command_client);
+        let states = server.fetch_live_states(&client, &lights).await;
+
+        assert_eq!(counting.state_reads.load(Ordering::SeqCst), 2);
+        assert_eq!(states["light1"], json!({ "read": 2 }));
+    }
+
+    #[tokio::test]
+    async fn test_concurrent_live_state_reads_are_shared() {
+        let counting = Arc::new(CountingClient {
+            read_delay: Duration::from_millis(50),
+            ..Default::default()
+        });
+        let (server, client) = server_with(&counting);
+        let lights = uuids(&["light1", "light2"]);
+
+        let (first, second) = tokio::join!(
+            server.fetch_live_states(&client, &lights),
+            server.fetch_live_states(&client, &lights[..1]),
+        );
+
+        assert_eq!(counting.state_reads.load(Ordering::SeqCst), 1);
+        assert_eq!(first.len(), 2);
+        assert_eq!(second["light1"], first["light1"]);
+    }
+
+    #[tokio::test]
+    async fn test_live_states_read_across_command_not_cached() {
+        let counting = Arc::new(CountingClient {
+            read_delay: Duration::from_millis(50),
+            ..Default::default()
+        });
+        let (server, client) = server_with(&counting);
+        let lights = uuids(&["light1"]);
+
+        // The command completes while the first read is still in flight
+        let command = async {
+            tokio::time::sleep(Duration::from_millis(10)).await;
+            drop(server.command_client().unwrap());
+        };
+        tokio::join!(server.fetch_live_states(&client, &lights), command);
+        let states = server.fetch_live_states(&client, &lights).await;
+
+        assert_eq!(counting.state_reads.load(Ordering::SeqCst), 2);
+        assert_eq!(states["light1"], json!({ "read": 2 }));
     }
 }
@@ -1180,33 +1180,33 @@ impl ResourceManager {
     }
 
     /// Get cache TTL for resource URI
+    ///
+    /// Dispatches on the first path segment of the URI instead of testing it
+    /// against every known prefix in turn.
     pub fn get_resource_cache_ttl(uri: &str) -> Option<u64> {
-        match uri {
+        let Some(path) = uri.strip_prefix("loxone://") else {
+            return Some(120); // Default 2 minutes
+        };
+        let (section, rest) = path.split_once('/').unwrap_or((path, ""));
+
+        match (section, rest) {
             // Static structure data - cache longer
-            uri if uri.starts_with("loxone://rooms")
-                || uri.starts_with("loxone://devices")
-                || uri == "loxone://system/capabilities"
-                || uri == "loxone://system/categories" =>
-            {
-                Some(600)
-            } // 10 minutes
+            ("rooms" | "devices", _) | ("system", "capabilities" | "categories") => Some(600), // 10 minutes
 
             // Dynamic status data - shorter cache
-            "loxone://system/status" => Some(60), // 1 minute
+            ("system", "status") => Some(60), // 1 minute
 
             // Audio and sensor data - very short cache
-            uri if uri.starts_with("loxone://audio") || uri.starts_with("loxone://sensors") => {
-                Some(30)
-            } // 30 seconds
+            ("audio" | "sensors", _) => Some(30), // 30 seconds
 
             // Weather data - very short cache since it changes frequently
-            uri if uri.starts_with("loxone://weather") => Some(30), // 30 seconds
+            ("weather", _) => Some(30), // 30 seconds
 
             // Security data - short cache for real-time security status
-            uri if uri.starts_with("loxone://security") => Some(10), // 10 seconds for security
+            ("security", _) => Some(10), // 10 seconds for security
 
             // Energy data - medium cache for power consumption data
-            uri if uri.starts_with("loxone://energy") => Some(60), // 1 minute for energy data
+            ("energy", _) => Some(60), // 1 minute for energy data
 
             _ => Some(120), // Default 2 minutes
         }
@@ -219,14 +219,12 @@ impl NotificationDispatcher {
         // Create notification
         let notification = ResourceChangeNotification::new(change.clone());
 
-        // Send notifications to all subscribers
+        // Send notifications to all subscribers concurrently, so a slow or
+        // retrying client does not hold up delivery to the others
         let start_time = Instant::now();
-        let mut successful_notifications = 0;
-        let mut failed_notifications = 0;
-
-        for subscriber in subscribers {
+        let delivered = futures::future::join_all(subscribers.iter().map(|subscriber| async {
             let notify_result = Self::send_notification_to_client(
-                &subscriber,
+                subscriber,
                 &notification,
                 max_retries,
                 retry_delay,
@@ -236,8 +234,6 @@ impl NotificationDispatcher {
 
             match notify_result {
                 Ok(_) => {
-                    successful_notifications += 1;
-
                     // Update last notification time
                     let _ = subscription_manager
                         .update_last_notification(
@@ -246,13 +242,17 @@ impl NotificationDispatcher {
                             SystemTime::now(),
                         )
                         .await;
+                    true
                 }
                 Err(e) => {
-                    failed_notifications += 1;
                     warn!("Failed to notify client {}: {}", subscriber.id, e);
+                    false
                 }
             }
-        }
+        }))
+        .await;
+        let successful_notifications = delivered.iter().filter(|ok| **ok).count() as u64;
+        let failed_notifications = delivered.len() as u64 - successful_notifications;
 
         // Update statistics
         let dispatch_time = start_time.elapsed();
@@ -394,9 +394,13 @@ impl EnhancedCacheManager {
 
             // Prefetch top co-accessed devices
             let mut top_devices: Vec<_> = frequency_map.into_iter().collect();
+            if top_devices.len() > 5 {
+                top_devices.select_nth_unstable_by(5, |a, b| b.1.cmp(&a.1));
+                top_devices.truncate(5);
+            }
             top_devices.sort_by(|a, b| b.1.cmp(&a.1));
 
-            for (device_uuid, _) in top_devices.iter().take(5) {
+            for (device_uuid, _) in &top_devices {
                 // Check if device needs prefetching based on access pattern
                 if let Some(freq) = tracker.access_frequency.get(*device_uuid) {
                     let time_since_last = Utc::now() - freq.last_access;
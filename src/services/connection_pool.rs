@@ -319,21 +319,27 @@ impl ConnectionPool {
                 interval.tick().await;
 
                 let mut connections_guard = connections.write().await;
-                let mut active_count = 0;
-
-                // Health check all connections
-                let mut healthy_connections = Vec::new();
-                for connection in connections_guard.drain(..) {
-                    match connection.health_check().await {
-                        Ok(true) => {
-                            healthy_connections.push(connection);
-                            active_count += 1;
-                        }
+
+                // Health check all connections concurrently, so the pool is
+                // locked for one round trip rather than one per connection
+                let results = futures::future::join_all(
+                    connections_guard
+                        .iter()
+                        .map(|connection| connection.health_check()),
+                )
+                .await;
+                let healthy_connections: Vec<_> = connections_guard
+                    .drain(..)
+                    .zip(results)
+                    .filter_map(|(connection, result)| match result {
+                        Ok(true) => Some(connection),
                         Ok(false) | Err(_) => {
                             debug!("Removing unhealthy connection from pool");
+                            None
                         }
-                    }
-                }
+                    })
+                    .collect();
+                let active_count = healthy_connections.len();
 
                 *connections_guard = healthy_connections;
 
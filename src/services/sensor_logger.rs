@@ -5,7 +5,7 @@
 //! with optional disk persistence.
 
 use crate::services::SensorType;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::path::PathBuf;
 use std::sync::Arc;
 use tokio::sync::RwLock;
@@ -14,7 +14,8 @@ use tokio::sync::RwLock;
 #[derive(Debug)]
 pub struct SensorStateLogger {
     log_file: PathBuf,
-    history: Arc<RwLock<HashMap<String, Vec<SensorStateEntry>>>>,
+    /// Per-sensor ring buffers, oldest entry first
+    history: Arc<RwLock<HashMap<String, VecDeque<SensorStateEntry>>>>,
     max_entries_per_sensor: usize,
 }
 
@@ -66,8 +67,11 @@ impl SensorStateLogger {
             let mut interval = tokio::time::interval(std::time::Duration::from_secs(300));
             loop {
                 interval.tick().await;
-                let data = history.read().await;
-                if let Ok(json) = serde_json::to_string_pretty(&*data)
+                // Serialize compactly straight to bytes and release the
+                // history lock before touching the disk, so state changes
+                // are not blocked behind the file write
+                let json = serde_json::to_vec(&*history.read().await);
+                if let Ok(json) = json
                     && let Err(e) = tokio::fs::write(&log_file, json).await
                 {
                     tracing::warn!("Failed to persist sensor history: {}", e);
@@ -96,12 +100,12 @@ impl SensorStateLogger {
         };
 
         let mut history = self.history.write().await;
-        let entries = history.entry(uuid).or_insert_with(Vec::new);
-        entries.push(entry);
+        let entries = history.entry(uuid).or_insert_with(VecDeque::new);
+        entries.push_back(entry);
 
         // Limit history size per sensor
         if entries.len() > self.max_entries_per_sensor {
-            entries.remove(0);
+            entries.pop_front();
         }
     }
 
@@ -111,12 +115,17 @@ impl SensorStateLogger {
             .read()
             .await
             .get(uuid)
-            .cloned()
+            .map(|entries| entries.iter().cloned().collect())
             .unwrap_or_default()
     }
 
     /// Get all sensor histories
     pub async fn get_all_history(&self) -> HashMap<String, Vec<SensorStateEntry>> {
-        self.history.read().await.clone()
+        self.history
+            .read()
+            .await
+            .iter()
+            .map(|(uuid, entries)| (uuid.clone(), entries.iter().cloned().collect()))
+            .collect()
     }
 }
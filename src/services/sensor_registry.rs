@@ -219,11 +219,13 @@ impl SensorTypeRegistry {
             return Ok(Some(sensor_type.clone()));
         }
 
-        // Apply detection rules
+        // Apply detection rules; lowercase the name and type once for all rules
+        let name_lower = device.name.to_lowercase();
+        let type_lower = device.device_type.to_lowercase();
         let mut best_match: Option<(SensorType, f32)> = None;
 
         for rule in &self.detection_rules {
-            let confidence = self.calculate_rule_confidence(rule, device);
+            let confidence = self.calculate_rule_confidence(rule, &name_lower, &type_lower);
             if confidence > 0.5 {
                 // Minimum confidence threshold
                 if let Some((_, best_confidence)) = &best_match {
@@ -592,10 +594,15 @@ impl SensorTypeRegistry {
     }
 
     /// Calculate confidence score for a detection rule
-    fn calculate_rule_confidence(&self, rule: &SensorDetectionRule, device: &LoxoneDevice) -> f32 {
+    ///
+    /// Takes the device name and type already lowercased.
+    fn calculate_rule_confidence(
+        &self,
+        rule: &SensorDetectionRule,
+        name_lower: &str,
+        type_lower: &str,
+    ) -> f32 {
         let mut confidence: f32 = 0.0;
-        let name_lower = device.name.to_lowercase();
-        let type_lower = device.device_type.to_lowercase();
 
         // Check name patterns
         for pattern in &rule.name_patterns {
@@ -614,7 +621,11 @@ impl SensorTypeRegistry {
         }
 
         // Additional boost for exact matches
-        if rule.name_patterns.contains(&name_lower) {
+        if rule
+            .name_patterns
+            .iter()
+            .any(|pattern| pattern == name_lower)
+        {
             confidence += 0.2;
         }
 
@@ -15,6 +15,9 @@ use tokio::sync::{RwLock, broadcast};
 use tokio::time::{Duration, interval};
 use tracing::{debug, info, warn};
 
+/// Number of devices reported in [`ChangeStatistics::most_active_devices`]
+const MOST_ACTIVE_DEVICES: usize = 10;
+
 /// Centralized state manager with change detection
 pub struct StateManager {
     /// Current device states
@@ -526,10 +529,11 @@ impl StateManager {
 
                 // Poll states for devices that haven't been updated recently
                 let states = device_states.read().await;
+                let now = Utc::now();
                 let stale_devices: Vec<String> = states
                     .iter()
                     .filter(|(_, state)| {
-                        let age = Utc::now() - state.last_updated;
+                        let age = now - state.last_updated;
                         age > chrono::Duration::seconds(300) // 5 minutes
                     })
                     .map(|(uuid, _)| uuid.clone())
@@ -667,15 +671,23 @@ impl StateHistory {
                 self.change_statistics.total_changes as f64 / total_devices;
         }
 
-        // Update most active devices
-        let mut device_activity: Vec<(String, u64)> = self
+        // Update most active devices: partition out the top entries before
+        // sorting so only those are ordered and cloned
+        let mut device_activity: Vec<(&String, u64)> = self
             .device_changes
             .iter()
-            .map(|(uuid, changes)| (uuid.clone(), changes.len() as u64))
+            .map(|(uuid, changes)| (uuid, changes.len() as u64))
             .collect();
 
+        if device_activity.len() > MOST_ACTIVE_DEVICES {
+            device_activity.select_nth_unstable_by(MOST_ACTIVE_DEVICES, |a, b| b.1.cmp(&a.1));
+            device_activity.truncate(MOST_ACTIVE_DEVICES);
+        }
         device_activity.sort_by(|a, b| b.1.cmp(&a.1));
-        self.change_statistics.most_active_devices = device_activity.into_iter().take(10).collect();
+        self.change_statistics.most_active_devices = device_activity
+            .into_iter()
+            .map(|(uuid, count)| (uuid.clone(), count))
+            .collect();
     }
 
     pub fn cleanup_old_entries(&mut self) {
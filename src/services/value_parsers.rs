@@ -5,9 +5,15 @@
 
 use crate::error::{LoxoneError, Result};
 use crate::services::sensor_registry::SensorType;
+use regex::Regex;
 use serde_json::Value;
 use std::collections::HashMap;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
+
+/// Temperature unit markers stripped before parsing (`°C`, `°F`, `°`, `C`)
+static TEMPERATURE_UNIT_REGEX: OnceLock<Regex> = OnceLock::new();
+/// Illuminance unit markers stripped before parsing (`Lx`, `lx`, `Lux`)
+static LUX_UNIT_REGEX: OnceLock<Regex> = OnceLock::new();
 
 /// Registry for value parsers
 pub struct ValueParserRegistry {
@@ -43,8 +49,9 @@ impl ValueParserRegistry {
     }
 
     pub fn get_parser(&self, sensor_type: &SensorType) -> Option<&dyn ValueParser> {
-        let key = self.sensor_type_to_key(sensor_type);
-        self.parsers.get(&key).map(|p| p.as_ref())
+        self.parsers
+            .get(Self::sensor_type_to_key(sensor_type))
+            .map(|p| p.as_ref())
     }
 
     fn register_default_parsers(&mut self) {
@@ -91,12 +98,37 @@ impl ValueParserRegistry {
             .insert("Rainfall".to_string(), Arc::new(RainfallParser));
     }
 
-    fn sensor_type_to_key(&self, sensor_type: &SensorType) -> String {
-        format!("{sensor_type:?}")
-            .split('{')
-            .next()
-            .unwrap_or("Unknown")
-            .to_string()
+    /// Registry key of a sensor type: its variant name without the fields
+    fn sensor_type_to_key(sensor_type: &SensorType) -> &'static str {
+        match sensor_type {
+            SensorType::DoorWindow => "DoorWindow",
+            SensorType::Motion => "Motion",
+            SensorType::Analog => "Analog",
+            SensorType::Light => "Light",
+            SensorType::Energy => "Energy",
+            SensorType::TemperatureSimple => "TemperatureSimple",
+            SensorType::HumiditySimple => "HumiditySimple",
+            SensorType::AirQualitySimple => "AirQualitySimple",
+            SensorType::Temperature { .. } => "Temperature",
+            SensorType::Humidity { .. } => "Humidity",
+            SensorType::AirPressure { .. } => "AirPressure",
+            SensorType::AirQuality { .. } => "AirQuality",
+            SensorType::Illuminance { .. } => "Illuminance",
+            SensorType::UVIndex => "UVIndex",
+            SensorType::MotionDetector => "MotionDetector",
+            SensorType::PresenceSensor => "PresenceSensor",
+            SensorType::DoorWindowContact => "DoorWindowContact",
+            SensorType::WindowPosition { .. } => "WindowPosition",
+            SensorType::BlindPosition { .. } => "BlindPosition",
+            SensorType::PowerMeter { .. } => "PowerMeter",
+            SensorType::EnergyConsumption { .. } => "EnergyConsumption",
+            SensorType::Current { .. } => "Current",
+            SensorType::Voltage { .. } => "Voltage",
+            SensorType::WindSpeed { .. } => "WindSpeed",
+            SensorType::Rainfall { .. } => "Rainfall",
+            SensorType::SoundLevel { .. } => "SoundLevel",
+            SensorType::Unknown { .. } => "Unknown",
+        }
     }
 }
 
@@ -672,11 +704,9 @@ impl ValueParser for RainfallParser {
 // Helper functions for value extraction
 
 fn extract_temperature(value_str: &str) -> Option<f64> {
-    value_str
-        .replace("°C", "")
-        .replace("°F", "")
-        .replace("°", "")
-        .replace("C", "")
+    TEMPERATURE_UNIT_REGEX
+        .get_or_init(|| Regex::new("°[CF]?|C").expect("Invalid temperature unit regex"))
+        .replace_all(value_str, "")
         .trim()
         .parse()
         .ok()
@@ -687,10 +717,9 @@ fn extract_percentage(value_str: &str) -> Option<f64> {
 }
 
 fn extract_lux(value_str: &str) -> Option<f64> {
-    value_str
-        .replace("Lx", "")
-        .replace("lx", "")
-        .replace("Lux", "")
+    LUX_UNIT_REGEX
+        .get_or_init(|| Regex::new("Lx|lx|Lux").expect("Invalid lux unit regex"))
+        .replace_all(value_str, "")
         .trim()
         .parse()
         .ok()
@@ -752,3 +781,36 @@ fn extract_percentage_or_number(raw_value: &Value) -> Option<f64> {
 
     None
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_extract_temperature_strips_units() {
+        assert_eq!(extract_temperature("21.5°C"), Some(21.5));
+        assert_eq!(extract_temperature("70 °F"), Some(70.0));
+        assert_eq!(extract_temperature("19°"), Some(19.0));
+        assert_eq!(extract_temperature("22.0"), Some(22.0));
+        assert_eq!(extract_temperature("12F"), None);
+    }
+
+    #[test]
+    fn test_get_parser_for_typed_sensors() {
+        let registry = ValueParserRegistry::new();
+        let temperature = SensorType::Temperature {
+            unit: crate::services::sensor_registry::TemperatureUnit::Celsius,
+            range: (-20.0, 40.0),
+        };
+        assert!(registry.get_parser(&temperature).is_some());
+        assert!(registry.get_parser(&SensorType::MotionDetector).is_some());
+        assert!(registry.get_parser(&SensorType::UVIndex).is_none());
+    }
+
+    #[test]
+    fn test_extract_lux_strips_units() {
+        assert_eq!(extract_lux("350 Lx"), Some(350.0));
+        assert_eq!(extract_lux("120lx"), Some(120.0));
+        assert_eq!(extract_lux("80 Lux"), Some(80.0));
+    }
+}
@@ -9,9 +9,13 @@ use crate::services::cache_manager::{CacheConfig, EnhancedCacheManager, Prefetch
 use crate::services::sensor_registry::{SensorType, SensorTypeRegistry};
 use crate::services::value_parsers::{ParsedValue, ValueParserRegistry};
 use chrono::{DateTime, Utc};
+use regex::Regex;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
+
+/// Unit markers stripped from raw values before numeric parsing
+static UNIT_MARKER_REGEX: OnceLock<Regex> = OnceLock::new();
 
 /// Unified value resolution service - single source of truth for all device values
 #[derive(Clone)]
@@ -660,15 +664,12 @@ impl ResolvedValue {
 
 /// Helper functions (consolidation of current logic)
 fn extract_numeric_value(value_str: &str) -> Option<f64> {
-    let cleaned = value_str
-        .replace(['°', '%', 'W', 'A', 'V'], "")
-        .replace("Lx", "")
-        .replace("hPa", "")
-        .replace("ppm", "")
+    UNIT_MARKER_REGEX
+        .get_or_init(|| Regex::new("[°%WAV]|Lx|hPa|ppm").expect("Invalid unit marker regex"))
+        .replace_all(value_str, "")
         .trim()
-        .to_string();
-
-    cleaned.parse::<f64>().ok()
+        .parse::<f64>()
+        .ok()
 }
 
 fn extract_unit(value_str: &str) -> Option<String> {
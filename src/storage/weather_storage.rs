@@ -5,6 +5,7 @@
 
 use super::turso_client::{TursoClient, TursoConfig, WeatherAggregation, WeatherDataPoint};
 use crate::client::LoxoneDevice;
+use crate::client::device_index::is_weather_name;
 use crate::error::Result;
 use chrono::{DateTime, Utc};
 use serde::{Deserialize, Serialize};
@@ -60,6 +61,9 @@ pub struct WeatherStorage {
     uuid_cache: Arc<RwLock<HashMap<u32, CachedMapping>>>,
     /// Device structure cache for UUID resolution
     devices_cache: Arc<RwLock<HashMap<String, LoxoneDevice>>>,
+    /// Weather device UUIDs keyed by the index embedded in their UUID,
+    /// rebuilt whenever the device structure is updated
+    weather_index: Arc<RwLock<HashMap<u32, String>>>,
 }
 
 impl WeatherStorage {
@@ -74,6 +78,7 @@ impl WeatherStorage {
             config,
             uuid_cache: Arc::new(RwLock::new(HashMap::new())),
             devices_cache: Arc::new(RwLock::new(HashMap::new())),
+            weather_index: Arc::new(RwLock::new(HashMap::new())),
         };
 
         // Start background cleanup if enabled
@@ -90,9 +95,24 @@ impl WeatherStorage {
         let mut cache = self.devices_cache.write().await;
         cache.clear();
         cache.extend(devices.iter().map(|(k, v)| (k.clone(), v.clone())));
+
+        // Index weather devices once so UUID resolution is a map lookup
+        let mut weather_index = self.weather_index.write().await;
+        weather_index.clear();
+        for (uuid, device) in devices {
+            if self.is_weather_device(device)
+                && let Some(device_index) = self.extract_device_index_from_uuid(uuid)
+            {
+                weather_index
+                    .entry(device_index)
+                    .or_insert_with(|| uuid.clone());
+            }
+        }
+
         info!(
-            "Updated device structure cache with {} devices",
-            cache.len()
+            "Updated device structure cache with {} devices ({} indexed weather devices)",
+            cache.len(),
+            weather_index.len()
         );
     }
 
@@ -168,28 +188,14 @@ impl WeatherStorage {
         Ok(device_uuid)
     }
 
-    /// Try to resolve UUID from device structure cache
+    /// Try to resolve UUID from the weather devices indexed with the structure cache
     async fn resolve_from_structure(&self, uuid_index: u32) -> Option<String> {
-        let devices = self.devices_cache.read().await;
-
-        // Look for weather devices and try to match by index patterns
-        for (uuid, device) in devices.iter() {
-            if self.is_weather_device(device) {
-                // Try various heuristics to match UUID index to device
-                // This is implementation-specific to Loxone's UUID index system
-                if let Some(device_index) = self.extract_device_index_from_uuid(uuid)
-                    && device_index == uuid_index
-                {
-                    debug!(
-                        "Resolved UUID {} from structure for index {}",
-                        uuid, uuid_index
-                    );
-                    return Some(uuid.clone());
-                }
-            }
-        }
-
-        None
+        let uuid = self.weather_index.read().await.get(&uuid_index).cloned()?;
+        debug!(
+            "Resolved UUID {} from structure for index {}",
+            uuid, uuid_index
+        );
+        Some(uuid)
     }
 
     /// Extract potential device index from UUID (Loxone-specific logic)
@@ -209,7 +215,6 @@ impl WeatherStorage {
     /// Check if device is a weather device
     fn is_weather_device(&self, device: &LoxoneDevice) -> bool {
         let weather_types = ["WeatherStation", "Sensor", "TempSensor", "HumiditySensor"];
-        let weather_keywords = ["weather", "temp", "humidity", "wind", "rain", "pressure"];
 
         // Check by type
         if weather_types
@@ -220,10 +225,7 @@ impl WeatherStorage {
         }
 
         // Check by name keywords
-        let device_name = device.name.to_lowercase();
-        weather_keywords
-            .iter()
-            .any(|&keyword| device_name.contains(keyword))
+        is_weather_name(&device.name)
     }
 
     /// Try to resolve UUID from database
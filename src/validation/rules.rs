@@ -8,6 +8,24 @@ use serde_json::Value;
 use std::collections::HashMap;
 use tracing::{debug, warn};
 
+/// Common attack patterns rejected by [`SecurityPolicyRule`], in lowercase
+const SUSPICIOUS_PATTERNS: &[&str] = &[
+    "eval(",
+    "exec(",
+    "system(",
+    "shell_exec(",
+    "passthru(",
+    "file_get_contents(",
+    "base64_decode(",
+    "unserialize(",
+    "../",
+    "..\\",
+    "/etc/passwd",
+    "/etc/shadow",
+    "cmd.exe",
+    "powershell",
+];
+
 /// Business rules validator
 pub struct RulesValidator {
     rules: Vec<Box<dyn ValidationRule>>,
@@ -562,8 +580,9 @@ impl ValidationRule for SecurityPolicyRule {
     ) -> Result<ValidationResult> {
         let mut errors = Vec::new();
 
-        // Check request size
-        let request_size = serde_json::to_string(data).unwrap_or_default().len();
+        // Check request size; the serialized form is reused for the pattern scan
+        let serialized = serde_json::to_string(data).unwrap_or_default();
+        let request_size = serialized.len();
         if request_size > context.config.max_request_size {
             errors.push(ValidationError {
                 field: "request_size".to_string(),
@@ -594,7 +613,7 @@ impl ValidationRule for SecurityPolicyRule {
         }
 
         // Check for suspicious patterns in request
-        if self.contains_suspicious_patterns(data) {
+        if self.contains_suspicious_patterns(&serialized) {
             errors.push(ValidationError {
                 field: "security_scan".to_string(),
                 message: "Request contains suspicious patterns".to_string(),
@@ -636,31 +655,15 @@ impl ValidationRule for SecurityPolicyRule {
 }
 
 impl SecurityPolicyRule {
-    /// Check for suspicious patterns in the data
-    fn contains_suspicious_patterns(&self, data: &Value) -> bool {
-        let data_str = serde_json::to_string(data).unwrap_or_default();
+    /// Check for suspicious patterns in the serialized data
+    fn contains_suspicious_patterns(&self, serialized: &str) -> bool {
+        // Lowercase the data once; the patterns already are
+        let data_str = serialized.to_lowercase();
 
         // Check for common attack patterns
-        let suspicious_patterns = vec![
-            "eval(",
-            "exec(",
-            "system(",
-            "shell_exec(",
-            "passthru(",
-            "file_get_contents(",
-            "base64_decode(",
-            "unserialize(",
-            "../",
-            "..\\",
-            "/etc/passwd",
-            "/etc/shadow",
-            "cmd.exe",
-            "powershell",
-        ];
-
-        suspicious_patterns
+        SUSPICIOUS_PATTERNS
             .iter()
-            .any(|pattern| data_str.to_lowercase().contains(&pattern.to_lowercase()))
+            .any(|pattern| data_str.contains(pattern))
     }
 }
 
@@ -791,6 +794,11 @@ mod tests {
             result.errors[0].code,
             ValidationErrorCode::SecurityViolation
         );
+
+        // Patterns match regardless of case
+        let data = json!({"params": {"command": "PowerShell -c whoami"}});
+        let result = rule.validate_request(&data, &context).await.unwrap();
+        assert!(!result.is_valid);
     }
 
     #[tokio::test]
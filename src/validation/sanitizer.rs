@@ -6,11 +6,42 @@ use super::{
     ValidationContext, ValidationResult, ValidationWarning, ValidationWarningCode, Validator, utils,
 };
 use crate::error::Result;
+use regex::Regex;
 use serde_json::{Map, Value};
+use std::borrow::Cow;
 #[cfg(test)]
 use std::sync::Arc;
+use std::sync::OnceLock;
 use tracing::debug;
 
+/// XSS and code-injection patterns removed from strings, with replacements
+const MALICIOUS_PATTERNS: &[(&str, &str)] = &[
+    (r"<script[^>]*>.*?</script>", ""),
+    (r"javascript:", ""),
+    (r#"on\w+\s*=\s*["'][^"']*["']"#, ""),
+    (r"eval\s*\(", "eval_removed("),
+    (r"exec\s*\(", "exec_removed("),
+    (r"\$\(", "dollar_removed("),
+];
+
+/// [`MALICIOUS_PATTERNS`] compiled once on first use
+static MALICIOUS_REGEXES: OnceLock<Vec<(Regex, &'static str)>> = OnceLock::new();
+
+/// Property names that could reach prototype or global objects
+const DANGEROUS_PROPERTY_NAMES: &[&str] = &[
+    "__proto__",
+    "constructor",
+    "prototype",
+    "eval",
+    "function",
+    "this",
+    "arguments",
+    "window",
+    "document",
+    "location",
+    "navigator",
+];
+
 /// Input sanitizer that cleans and normalizes data
 pub struct SanitizerValidator {
     config: SanitizerConfig,
@@ -267,21 +298,21 @@ impl SanitizerValidator {
 
     /// Remove malicious patterns from string
     fn remove_malicious_patterns(&self, value: &str) -> String {
-        let mut sanitized = value.to_string();
+        let regexes = MALICIOUS_REGEXES.get_or_init(|| {
+            MALICIOUS_PATTERNS
+                .iter()
+                .map(|(pattern, replacement)| {
+                    let regex = Regex::new(pattern).expect("Invalid malicious content regex");
+                    (regex, *replacement)
+                })
+                .collect()
+        });
 
-        // Remove common XSS patterns
-        let patterns = vec![
-            (r"<script[^>]*>.*?</script>", ""),
-            (r"javascript:", ""),
-            (r#"on\w+\s*=\s*["'][^"']*["']"#, ""),
-            (r"eval\s*\(", "eval_removed("),
-            (r"exec\s*\(", "exec_removed("),
-            (r"\$\(", "dollar_removed("),
-        ];
-
-        for (pattern, replacement) in patterns {
-            if let Ok(regex) = regex::Regex::new(pattern) {
-                sanitized = regex.replace_all(&sanitized, replacement).to_string();
+        // Remove common XSS patterns; strings without a match are not copied
+        let mut sanitized = value.to_string();
+        for (regex, replacement) in regexes {
+            if let Cow::Owned(replaced) = regex.replace_all(&sanitized, *replacement) {
+                sanitized = replaced;
             }
         }
 
@@ -290,21 +321,7 @@ impl SanitizerValidator {
 
     /// Check if property name is dangerous
     fn is_dangerous_property_name(&self, name: &str) -> bool {
-        let dangerous_names = [
-            "__proto__",
-            "constructor",
-            "prototype",
-            "eval",
-            "function",
-            "this",
-            "arguments",
-            "window",
-            "document",
-            "location",
-            "navigator",
-        ];
-
-        dangerous_names.contains(&name.to_lowercase().as_str())
+        DANGEROUS_PROPERTY_NAMES.contains(&name.to_lowercase().as_str())
     }
 }
 